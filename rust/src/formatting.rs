@@ -0,0 +1,470 @@
+use std::fmt;
+
+#[derive(Debug, Clone)]
+pub struct FormatError {
+    message: String,
+}
+
+impl fmt::Display for FormatError {
+    fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
+        write!(f, "{}", self.message)
+    }
+}
+
+#[derive(Debug, Clone, Copy, PartialEq)]
+enum Field {
+    Year,
+    ShortYear,
+    Quarter,
+    Month,
+    Day,
+    DayOfYear,
+    DayOfWeek,
+    IsoDayOfWeek,
+    Hour,
+    TwelveHour,
+    Minute,
+    Second,
+    Microsecond(u32),
+    Timestamp,
+    MillisecondTimestamp,
+    Offset,
+}
+
+#[derive(Debug, Clone, Copy, PartialEq)]
+enum Shape {
+    /// A run of `min` to `max` digits, optionally signed
+    /// and optionally starting with a padding space.
+    Digits {
+        min: usize,
+        max: usize,
+        signed: bool,
+        space_padded: bool,
+    },
+    /// A signed number with an optional fraction of up to 6 digits.
+    Decimal,
+    /// `Z`, `z` or `+HH:mm`, the minutes being optional for short offsets.
+    Offset { short: bool },
+}
+
+#[derive(Debug, Clone)]
+enum Step {
+    Literal(Vec<u8>),
+    Field(Field, Shape),
+}
+
+#[derive(Debug, Default, PartialEq)]
+pub struct ParsedFields {
+    pub year: Option<i64>,
+    pub month: Option<i64>,
+    pub day: Option<i64>,
+    pub hour: Option<i64>,
+    pub minute: Option<i64>,
+    pub second: Option<i64>,
+    pub microsecond: Option<i64>,
+    pub offset: Option<i32>,
+    pub quarter: Option<i64>,
+    pub day_of_week: Option<i64>,
+    pub day_of_year: Option<i64>,
+    pub timestamp: Option<f64>,
+}
+
+/// A pendulum format compiled into a matcher.
+///
+/// Only locale-independent tokens are supported.
+/// Compiling a format with other tokens, brackets or escapes fails,
+/// and callers are expected to fall back to the generic implementation.
+#[derive(Debug, Clone)]
+pub struct FormatMatcher {
+    steps: Vec<Step>,
+}
+
+impl FormatMatcher {
+    pub fn compile(format: &str) -> Result<FormatMatcher, FormatError> {
+        let mut steps: Vec<Step> = Vec::new();
+        let mut tokens: Vec<&str> = Vec::new();
+        let mut rest = format;
+
+        while let Some(ch) = rest.chars().next() {
+            if ch == '[' || ch == ']' || ch == '\\' {
+                return Err(FormatError {
+                    message: format!("Unsupported character in format: {ch}"),
+                });
+            }
+
+            if let Some(token) = match_token(rest) {
+                let (field, shape) = token_field(token).ok_or_else(|| FormatError {
+                    message: format!("Unsupported token: {token}"),
+                })?;
+
+                if tokens.contains(&token) {
+                    return Err(FormatError {
+                        message: format!("Repeated token: {token}"),
+                    });
+                }
+
+                steps.push(Step::Field(field, shape));
+                tokens.push(token);
+                rest = &rest[token.len()..];
+
+                continue;
+            }
+
+            let mut buffer = [0; 4];
+            let encoded = ch.encode_utf8(&mut buffer).as_bytes();
+
+            if let Some(Step::Literal(literal)) = steps.last_mut() {
+                literal.extend_from_slice(encoded);
+            } else {
+                steps.push(Step::Literal(encoded.to_vec()));
+            }
+
+            rest = &rest[ch.len_utf8()..];
+        }
+
+        if tokens.is_empty() {
+            return Err(FormatError {
+                message: "The given time string does not match the given format".to_string(),
+            });
+        }
+
+        Ok(FormatMatcher { steps })
+    }
+
+    /// Parses a string, returning `None` if it does not match the format
+    /// or if any of the parsed values is invalid.
+    pub fn parse(&self, input: &str) -> Option<ParsedFields> {
+        let bytes = input.as_bytes();
+        let mut spans: Vec<(usize, usize)> = Vec::with_capacity(self.steps.len());
+
+        if !self.match_from(bytes, 0, 0, &mut spans) {
+            return None;
+        }
+
+        let mut fields = ParsedFields::default();
+        let mut span_index = 0;
+
+        for step in &self.steps {
+            let Step::Field(field, _) = step else {
+                continue;
+            };
+
+            let (start, end) = spans[span_index];
+            span_index += 1;
+
+            let value = &input[start..end];
+
+            match field {
+                Field::Year => fields.year = Some(parse_integer(value)?),
+                Field::ShortYear => {
+                    let year = parse_integer(value)?;
+
+                    fields.year = Some(if year <= 68 { year + 2000 } else { year + 1900 });
+                }
+                Field::Quarter => fields.quarter = Some(parse_integer(value)?),
+                Field::Month => fields.month = Some(parse_integer(value)?),
+                Field::Day => fields.day = Some(parse_integer(value.trim_start())?),
+                Field::DayOfYear => fields.day_of_year = Some(parse_integer(value)?),
+                Field::DayOfWeek => fields.day_of_week = Some(parse_integer(value)?),
+                Field::IsoDayOfWeek => fields.day_of_week = Some(parse_integer(value)? - 1),
+                Field::Hour => fields.hour = Some(parse_integer(value)?),
+                Field::TwelveHour => {
+                    let hour = parse_integer(value)?;
+                    if hour > 12 {
+                        return None;
+                    }
+
+                    fields.hour = Some(hour);
+                }
+                Field::Minute => fields.minute = Some(parse_integer(value)?),
+                Field::Second => fields.second = Some(parse_integer(value)?),
+                Field::Microsecond(factor) => {
+                    fields.microsecond = Some(parse_integer(value)?.checked_mul(*factor as i64)?);
+                }
+                Field::Timestamp => fields.timestamp = Some(value.parse::<f64>().ok()?),
+                Field::MillisecondTimestamp => {
+                    fields.timestamp = Some(value.parse::<f64>().ok()? / 1e3);
+                }
+                Field::Offset => fields.offset = Some(parse_offset(value)?),
+            }
+        }
+
+        Some(fields)
+    }
+
+    /// Matches the steps starting at `step` against `input` at `position`,
+    /// backtracking over the possible lengths of each field
+    /// the same way a regular expression would.
+    fn match_from(
+        &self,
+        input: &[u8],
+        step: usize,
+        position: usize,
+        spans: &mut Vec<(usize, usize)>,
+    ) -> bool {
+        let Some(current) = self.steps.get(step) else {
+            // Like `$`, accept a single trailing newline
+            return position == input.len()
+                || (position + 1 == input.len() && input[position] == b'\n');
+        };
+
+        match current {
+            Step::Literal(literal) => {
+                input[position..].starts_with(literal)
+                    && self.match_from(input, step + 1, position + literal.len(), spans)
+            }
+            Step::Field(_, shape) => {
+                for end in candidates(*shape, input, position) {
+                    spans.push((position, end));
+
+                    if self.match_from(input, step + 1, end, spans) {
+                        return true;
+                    }
+
+                    spans.pop();
+                }
+
+                false
+            }
+        }
+    }
+}
+
+/// Returns the token at the start of `format`, if any.
+///
+/// This mirrors the alternation of `Formatter._TOKENS`:
+/// alternatives are tried in order and the first one matching wins.
+fn match_token(format: &str) -> Option<&str> {
+    let bytes = format.as_bytes();
+    let run = |ch: u8, min: usize, max: usize| {
+        let count = bytes.iter().take(max).take_while(|&&c| c == ch).count();
+
+        (count >= min).then_some(count)
+    };
+    let followed_by = |ch: u8, options: &[u8]| {
+        (bytes.first() == Some(&ch))
+            .then(|| 1 + usize::from(matches!(bytes.get(1), Some(c) if options.contains(c))))
+    };
+    let repeated_groups = |ch: u8| {
+        // `gg(ggg?)?` and `GG(GGG?)?`
+        run(ch, 2, 5).map(|count| if count == 3 { 2 } else { count })
+    };
+
+    let length = if format.starts_with("Mo") {
+        Some(2)
+    } else if let Some(count) = run(b'M', 1, 4) {
+        Some(count)
+    } else if format.starts_with("Do") {
+        Some(2)
+    } else if format.starts_with("DDDo") {
+        Some(4)
+    } else if let Some(count) = run(b'D', 1, 4) {
+        Some(count)
+    } else if let Some(count) = run(b'd', 2, 4) {
+        Some(count)
+    } else if let Some(count) = followed_by(b'd', b"o") {
+        Some(count)
+    } else if let Some(count) = followed_by(b'e', b"o") {
+        Some(count)
+    } else if let Some(count) = run(b'E', 1, 4) {
+        Some(count)
+    } else if let Some(count) = followed_by(b'w', b"o|w") {
+        Some(count)
+    } else if let Some(count) = followed_by(b'W', b"o|W") {
+        Some(count)
+    } else if let Some(count) = followed_by(b'Q', b"o") {
+        Some(count)
+    } else if format.starts_with("YYYY") {
+        Some(4)
+    } else if let Some(count) = run(b'Y', 1, 2) {
+        Some(count)
+    } else if let Some(count) = repeated_groups(b'g') {
+        Some(count)
+    } else if let Some(count) = repeated_groups(b'G') {
+        Some(count)
+    } else if matches!(bytes.first(), Some(b'a' | b'A' | b'x' | b'X')) {
+        Some(1)
+    } else if let Some(count) = [b'h', b'H', b'k', b'm', b's', b'z', b'Z']
+        .iter()
+        .find_map(|&ch| run(ch, 1, 2))
+    {
+        Some(count)
+    } else if let Some(count) = run(b'S', 1, 9) {
+        Some(count)
+    } else if format.starts_with("LTS") {
+        Some(3)
+    } else if format.starts_with("LT") {
+        Some(2)
+    } else {
+        run(b'L', 1, 4)
+    };
+
+    length.map(|length| &format[..length])
+}
+
+fn token_field(token: &str) -> Option<(Field, Shape)> {
+    let digits = |min: usize, max: usize| Shape::Digits {
+        min,
+        max,
+        signed: false,
+        space_padded: false,
+    };
+
+    let field = match token {
+        "YYYY" => (Field::Year, digits(1, 4)),
+        "YY" => (Field::ShortYear, digits(1, 2)),
+        "Q" => (Field::Quarter, digits(1, 1)),
+        "MM" | "M" => (Field::Month, digits(1, 2)),
+        "DD" => (
+            Field::Day,
+            Shape::Digits {
+                min: 1,
+                max: 2,
+                signed: false,
+                space_padded: true,
+            },
+        ),
+        "D" => (Field::Day, digits(1, 2)),
+        "DDDD" => (Field::DayOfYear, digits(3, 3)),
+        "DDD" => (Field::DayOfYear, digits(1, 3)),
+        "d" => (Field::DayOfWeek, digits(1, 1)),
+        "E" => (Field::IsoDayOfWeek, digits(1, 1)),
+        "HH" | "H" => (Field::Hour, digits(1, 2)),
+        "hh" | "h" => (Field::TwelveHour, digits(1, 2)),
+        "mm" | "m" => (Field::Minute, digits(1, 2)),
+        "ss" | "s" => (Field::Second, digits(1, 2)),
+        "S" => (Field::Microsecond(100_000), digits(1, 3)),
+        "SS" => (Field::Microsecond(10_000), digits(1, 3)),
+        "SSS" => (Field::Microsecond(1_000), digits(1, 3)),
+        "SSSS" => (Field::Microsecond(100), digits(1, usize::MAX)),
+        "SSSSS" => (Field::Microsecond(10), digits(1, usize::MAX)),
+        "SSSSSS" => (Field::Microsecond(1), digits(1, usize::MAX)),
+        "x" => (
+            Field::MillisecondTimestamp,
+            Shape::Digits {
+                min: 1,
+                max: usize::MAX,
+                signed: true,
+                space_padded: false,
+            },
+        ),
+        "X" => (Field::Timestamp, Shape::Decimal),
+        "ZZ" => (Field::Offset, Shape::Offset { short: true }),
+        "Z" => (Field::Offset, Shape::Offset { short: false }),
+        _ => return None,
+    };
+
+    Some(field)
+}
+
+fn count_digits(input: &[u8], position: usize, max: usize) -> usize {
+    input[position.min(input.len())..]
+        .iter()
+        .take(max)
+        .take_while(|c| c.is_ascii_digit())
+        .count()
+}
+
+/// Returns the possible end positions of a field starting at `position`,
+/// in the order a greedy regular expression would try them.
+fn candidates(shape: Shape, input: &[u8], position: usize) -> Vec<usize> {
+    let mut ends = Vec::new();
+
+    match shape {
+        Shape::Digits {
+            min,
+            max,
+            signed,
+            space_padded,
+        } => {
+            let mut start = position;
+            if signed && matches!(input.get(start), Some(b'+' | b'-')) {
+                start += 1;
+            }
+
+            if space_padded && input.get(start) == Some(&b' ') {
+                // `[0-9 ]\d?`
+                let count = count_digits(input, start + 1, 1);
+                ends.extend((0..=count).rev().map(|n| start + 1 + n));
+
+                return ends;
+            }
+
+            let count = count_digits(input, start, max);
+            if count >= min {
+                ends.extend((min..=count).rev().map(|n| start + n));
+            }
+        }
+        Shape::Decimal => {
+            let mut start = position;
+            if matches!(input.get(start), Some(b'+' | b'-')) {
+                start += 1;
+            }
+
+            let count = count_digits(input, start, usize::MAX);
+            for n in (1..=count).rev() {
+                let integer_end = start + n;
+
+                if n == count && input.get(integer_end) == Some(&b'.') {
+                    let fraction = count_digits(input, integer_end + 1, 6);
+                    ends.extend((1..=fraction).rev().map(|f| integer_end + 1 + f));
+                }
+
+                ends.push(integer_end);
+            }
+        }
+        Shape::Offset { short } => match input.get(position) {
+            Some(b'Z' | b'z') => ends.push(position + 1),
+            Some(b'+' | b'-') => {
+                if count_digits(input, position + 1, 2) < 2 {
+                    return ends;
+                }
+
+                let hours_end = position + 3;
+                if input.get(hours_end) == Some(&b':') && count_digits(input, hours_end + 1, 2) == 2
+                {
+                    ends.push(hours_end + 3);
+                }
+
+                if count_digits(input, hours_end, 2) == 2 {
+                    ends.push(hours_end + 2);
+                }
+
+                if short {
+                    ends.push(hours_end);
+                }
+            }
+            _ => {}
+        },
+    }
+
+    ends
+}
+
+fn parse_integer(value: &str) -> Option<i64> {
+    value.parse::<i64>().ok()
+}
+
+fn parse_offset(value: &str) -> Option<i32> {
+    let bytes = value.as_bytes();
+    if bytes.len() < 3 {
+        // `Z` and `z` are matched but are not valid offsets
+        return None;
+    }
+
+    let sign = if bytes[0] == b'-' { -1 } else { 1 };
+    let digits: Vec<i32> = bytes[1..]
+        .iter()
+        .filter(|c| c.is_ascii_digit())
+        .map(|c| i32::from(c - b'0'))
+        .collect();
+
+    let hours = digits[0] * 10 + digits[1];
+    let minutes = if digits.len() == 4 {
+        digits[2] * 10 + digits[3]
+    } else {
+        0
+    };
+
+    Some(sign * (hours * 60 + minutes) * 60)
+}
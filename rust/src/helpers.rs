@@ -1,9 +1,34 @@
+use std::fmt;
+
 use crate::constants::{
-    DAYS_PER_L_YEAR, DAYS_PER_N_YEAR, DAY_OF_WEEK_TABLE, EPOCH_YEAR, MONTHS_OFFSETS,
-    SECS_PER_100_YEARS, SECS_PER_400_YEARS, SECS_PER_4_YEARS, SECS_PER_DAY, SECS_PER_HOUR,
-    SECS_PER_MIN, SECS_PER_YEAR, TM_DECEMBER, TM_JANUARY,
+    DAYS_PER_L_YEAR, DAYS_PER_MONTHS, DAYS_PER_N_YEAR, DAY_OF_WEEK_TABLE, EPOCH_YEAR,
+    MONTHS_OFFSETS, SECS_PER_100_YEARS, SECS_PER_400_YEARS, SECS_PER_4_YEARS, SECS_PER_DAY,
+    SECS_PER_HOUR, SECS_PER_MIN, SECS_PER_YEAR, TM_DECEMBER, TM_JANUARY,
 };
 
+pub const US_PER_DAY: i128 = SECS_PER_DAY as i128 * 1_000_000;
+
+// The day number of 0001-01-01 is 306
+const DAY_NUMBER_OFFSET: i32 = 305;
+const MAX_ORDINAL: i128 = 3_652_059;
+
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub enum DurationError {
+    // The year reached by adding the years and months is not supported
+    YearOutOfRange(i128),
+    // The resulting date is not supported
+    DateOutOfRange,
+}
+
+impl fmt::Display for DurationError {
+    fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
+        match self {
+            DurationError::YearOutOfRange(year) => write!(f, "year {year} is out of range"),
+            DurationError::DateOutOfRange => write!(f, "date value out of range"),
+        }
+    }
+}
+
 fn p(year: i32) -> i32 {
     year + year / 4 - year / 100 + year / 400
 }
@@ -43,6 +68,111 @@ pub fn day_number(year: i32, month: u8, day: u8) -> i32 {
     365 * y + y / 4 - y / 100 + y / 400 + (m * 306 + 5) / 10 + (i32::from(day) - 1)
 }
 
+pub fn date_from_day_number(number: i32) -> (i32, u8, u8) {
+    let mut y = ((10_000 * i64::from(number) + 14_780) / 3_652_425) as i32;
+    let mut ddd = number - (365 * y + y / 4 - y / 100 + y / 400);
+    if ddd < 0 {
+        y -= 1;
+        ddd = number - (365 * y + y / 4 - y / 100 + y / 400);
+    }
+
+    let mi = (100 * ddd + 52) / 3060;
+    let month = (mi + 2) % 12 + 1;
+    let year = y + (mi + 2) / 12;
+    let day = ddd - (mi * 306 + 5) / 10 + 1;
+
+    (year, month as u8, day as u8)
+}
+
+/// Adds years and months to a date, clamping the day to the end of the month.
+pub fn add_months(
+    (year, month, day): (i32, u8, u8),
+    years: i64,
+    months: i64,
+) -> Result<(i32, u8, u8), DurationError> {
+    let total_months =
+        i128::from(year) * 12 + i128::from(month - 1) + i128::from(years) * 12 + i128::from(months);
+    let year = total_months.div_euclid(12);
+    if !(1..=9999).contains(&year) {
+        return Err(DurationError::YearOutOfRange(year));
+    }
+
+    let year = year as i32;
+    let month = (total_months.rem_euclid(12) + 1) as u8;
+    let days_in_month = DAYS_PER_MONTHS[usize::from(is_leap(year))][usize::from(month)] as u8;
+
+    Ok((year, month, day.min(days_in_month)))
+}
+
+/// Adds years and months to a date, clamping the day to the end of the month,
+/// then adds a number of microseconds to it and to the given time of the day,
+/// in microseconds.
+///
+/// Returns the resulting date and time of the day.
+pub fn add_duration(
+    date: (i32, u8, u8),
+    time: i64,
+    years: i64,
+    months: i64,
+    microseconds: i128,
+) -> Result<(i32, u8, u8, i64), DurationError> {
+    let (year, month, day) = add_months(date, years, months)?;
+
+    let ordinal = i128::from(day_number(year, month, day) - DAY_NUMBER_OFFSET);
+    let total = ordinal * US_PER_DAY + i128::from(time) + microseconds;
+    let ordinal = total.div_euclid(US_PER_DAY);
+    if !(1..=MAX_ORDINAL).contains(&ordinal) {
+        return Err(DurationError::DateOutOfRange);
+    }
+
+    let (year, month, day) = date_from_day_number(ordinal as i32 + DAY_NUMBER_OFFSET);
+
+    Ok((year, month, day, total.rem_euclid(US_PER_DAY) as i64))
+}
+
+/// Sums durations expressed in different units into microseconds,
+/// rounding the fractional parts like Python's timedelta does.
+#[derive(Debug, Default)]
+pub struct MicrosecondsSum {
+    total: i128,
+    leftover: f64,
+}
+
+impl MicrosecondsSum {
+    pub fn add_int(&mut self, value: i64, factor: i64) {
+        self.total += i128::from(value) * i128::from(factor);
+    }
+
+    /// The value must be finite and small enough
+    /// for its product with the factor to fit in an i128.
+    pub fn add_float(&mut self, value: f64, factor: i64) {
+        let whole = value.trunc();
+        self.total += whole as i128 * i128::from(factor);
+
+        let fraction = (value - whole) * factor as f64;
+        if fraction != 0.0 {
+            let whole = fraction.trunc();
+            self.total += whole as i128;
+            self.leftover += fraction - whole;
+        }
+    }
+
+    pub fn finish(self) -> i128 {
+        if self.leftover == 0.0 {
+            return self.total;
+        }
+
+        let mut whole = self.leftover.round();
+        if (whole - self.leftover).abs() == 0.5 {
+            // Halfway between two integers: round half to even
+            let odd = self.total.rem_euclid(2) as f64;
+            whole = 2.0 * ((self.leftover + odd) * 0.5).round() - odd;
+        }
+
+        self.total + whole as i128
+    }
+}
+
 pub fn local_time(
     unix_time: f64,
     utc_offset: isize,
@@ -5,8 +5,10 @@ extern crate core;
 static GLOBAL: mimalloc::MiMalloc = mimalloc::MiMalloc;
 
 mod constants;
+mod formatting;
 mod helpers;
 mod parsing;
 mod python;
+mod tzif;
 
 pub use python::_pendulum;
@@ -173,6 +173,12 @@ impl<'a> Parser<'a> {
         self.idx >= self.src.len()
     }
 
+    /// Returns whether the current value is complete, either because
+    /// the input is exhausted or because an interval separator has been reached.
+    fn value_end(&self) -> bool {
+        self.end() || self.current == '/'
+    }
+
     fn parse_integer(&mut self, length: usize, field_name: &str) -> Result<u32, ParseError> {
         let mut value: u32 = 0;
 
@@ -281,7 +287,7 @@ impl<'a> Parser<'a> {
                 let iso_week = self.parse_integer(2, "iso week")?;
                 let mut iso_day: u32 = 1;
 
-                if !self.end() && self.current != ' ' && self.current != 'T' {
+                if !self.value_end() && self.current != ' ' && self.current != 'T' {
                     // Optional day
                     if self.current != '-' {
                         return Err(self.parse_error(format!(
@@ -307,7 +313,7 @@ impl<'a> Parser<'a> {
                 */
                 datetime.month = self.parse_integer(2, "month")?;
 
-                if !self.end() && self.current != ' ' && self.current != 'T' {
+                if !self.value_end() && self.current != ' ' && self.current != 'T' {
                     if self.current == '-' {
                         // Optional day
                         self.inc();
@@ -335,7 +341,7 @@ impl<'a> Parser<'a> {
             let iso_week = self.parse_integer(2, "iso week")?;
             let mut iso_day: u32 = 1;
 
-            if !self.end() && self.current != ' ' && self.current != 'T' {
+            if !self.value_end() && self.current != ' ' && self.current != 'T' {
                 iso_day = self.parse_integer(1, "iso day")?;
             }
 
@@ -355,7 +361,7 @@ impl<'a> Parser<'a> {
             datetime.month = self.parse_integer(2, "month")?;
             let mut ordinal_day = self.parse_integer(1, "ordinal day")? as i32;
 
-            if self.end() || self.current == ' ' || self.current == 'T' {
+            if self.value_end() || self.current == ' ' || self.current == 'T' {
                 // Ordinal day
                 ordinal_day += datetime.month as i32 * 10;
 
@@ -370,7 +376,7 @@ impl<'a> Parser<'a> {
             }
         }
 
-        if !self.end() {
+        if !self.end() && self.current != '/' {
             self.parse_time(&mut datetime, false)?;
         }
 
@@ -435,7 +441,7 @@ impl<'a> Parser<'a> {
             datetime.hour = self.parse_integer(2, "hour")?;
         }
 
-        if !self.end() && self.current != 'Z' && self.current != '+' && self.current != '-' {
+        if !self.value_end() && self.current != 'Z' && self.current != '+' && self.current != '-' {
             // Optional minute and second
             if self.current == ':' {
                 // Minute and second in extended format (mm:ss)
@@ -444,7 +450,10 @@ impl<'a> Parser<'a> {
                 // Minute
                 datetime.minute = self.parse_integer(2, "minute")?;
 
-                if !self.end() && self.current != 'Z' && self.current != '+' && self.current != '-'
+                if !self.value_end()
+                    && self.current != 'Z'
+                    && self.current != '+'
+                    && self.current != '-'
                 {
                     // Optional second
                     if self.current != ':' {
@@ -502,7 +511,10 @@ impl<'a> Parser<'a> {
                 // Minute
                 datetime.minute = self.parse_integer(2, "minute")?;
 
-                if !self.end() && self.current != 'Z' && self.current != '+' && self.current != '-'
+                if !self.value_end()
+                    && self.current != 'Z'
+                    && self.current != '+'
+                    && self.current != '-'
                 {
                     // Optional second
 
@@ -574,7 +586,7 @@ impl<'a> Parser<'a> {
                 // Optional separator
                 self.inc();
             }
-            let mut tzminute = if self.end() {
+            let mut tzminute = if self.value_end() {
                 0
             } else {
                 // Optional minute
@@ -786,13 +798,19 @@ impl<'a> Parser<'a> {
             }
             self.inc();
 
-            if self.end() {
+            if self.end() || (self.current == '/' && parsed.datetime.is_none()) {
                 break;
             }
         }
 
         parsed.duration = Some(duration);
 
+        if !self.end() {
+            // Interval given as duration/end
+            self.inc();
+            self.parse_datetime(parsed)?;
+        }
+
         Ok(())
     }
 
@@ -1,14 +1,18 @@
 use std::cmp::Ordering;
 
 use pyo3::{
+    exceptions::{PyOverflowError, PyRuntimeError, PyValueError},
     prelude::*,
-    types::{PyDate, PyDateAccess, PyDateTime, PyDelta, PyDeltaAccess, PyString, PyTimeAccess},
+    types::{
+        PyDate, PyDateAccess, PyDateTime, PyDelta, PyDeltaAccess, PyDict, PyString, PyTimeAccess,
+        PyTzInfoAccess,
+    },
     PyTypeInfo,
 };
 
 use crate::{
     constants::{DAYS_PER_MONTHS, SECS_PER_DAY, SECS_PER_HOUR, SECS_PER_MIN},
-    helpers,
+    helpers::{self, DurationError, MicrosecondsSum, US_PER_DAY},
 };
 
 use crate::python::types::PreciseDiff;
@@ -116,6 +120,7 @@ pub fn get_offset(dt: &Bound<PyAny>) -> PyResult<i32> {
     if tzinfo.is_none() {
         return Ok(0);
     }
+
     let binding = tzinfo.call_method1("utcoffset", (dt,))?;
     let offset: &Bound<PyDelta> = binding.downcast()?;
 
@@ -151,6 +156,139 @@ pub fn local_time(
     Ok(helpers::local_time(unix_time, utc_offset, microsecond))
 }
 
+#[derive(FromPyObject)]
+pub enum Number {
+    Int(i64),
+    Float(f64),
+}
+
+impl Number {
+    fn is_zero(&self) -> bool {
+        match self {
+            Number::Int(value) => *value == 0,
+            Number::Float(value) => *value == 0.0,
+        }
+    }
+}
+
+fn duration_error(error: DurationError) -> PyErr {
+    match error {
+        DurationError::YearOutOfRange(_) => PyValueError::new_err(error.to_string()),
+        DurationError::DateOutOfRange => PyOverflowError::new_err(error.to_string()),
+    }
+}
+
+#[pyfunction]
+#[pyo3(signature = (
+    dt,
+    years=0,
+    months=0,
+    weeks=Number::Int(0),
+    days=Number::Int(0),
+    hours=Number::Int(0),
+    minutes=Number::Int(0),
+    seconds=Number::Int(0),
+    microseconds=Number::Int(0),
+))]
+#[allow(clippy::too_many_arguments)]
+pub fn add_duration<'py>(
+    py: Python<'py>,
+    dt: &Bound<'py, PyAny>,
+    years: i64,
+    months: i64,
+    weeks: Number,
+    days: Number,
+    hours: Number,
+    minutes: Number,
+    seconds: Number,
+    microseconds: Number,
+) -> PyResult<Bound<'py, PyAny>> {
+    let date: &Bound<PyDate> = dt.downcast()?;
+    let datetime = dt.downcast::<PyDateTime>().ok();
+
+    if datetime.is_none()
+        && !(hours.is_zero() && minutes.is_zero() && seconds.is_zero() && microseconds.is_zero())
+    {
+        return Err(PyRuntimeError::new_err(
+            "Time elements cannot be added to a date instance.",
+        ));
+    }
+
+    // Same summation order as timedelta, for the rounding of fractions
+    let mut sum = MicrosecondsSum::default();
+    for (value, factor) in [
+        (microseconds, 1),
+        (seconds, 1_000_000),
+        (minutes, 60_000_000),
+        (hours, 3_600_000_000),
+        (days, US_PER_DAY as i64),
+        (weeks, 7 * US_PER_DAY as i64),
+    ] {
+        match value {
+            Number::Int(value) => sum.add_int(value, factor),
+            Number::Float(value) if value.is_nan() => {
+                return Err(PyValueError::new_err("cannot convert float NaN to integer"))
+            }
+            Number::Float(value) if value.abs() < 1e24 => sum.add_float(value, factor),
+            Number::Float(_) => return Err(duration_error(DurationError::DateOutOfRange)),
+        }
+    }
+    let delta = sum.finish();
+
+    let ymd = (date.get_year(), date.get_month(), date.get_day());
+
+    if !PyDateTime::is_exact_type_of_bound(dt) && !PyDate::is_exact_type_of_bound(dt) {
+        // Subclasses, like pendulum's, get the same treatment as in Python:
+        // the date is replaced before the rest of the duration is added.
+        let (year, month, day) = helpers::add_months(ymd, years, months).map_err(duration_error)?;
+        let kwargs = PyDict::new_bound(py);
+        kwargs.set_item("year", year)?;
+        kwargs.set_item("month", month)?;
+        kwargs.set_item("day", day)?;
+
+        let delta_days = i32::try_from(delta.div_euclid(US_PER_DAY))
+            .map_err(|_| duration_error(DurationError::DateOutOfRange))?;
+        let delta_us = delta.rem_euclid(US_PER_DAY) as i64;
+        let delta = PyDelta::new_bound(
+            py,
+            delta_days,
+            (delta_us / 1_000_000) as i32,
+            (delta_us % 1_000_000) as i32,
+            false,
+        )?;
+
+        return dt.call_method("replace", (), Some(&kwargs))?.add(delta);
+    }
+
+    let time = datetime.map_or(0, |dt| {
+        ((i64::from(dt.get_hour()) * 60 + i64::from(dt.get_minute())) * 60
+            + i64::from(dt.get_second()))
+            * 1_000_000
+            + i64::from(dt.get_microsecond())
+    });
+    let (year, month, day, time) =
+        helpers::add_duration(ymd, time, years, months, delta).map_err(duration_error)?;
+
+    let Some(datetime) = datetime else {
+        return Ok(PyDate::new_bound(py, year, month, day)?.into_any());
+    };
+
+    let seconds = time / 1_000_000;
+
+    Ok(PyDateTime::new_bound(
+        py,
+        year,
+        month,
+        day,
+        (seconds / 3600) as u8,
+        (seconds % 3600 / 60) as u8,
+        (seconds % 60) as u8,
+        (time % 1_000_000) as u32,
+        datetime.get_tzinfo_bound().as_ref(),
+    )?
+    .into_any())
+}
+
 #[pyfunction]
 pub fn precise_diff<'py>(
     dt1: &Bound<'py, PyAny>,
@@ -4,21 +4,34 @@ mod helpers;
 mod parsing;
 mod types;
 
-use helpers::{days_in_year, is_leap, is_long_year, local_time, precise_diff, week_day};
-use parsing::parse_iso8601;
-use types::{Duration, PreciseDiff};
+use helpers::{
+    add_duration, days_in_year, is_leap, is_long_year, local_time, precise_diff, week_day,
+};
+use parsing::{
+    parse_iso8601, parse_iso8601_datetime, parse_iso8601_interval, parse_iso8601_many,
+    try_parse_iso8601,
+};
+use types::{Duration, FixedTimezone, FormatMatcher, PreciseDiff, TzifTimezone};
 
 #[pymodule]
 pub fn _pendulum(_py: Python<'_>, m: &Bound<PyModule>) -> PyResult<()> {
+    m.add_function(wrap_pyfunction!(add_duration, m)?)?;
     m.add_function(wrap_pyfunction!(days_in_year, m)?)?;
     m.add_function(wrap_pyfunction!(is_leap, m)?)?;
     m.add_function(wrap_pyfunction!(is_long_year, m)?)?;
     m.add_function(wrap_pyfunction!(local_time, m)?)?;
     m.add_function(wrap_pyfunction!(week_day, m)?)?;
     m.add_function(wrap_pyfunction!(parse_iso8601, m)?)?;
+    m.add_function(wrap_pyfunction!(parse_iso8601_datetime, m)?)?;
+    m.add_function(wrap_pyfunction!(parse_iso8601_interval, m)?)?;
+    m.add_function(wrap_pyfunction!(parse_iso8601_many, m)?)?;
     m.add_function(wrap_pyfunction!(precise_diff, m)?)?;
+    m.add_function(wrap_pyfunction!(try_parse_iso8601, m)?)?;
     m.add_class::<Duration>()?;
+    m.add_class::<FixedTimezone>()?;
+    m.add_class::<FormatMatcher>()?;
     m.add_class::<PreciseDiff>()?;
+    m.add_class::<TzifTimezone>()?;
 
     #[cfg(not(feature = "mimalloc"))]
     m.setattr("__pendulum_default_allocator__", true)?; // uses setattr so this is not in __all__
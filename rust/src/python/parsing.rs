@@ -1,113 +1,218 @@
 use pyo3::exceptions;
 use pyo3::prelude::*;
+use pyo3::sync::GILOnceCell;
 use pyo3::types::PyDate;
 use pyo3::types::PyDateTime;
+use pyo3::types::PyDict;
+use pyo3::types::PyList;
 use pyo3::types::PyTime;
+use pyo3::types::PyTzInfo;
 
-use crate::parsing::Parser;
+use crate::parsing::{ParseError, Parsed, ParsedDateTime, ParsedDuration, Parser};
 use crate::python::types::{Duration, FixedTimezone};
 
 #[pyfunction]
-pub fn parse_iso8601(py: Python, input: &str) -> PyResult<PyObject> {
-    let parsed = Parser::new(input).parse();
+#[pyo3(signature = (input, utc=false))]
+pub fn parse_iso8601(py: Python, input: &str, utc: bool) -> PyResult<PyObject> {
+    to_python(py, Parser::new(input).parse(), utc)
+}
+
+/// Same as `parse_iso8601` but returns `None` for invalid strings
+/// instead of raising.
+#[pyfunction]
+#[pyo3(signature = (input, utc=false))]
+pub fn try_parse_iso8601(py: Python, input: &str, utc: bool) -> Option<PyObject> {
+    match Parser::new(input).parse() {
+        Ok(parsed) => to_python(py, Ok(parsed), utc).ok(),
+        Err(_) => None,
+    }
+}
+
+/// Parses an ISO 8601 interval in a single pass.
+///
+/// Returns a `(start, end, duration)` tuple where either `end` or `duration`
+/// (`start/end` and `start/duration` intervals) or `start` (`duration/end` intervals)
+/// is `None`.
+#[pyfunction]
+#[pyo3(signature = (input, utc=false))]
+pub fn parse_iso8601_interval(
+    py: Python,
+    input: &str,
+    utc: bool,
+) -> PyResult<(PyObject, PyObject, PyObject)> {
+    let parsed = Parser::new(input)
+        .parse()
+        .map_err(|error| exceptions::PyValueError::new_err(error.to_string()))?;
+
+    match (parsed.datetime, parsed.duration, parsed.second_datetime) {
+        (Some(start), None, Some(end)) => Ok((
+            datetime_to_python(py, start, utc)?,
+            datetime_to_python(py, end, utc)?,
+            py.None(),
+        )),
+        (Some(start), Some(duration), None) => Ok((
+            datetime_to_python(py, start, utc)?,
+            py.None(),
+            duration_to_python(py, duration)?,
+        )),
+        (None, Some(duration), Some(end)) => Ok((
+            py.None(),
+            datetime_to_python(py, end, utc)?,
+            duration_to_python(py, duration)?,
+        )),
+        (_, _, _) => Err(exceptions::PyValueError::new_err(
+            "Invalid interval".to_string(),
+        )),
+    }
+}
+
+#[pyfunction]
+#[pyo3(signature = (texts, errors=false, utc=false))]
+pub fn parse_iso8601_many(
+    py: Python,
+    texts: &Bound<PyAny>,
+    errors: bool,
+    utc: bool,
+) -> PyResult<PyObject> {
+    let inputs = texts
+        .iter()?
+        .map(|text| text.and_then(|text| text.extract::<String>()))
+        .collect::<PyResult<Vec<String>>>()?;
+
+    // The parser only works on owned Rust data
+    // so the whole batch can be parsed without holding the GIL.
+    let results = py.allow_threads(|| {
+        inputs
+            .iter()
+            .map(|input| Parser::new(input).parse())
+            .collect::<Vec<_>>()
+    });
+
+    let values = PyList::empty_bound(py);
+    let failures = PyList::empty_bound(py);
+
+    for result in results {
+        match to_python(py, result, utc) {
+            Ok(value) => {
+                values.append(value)?;
+
+                if errors {
+                    failures.append(py.None())?;
+                }
+            }
+            Err(error) => {
+                if !errors {
+                    return Err(error);
+                }
+
+                values.append(py.None())?;
+                failures.append(error.into_value(py))?;
+            }
+        }
+    }
+
+    if errors {
+        return Ok((values, failures).into_py(py));
+    }
+
+    Ok(values.into_py(py))
+}
+
+static DATETIME: GILOnceCell<PyObject> = GILOnceCell::new();
+static FIXED_TIMEZONE: GILOnceCell<PyObject> = GILOnceCell::new();
+static UTC: GILOnceCell<PyObject> = GILOnceCell::new();
+
+fn import_cached<'py>(
+    py: Python<'py>,
+    cell: &'static GILOnceCell<PyObject>,
+    module: &str,
+    name: &str,
+) -> PyResult<&'py Bound<'py, PyAny>> {
+    Ok(cell
+        .get_or_try_init(py, || {
+            Ok::<_, PyErr>(py.import_bound(module)?.getattr(name)?.unbind())
+        })?
+        .bind(py))
+}
+
+/// Parses an ISO 8601 datetime string straight into a `pendulum.DateTime`.
+///
+/// Strings without an offset are attached to `tz`.
+/// `None` is returned for anything which is not a complete datetime
+/// so that the caller can fall back to the regular parsing path.
+#[pyfunction]
+pub fn parse_iso8601_datetime(
+    py: Python,
+    input: &str,
+    tz: &Bound<PyAny>,
+) -> PyResult<Option<PyObject>> {
+    let Ok(parsed) = Parser::new(input).parse() else {
+        return Ok(None);
+    };
 
+    let (Some(datetime), None, None) = (parsed.datetime, parsed.duration, parsed.second_datetime)
+    else {
+        return Ok(None);
+    };
+
+    if !(datetime.has_date && datetime.has_time) {
+        return Ok(None);
+    }
+
+    let utc = import_cached(py, &UTC, "pendulum.tz.timezone", "UTC")?;
+    let tzinfo = match datetime.offset {
+        Some(0) if datetime.tzname.as_deref() == Some("UTC") => utc.clone(),
+        Some(offset) => {
+            import_cached(py, &FIXED_TIMEZONE, "pendulum.tz", "fixed_timezone")?.call1((offset,))?
+        }
+        None => tz.clone(),
+    };
+
+    let kwargs = PyDict::new_bound(py);
+    kwargs.set_item("fold", u8::from(tzinfo.is(utc)))?;
+    kwargs.set_item("tzinfo", tzinfo)?;
+
+    let dt = import_cached(py, &DATETIME, "pendulum.datetime", "DateTime")?.call(
+        (
+            datetime.year,
+            datetime.month,
+            datetime.day,
+            datetime.hour,
+            datetime.minute,
+            datetime.second,
+            datetime.microsecond,
+        ),
+        Some(&kwargs),
+    );
+
+    // Out of range values (like 24:00:00) are left to the regular path
+    // which knows how to report them.
+    Ok(dt.ok().map(Bound::unbind))
+}
+
+/// Returns the shared timezone for an offset found in a parsed string.
+///
+/// If `utc` is set, zero offsets are mapped to `pendulum.UTC`.
+fn offset_timezone<'py>(
+    py: Python<'py>,
+    offset: i32,
+    name: Option<String>,
+    utc: bool,
+) -> PyResult<Bound<'py, PyTzInfo>> {
+    if utc && offset == 0 {
+        let utc = import_cached(py, &UTC, "pendulum.tz.timezone", "UTC")?;
+
+        return Ok(utc.downcast::<PyTzInfo>()?.clone());
+    }
+
+    FixedTimezone::interned(py, offset, name)
+}
+
+fn to_python(py: Python, parsed: Result<Parsed, ParseError>, utc: bool) -> PyResult<PyObject> {
     match parsed {
         Ok(parsed) => match (parsed.datetime, parsed.duration, parsed.second_datetime) {
-            (Some(datetime), None, None) => match (datetime.has_date, datetime.has_time) {
-                (true, true) => match datetime.offset {
-                    Some(offset) => {
-                        let dt = PyDateTime::new_bound(
-                            py,
-                            datetime.year as i32,
-                            datetime.month as u8,
-                            datetime.day as u8,
-                            datetime.hour as u8,
-                            datetime.minute as u8,
-                            datetime.second as u8,
-                            datetime.microsecond,
-                            Some(
-                                Py::new(py, FixedTimezone::new(offset, datetime.tzname))?
-                                    .to_object(py)
-                                    .downcast_bound(py)?,
-                            ),
-                        )?;
-
-                        Ok(dt.to_object(py))
-                    }
-                    None => {
-                        let dt = PyDateTime::new_bound(
-                            py,
-                            datetime.year as i32,
-                            datetime.month as u8,
-                            datetime.day as u8,
-                            datetime.hour as u8,
-                            datetime.minute as u8,
-                            datetime.second as u8,
-                            datetime.microsecond,
-                            None,
-                        )?;
-
-                        Ok(dt.to_object(py))
-                    }
-                },
-                (true, false) => {
-                    let dt = PyDate::new_bound(
-                        py,
-                        datetime.year as i32,
-                        datetime.month as u8,
-                        datetime.day as u8,
-                    )?;
-
-                    Ok(dt.to_object(py))
-                }
-                (false, true) => match datetime.offset {
-                    Some(offset) => {
-                        let dt = PyTime::new_bound(
-                            py,
-                            datetime.hour as u8,
-                            datetime.minute as u8,
-                            datetime.second as u8,
-                            datetime.microsecond,
-                            Some(
-                                Py::new(py, FixedTimezone::new(offset, datetime.tzname))?
-                                    .to_object(py)
-                                    .downcast_bound(py)?,
-                            ),
-                        )?;
-
-                        Ok(dt.to_object(py))
-                    }
-                    None => {
-                        let dt = PyTime::new_bound(
-                            py,
-                            datetime.hour as u8,
-                            datetime.minute as u8,
-                            datetime.second as u8,
-                            datetime.microsecond,
-                            None,
-                        )?;
-
-                        Ok(dt.to_object(py))
-                    }
-                },
-                (_, _) => Err(exceptions::PyValueError::new_err(
-                    "Parsing error".to_string(),
-                )),
-            },
-            (None, Some(duration), None) => Ok(Py::new(
-                py,
-                Duration::new(
-                    Some(duration.years),
-                    Some(duration.months),
-                    Some(duration.weeks),
-                    Some(duration.days),
-                    Some(duration.hours),
-                    Some(duration.minutes),
-                    Some(duration.seconds),
-                    Some(duration.microseconds),
-                ),
-            )?
-            .to_object(py)),
+            (Some(datetime), None, None) => datetime_to_python(py, datetime, utc),
+            (None, Some(duration), None) => duration_to_python(py, duration),
             (_, _, _) => Err(exceptions::PyValueError::new_err(
                 "Not yet implemented".to_string(),
             )),
@@ -115,3 +220,96 @@ pub fn parse_iso8601(py: Python, input: &str) -> PyResult<PyObject> {
         Err(error) => Err(exceptions::PyValueError::new_err(error.to_string())),
     }
 }
+
+fn datetime_to_python(py: Python, datetime: ParsedDateTime, utc: bool) -> PyResult<PyObject> {
+    match (datetime.has_date, datetime.has_time) {
+        (true, true) => match datetime.offset {
+            Some(offset) => {
+                let dt = PyDateTime::new_bound(
+                    py,
+                    datetime.year as i32,
+                    datetime.month as u8,
+                    datetime.day as u8,
+                    datetime.hour as u8,
+                    datetime.minute as u8,
+                    datetime.second as u8,
+                    datetime.microsecond,
+                    Some(&offset_timezone(py, offset, datetime.tzname, utc)?),
+                )?;
+
+                Ok(dt.to_object(py))
+            }
+            None => {
+                let dt = PyDateTime::new_bound(
+                    py,
+                    datetime.year as i32,
+                    datetime.month as u8,
+                    datetime.day as u8,
+                    datetime.hour as u8,
+                    datetime.minute as u8,
+                    datetime.second as u8,
+                    datetime.microsecond,
+                    None,
+                )?;
+
+                Ok(dt.to_object(py))
+            }
+        },
+        (true, false) => {
+            let dt = PyDate::new_bound(
+                py,
+                datetime.year as i32,
+                datetime.month as u8,
+                datetime.day as u8,
+            )?;
+
+            Ok(dt.to_object(py))
+        }
+        (false, true) => match datetime.offset {
+            Some(offset) => {
+                let dt = PyTime::new_bound(
+                    py,
+                    datetime.hour as u8,
+                    datetime.minute as u8,
+                    datetime.second as u8,
+                    datetime.microsecond,
+                    Some(&offset_timezone(py, offset, datetime.tzname, utc)?),
+                )?;
+
+                Ok(dt.to_object(py))
+            }
+            None => {
+                let dt = PyTime::new_bound(
+                    py,
+                    datetime.hour as u8,
+                    datetime.minute as u8,
+                    datetime.second as u8,
+                    datetime.microsecond,
+                    None,
+                )?;
+
+                Ok(dt.to_object(py))
+            }
+        },
+        (_, _) => Err(exceptions::PyValueError::new_err(
+            "Parsing error".to_string(),
+        )),
+    }
+}
+
+fn duration_to_python(py: Python, duration: ParsedDuration) -> PyResult<PyObject> {
+    Ok(Py::new(
+        py,
+        Duration::new(
+            Some(duration.years),
+            Some(duration.months),
+            Some(duration.weeks),
+            Some(duration.days),
+            Some(duration.hours),
+            Some(duration.minutes),
+            Some(duration.seconds),
+            Some(duration.microseconds),
+        ),
+    )?
+    .to_object(py))
+}
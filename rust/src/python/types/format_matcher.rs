@@ -0,0 +1,44 @@
+use pyo3::exceptions;
+use pyo3::prelude::*;
+use pyo3::types::PyDict;
+
+use crate::formatting;
+
+#[pyclass(module = "pendulum._pendulum", frozen)]
+pub struct FormatMatcher {
+    matcher: formatting::FormatMatcher,
+}
+
+#[pymethods]
+impl FormatMatcher {
+    #[new]
+    pub fn new(fmt: &str) -> PyResult<Self> {
+        match formatting::FormatMatcher::compile(fmt) {
+            Ok(matcher) => Ok(Self { matcher }),
+            Err(error) => Err(exceptions::PyValueError::new_err(error.to_string())),
+        }
+    }
+
+    fn parse<'py>(&self, py: Python<'py>, text: &str) -> PyResult<Option<Bound<'py, PyDict>>> {
+        let Some(fields) = self.matcher.parse(text) else {
+            return Ok(None);
+        };
+
+        let parsed = PyDict::new_bound(py);
+        parsed.set_item("year", fields.year)?;
+        parsed.set_item("month", fields.month)?;
+        parsed.set_item("day", fields.day)?;
+        parsed.set_item("hour", fields.hour)?;
+        parsed.set_item("minute", fields.minute)?;
+        parsed.set_item("second", fields.second)?;
+        parsed.set_item("microsecond", fields.microsecond)?;
+        parsed.set_item("tz", fields.offset)?;
+        parsed.set_item("quarter", fields.quarter)?;
+        parsed.set_item("day_of_week", fields.day_of_week)?;
+        parsed.set_item("day_of_year", fields.day_of_year)?;
+        parsed.set_item("meridiem", py.None())?;
+        parsed.set_item("timestamp", fields.timestamp)?;
+
+        Ok(Some(parsed))
+    }
+}
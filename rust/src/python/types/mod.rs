@@ -1,7 +1,9 @@
 mod duration;
+mod format_matcher;
 mod precise_diff;
 mod timezone;
 
 pub use duration::Duration;
+pub use format_matcher::FormatMatcher;
 pub use precise_diff::PreciseDiff;
-pub use timezone::FixedTimezone;
+pub use timezone::{FixedTimezone, TzifTimezone};
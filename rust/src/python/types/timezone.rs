@@ -1,31 +1,85 @@
+use pyo3::exceptions::{PyTypeError, PyValueError};
 use pyo3::prelude::*;
-use pyo3::types::{PyDelta, PyDict, PyTzInfo};
+use pyo3::sync::GILOnceCell;
+use pyo3::types::{
+    PyDateAccess, PyDateTime, PyDelta, PyDict, PyString, PyTimeAccess, PyType, PyTzInfo,
+};
 
-#[pyclass(module = "_pendulum", extends = PyTzInfo)]
-#[derive(Clone)]
+use crate::constants::SECS_PER_DAY;
+use crate::helpers::{day_number, local_time};
+use crate::tzif::{TransitionType, Tzif};
+
+static INTERNED: GILOnceCell<Py<PyDict>> = GILOnceCell::new();
+static ZERO: GILOnceCell<Py<PyDelta>> = GILOnceCell::new();
+
+// The module is the importable one so that instances can be pickled.
+#[pyclass(module = "pendulum._pendulum", extends = PyTzInfo)]
 pub struct FixedTimezone {
     offset: i32,
     name: Option<String>,
+    delta: Py<PyDelta>,
+    tzname: Py<PyString>,
+}
+
+impl FixedTimezone {
+    fn format_name(offset: i32, name: Option<&str>) -> String {
+        if let Some(n) = name {
+            n.to_string()
+        } else {
+            let sign = if offset < 0 { "-" } else { "+" };
+            let minutes = offset.abs() / 60;
+            let (hour, minute) = (minutes / 60, minutes % 60);
+            format!("{sign}{hour:.2}:{minute:.2}")
+        }
+    }
+
+    /// Returns the process-wide instance for the given offset and name,
+    /// creating it the first time it is requested.
+    pub fn interned<'py>(
+        py: Python<'py>,
+        offset: i32,
+        name: Option<String>,
+    ) -> PyResult<Bound<'py, PyTzInfo>> {
+        let table = INTERNED
+            .get_or_init(py, || PyDict::new_bound(py).unbind())
+            .bind(py);
+        let key = (offset, name.as_deref()).to_object(py);
+
+        if let Some(tz) = table.get_item(&key)? {
+            return Ok(tz.downcast_into()?);
+        }
+
+        let tz = Bound::new(py, Self::new(py, offset, name)?)?
+            .into_any()
+            .downcast_into::<PyTzInfo>()?;
+        table.set_item(key, &tz)?;
+
+        Ok(tz)
+    }
 }
 
 #[pymethods]
 impl FixedTimezone {
     #[new]
     #[pyo3(signature = (offset, name=None))]
-    pub fn new(offset: i32, name: Option<String>) -> Self {
-        Self { offset, name }
+    pub fn new(py: Python, offset: i32, name: Option<String>) -> PyResult<Self> {
+        let delta = PyDelta::new_bound(py, 0, offset, 0, true)?.unbind();
+        let tzname = PyString::new_bound(py, &Self::format_name(offset, name.as_deref()));
+
+        Ok(Self {
+            offset,
+            name,
+            delta,
+            tzname: tzname.unbind(),
+        })
     }
 
-    fn utcoffset<'p>(
-        &self,
-        py: Python<'p>,
-        _dt: &Bound<'p, PyAny>,
-    ) -> Result<pyo3::Bound<'p, PyDelta>, PyErr> {
-        PyDelta::new_bound(py, 0, self.offset, 0, true)
+    fn utcoffset<'p>(&self, py: Python<'p>, _dt: &Bound<'p, PyAny>) -> Bound<'p, PyDelta> {
+        self.delta.bind(py).clone()
     }
 
-    fn tzname(&self, _dt: &Bound<PyAny>) -> String {
-        self.__str__()
+    fn tzname<'p>(&self, py: Python<'p>, _dt: &Bound<'p, PyAny>) -> Bound<'p, PyString> {
+        self.tzname.bind(py).clone()
     }
 
     fn dst<'p>(
@@ -33,29 +87,187 @@ impl FixedTimezone {
         py: Python<'p>,
         _dt: &Bound<'p, PyAny>,
     ) -> Result<pyo3::Bound<'p, PyDelta>, PyErr> {
-        PyDelta::new_bound(py, 0, 0, 0, true)
+        let zero = ZERO.get_or_try_init(py, || {
+            PyDelta::new_bound(py, 0, 0, 0, true).map(Bound::unbind)
+        })?;
+
+        Ok(zero.bind(py).clone())
     }
 
     fn __repr__(&self) -> String {
         format!(
             "FixedTimezone({}, name=\"{}\")",
             self.offset,
-            self.__str__()
+            Self::format_name(self.offset, self.name.as_deref())
         )
     }
 
-    fn __str__(&self) -> String {
-        if let Some(n) = &self.name {
-            n.clone()
-        } else {
-            let sign = if self.offset < 0 { "-" } else { "+" };
-            let minutes = self.offset.abs() / 60;
-            let (hour, minute) = (minutes / 60, minutes % 60);
-            format!("{sign}{hour:.2}:{minute:.2}")
+    fn __str__<'p>(&self, py: Python<'p>) -> Bound<'p, PyString> {
+        self.tzname.bind(py).clone()
+    }
+
+    fn __deepcopy__(slf: PyRef<'_, Self>, _memo: &Bound<PyDict>) -> Py<Self> {
+        // Instances are immutable so they can be shared freely.
+        slf.into()
+    }
+
+    fn __reduce__<'p>(slf: &Bound<'p, Self>) -> (Bound<'p, PyType>, (i32, Option<String>)) {
+        let this = slf.borrow();
+
+        (slf.get_type(), (this.offset, this.name.clone()))
+    }
+}
+
+/// A named timezone backed by the transitions of its TZif file.
+#[pyclass(module = "pendulum._pendulum", extends = PyTzInfo)]
+pub struct TzifTimezone {
+    key: String,
+    tzif: Tzif,
+}
+
+impl TzifTimezone {
+    fn local_type(&self, dt: &Bound<PyDateTime>) -> &TransitionType {
+        self.tzif
+            .find_local(seconds_since_epoch(dt), dt.get_year(), dt.get_fold())
+    }
+
+    fn datetime<'py>(dt: &Bound<'py, PyAny>) -> PyResult<Bound<'py, PyDateTime>> {
+        dt.downcast::<PyDateTime>()
+            .cloned()
+            .map_err(|_| PyTypeError::new_err("argument must be a datetime instance or None"))
+    }
+}
+
+#[pymethods]
+impl TzifTimezone {
+    #[new]
+    pub fn new(key: String, data: &[u8]) -> PyResult<Self> {
+        let tzif = Tzif::parse(data).map_err(|e| PyValueError::new_err(e.to_string()))?;
+
+        Ok(Self { key, tzif })
+    }
+
+    #[getter]
+    fn key(&self) -> &str {
+        &self.key
+    }
+
+    fn utcoffset(&self, py: Python, dt: &Bound<PyAny>) -> PyResult<PyObject> {
+        if dt.is_none() {
+            return Ok(py.None());
+        }
+
+        let offset = self.local_type(&Self::datetime(dt)?).offset;
+
+        Ok(PyDelta::new_bound(py, 0, offset, 0, true)?.into_py(py))
+    }
+
+    fn dst(&self, py: Python, dt: &Bound<PyAny>) -> PyResult<PyObject> {
+        if dt.is_none() {
+            return Ok(py.None());
+        }
+
+        let dst = self.local_type(&Self::datetime(dt)?).dst;
+
+        Ok(PyDelta::new_bound(py, 0, dst, 0, true)?.into_py(py))
+    }
+
+    fn tzname(&self, py: Python, dt: &Bound<PyAny>) -> PyResult<PyObject> {
+        if dt.is_none() {
+            return Ok(py.None());
+        }
+
+        Ok(self
+            .local_type(&Self::datetime(dt)?)
+            .abbreviation
+            .to_object(py))
+    }
+
+    fn fromutc<'py>(slf: &Bound<'py, Self>, dt: &Bound<'py, PyAny>) -> PyResult<Bound<'py, PyAny>> {
+        let py = slf.py();
+        let dt = dt
+            .downcast::<PyDateTime>()
+            .map_err(|_| PyTypeError::new_err("fromutc() requires a datetime argument"))?;
+
+        let tzinfo = dt.getattr("tzinfo")?;
+        if !tzinfo.is(slf) {
+            return Err(PyValueError::new_err("dt.tzinfo is not self"));
+        }
+
+        let this = slf.borrow();
+        let instant = seconds_since_epoch(dt);
+        let (transition_type, fold) = this.tzif.find_utc(instant);
+        let (year, month, day, hour, minute, second, _) =
+            local_time(instant as f64, transition_type.offset as isize, 0);
+
+        if PyDateTime::is_exact_type_of_bound(dt) {
+            return Ok(PyDateTime::new_bound_with_fold(
+                py,
+                year as i32,
+                month as u8,
+                day as u8,
+                hour as u8,
+                minute as u8,
+                second as u8,
+                dt.get_microsecond(),
+                Some(tzinfo.downcast::<PyTzInfo>()?),
+                fold,
+            )?
+            .into_any());
         }
+
+        // Subclasses, like pendulum's DateTime, are preserved
+        let kwargs = PyDict::new_bound(py);
+        kwargs.set_item("year", year)?;
+        kwargs.set_item("month", month)?;
+        kwargs.set_item("day", day)?;
+        kwargs.set_item("hour", hour)?;
+        kwargs.set_item("minute", minute)?;
+        kwargs.set_item("second", second)?;
+        kwargs.set_item("fold", u8::from(fold))?;
+
+        dt.call_method("replace", (), Some(&kwargs))
+    }
+
+    /// Returns the UTC offsets and folds of the local times
+    /// corresponding to the given POSIX timestamps.
+    fn utc_offsets(&self, py: Python, instants: Vec<i64>) -> (Vec<i32>, Vec<u8>) {
+        py.allow_threads(|| {
+            instants
+                .iter()
+                .map(|&instant| {
+                    let (transition_type, fold) = self.tzif.find_utc(instant);
+
+                    (transition_type.offset, u8::from(fold))
+                })
+                .unzip()
+        })
     }
 
-    fn __deepcopy__(&self, py: Python, _memo: &Bound<PyDict>) -> PyResult<Py<Self>> {
-        Py::new(py, self.clone())
+    fn __repr__(&self) -> String {
+        format!("TzifTimezone('{}')", self.key)
+    }
+
+    fn __reduce__<'p>(&self, py: Python<'p>) -> PyResult<(Bound<'p, PyAny>, (String,))> {
+        // Instances are restored by key, from the zones already loaded if any
+        let native_timezone = py
+            .import_bound("pendulum.tz.transitions")?
+            .getattr("native_timezone")?;
+
+        Ok((native_timezone, (self.key.clone(),)))
+    }
+
+    fn __str__(&self) -> String {
+        self.key.clone()
     }
 }
+
+/// Returns the number of seconds since the epoch of the wall time of a datetime.
+fn seconds_since_epoch(dt: &Bound<PyDateTime>) -> i64 {
+    let days = day_number(dt.get_year(), dt.get_month(), dt.get_day()) - day_number(1970, 1, 1);
+
+    i64::from(days) * i64::from(SECS_PER_DAY)
+        + i64::from(dt.get_hour()) * 3600
+        + i64::from(dt.get_minute()) * 60
+        + i64::from(dt.get_second())
+}
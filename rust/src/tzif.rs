@@ -0,0 +1,644 @@
+use std::fmt;
+
+use crate::{
+    constants::{DAYS_PER_MONTHS, SECS_PER_DAY},
+    helpers::{day_number, is_leap, local_time, week_day},
+};
+
+#[derive(Debug, Clone)]
+pub struct TzifError {
+    message: String,
+}
+
+impl TzifError {
+    fn new(message: &str) -> Self {
+        Self {
+            message: message.to_string(),
+        }
+    }
+}
+
+impl fmt::Display for TzifError {
+    fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
+        write!(f, "{}", self.message)
+    }
+}
+
+#[derive(Debug, Clone, PartialEq, Eq)]
+pub struct TransitionType {
+    pub offset: i32,
+    pub dst: i32,
+    pub abbreviation: String,
+}
+
+#[derive(Debug, Clone, Copy)]
+enum RuleDate {
+    // Day `weekday` (0 is Sunday) of week `week` (5 is the last one) of `month`
+    Month {
+        month: u8,
+        week: u8,
+        weekday: u8,
+        time: i32,
+    },
+    // Julian day, February 29th is never counted
+    Julian {
+        day: u16,
+        time: i32,
+    },
+    // Zero-based day of the year
+    Day {
+        day: u16,
+        time: i32,
+    },
+}
+
+impl RuleDate {
+    /// Returns the local time, in seconds since the epoch,
+    /// at which the rule applies in the given year.
+    fn to_epoch(self, year: i32) -> i64 {
+        let jan_first = i64::from(day_number(year, 1, 1) - day_number(1970, 1, 1));
+
+        let (days, time) = match self {
+            RuleDate::Month {
+                month,
+                week,
+                weekday,
+                time,
+            } => {
+                let first_weekday = week_day(year, u32::from(month), 1) % 7;
+                let mut day = (i32::from(weekday) - first_weekday as i32 + 7) % 7
+                    + 1
+                    + (i32::from(week) - 1) * 7;
+                if day > DAYS_PER_MONTHS[usize::from(is_leap(year))][usize::from(month)] {
+                    day -= 7;
+                }
+
+                (
+                    i64::from(day_number(year, month, day as u8) - day_number(1970, 1, 1)),
+                    time,
+                )
+            }
+            RuleDate::Julian { day, time } => {
+                let mut days = jan_first + i64::from(day) - 1;
+                if day >= 60 && is_leap(year) {
+                    days += 1;
+                }
+
+                (days, time)
+            }
+            RuleDate::Day { day, time } => (jan_first + i64::from(day), time),
+        };
+
+        days * i64::from(SECS_PER_DAY) + i64::from(time)
+    }
+}
+
+#[derive(Debug, Clone)]
+struct DstRule {
+    dst: TransitionType,
+    start: RuleDate,
+    end: RuleDate,
+}
+
+/// A POSIX TZ string, as found in the footer of TZif files.
+#[derive(Debug, Clone)]
+pub struct PosixTz {
+    std: TransitionType,
+    rule: Option<DstRule>,
+}
+
+impl PosixTz {
+    pub fn parse(value: &str) -> Result<Self, TzifError> {
+        let mut parser = PosixParser {
+            bytes: value.as_bytes(),
+            index: 0,
+        };
+
+        // POSIX offsets are positive west of Greenwich
+        let std_name = parser.parse_name()?;
+        let std_offset = -parser.parse_time()?;
+        let std = TransitionType {
+            offset: std_offset,
+            dst: 0,
+            abbreviation: std_name,
+        };
+
+        if parser.is_done() {
+            return Ok(Self { std, rule: None });
+        }
+
+        let dst_name = parser.parse_name()?;
+        let mut dst_offset = std_offset + 3600;
+        if !parser.is_done() && parser.peek() != b',' {
+            dst_offset = -parser.parse_time()?;
+        }
+
+        parser.expect(b',')?;
+        let start = parser.parse_date()?;
+        parser.expect(b',')?;
+        let end = parser.parse_date()?;
+
+        if !parser.is_done() {
+            return Err(TzifError::new("Invalid POSIX TZ string"));
+        }
+
+        Ok(Self {
+            std,
+            rule: Some(DstRule {
+                dst: TransitionType {
+                    offset: dst_offset,
+                    dst: dst_offset - std_offset,
+                    abbreviation: dst_name,
+                },
+                start,
+                end,
+            }),
+        })
+    }
+
+    /// Returns the type in effect at the given local time.
+    fn find_local(&self, ts: i64, year: i32, fold: bool) -> &TransitionType {
+        let Some(rule) = &self.rule else {
+            return &self.std;
+        };
+
+        let mut start = rule.start.to_epoch(year);
+        let mut end = rule.end.to_epoch(year);
+        let dst_diff = i64::from(rule.dst.dst);
+
+        // With fold=0, the period with the smaller offset starts at the end
+        // of the gap and ends at the end of the fold, with fold=1 it runs
+        // from the start of the gap to the beginning of the fold.
+        if fold == (dst_diff >= 0) {
+            end -= dst_diff;
+        } else {
+            start += dst_diff;
+        }
+
+        let is_dst = if start < end {
+            start <= ts && ts < end
+        } else {
+            !(end <= ts && ts < start)
+        };
+
+        if is_dst {
+            &rule.dst
+        } else {
+            &self.std
+        }
+    }
+
+    /// Returns the type in effect at the given UTC time
+    /// and whether the corresponding local time is the second
+    /// occurrence of a repeated time.
+    fn find_utc(&self, ts: i64, year: i32) -> (&TransitionType, bool) {
+        let Some(rule) = &self.rule else {
+            return (&self.std, false);
+        };
+
+        let start = rule.start.to_epoch(year) - i64::from(self.std.offset);
+        let end = rule.end.to_epoch(year) - i64::from(rule.dst.offset);
+        let dst_diff = i64::from(rule.dst.dst);
+
+        let is_dst = if start < end {
+            start <= ts && ts < end
+        } else {
+            !(end <= ts && ts < start)
+        };
+
+        // For positive DST, the ambiguous period is one dst_diff after the end
+        // of DST, for negative DST it is one dst_diff before the start of DST.
+        let (ambiguous_start, ambiguous_end) = if dst_diff > 0 {
+            (end, end + dst_diff)
+        } else {
+            (start, start - dst_diff)
+        };
+        let fold = ambiguous_start <= ts && ts < ambiguous_end;
+
+        if is_dst {
+            (&rule.dst, fold)
+        } else {
+            (&self.std, fold)
+        }
+    }
+}
+
+struct PosixParser<'a> {
+    bytes: &'a [u8],
+    index: usize,
+}
+
+impl<'a> PosixParser<'a> {
+    fn is_done(&self) -> bool {
+        self.index >= self.bytes.len()
+    }
+
+    fn peek(&self) -> u8 {
+        self.bytes[self.index]
+    }
+
+    fn expect(&mut self, expected: u8) -> Result<(), TzifError> {
+        if self.is_done() || self.peek() != expected {
+            return Err(TzifError::new("Invalid POSIX TZ string"));
+        }
+
+        self.index += 1;
+
+        Ok(())
+    }
+
+    fn parse_name(&mut self) -> Result<String, TzifError> {
+        let start = self.index;
+
+        let name = if !self.is_done() && self.peek() == b'<' {
+            while !self.is_done() && self.peek() != b'>' {
+                self.index += 1;
+            }
+            self.expect(b'>')?;
+
+            &self.bytes[start + 1..self.index - 1]
+        } else {
+            while !self.is_done() && self.peek().is_ascii_alphabetic() {
+                self.index += 1;
+            }
+
+            &self.bytes[start..self.index]
+        };
+
+        if name.is_empty() {
+            return Err(TzifError::new("Invalid POSIX TZ string"));
+        }
+
+        Ok(String::from_utf8_lossy(name).into_owned())
+    }
+
+    fn parse_number(&mut self, max_digits: usize) -> Result<i32, TzifError> {
+        let start = self.index;
+        let mut value = 0;
+
+        while !self.is_done() && self.peek().is_ascii_digit() && self.index - start < max_digits {
+            value = value * 10 + i32::from(self.peek() - b'0');
+            self.index += 1;
+        }
+
+        if self.index == start {
+            return Err(TzifError::new("Invalid POSIX TZ string"));
+        }
+
+        Ok(value)
+    }
+
+    /// Parses a [+-]hh[:mm[:ss]] time, in seconds.
+    fn parse_time(&mut self) -> Result<i32, TzifError> {
+        let mut sign = 1;
+        if !self.is_done() && (self.peek() == b'+' || self.peek() == b'-') {
+            if self.peek() == b'-' {
+                sign = -1;
+            }
+            self.index += 1;
+        }
+
+        let mut seconds = self.parse_number(3)? * 3600;
+        for unit in [60, 1] {
+            if self.is_done() || self.peek() != b':' {
+                break;
+            }
+
+            self.index += 1;
+            seconds += self.parse_number(2)? * unit;
+        }
+
+        Ok(sign * seconds)
+    }
+
+    fn parse_date(&mut self) -> Result<RuleDate, TzifError> {
+        if self.is_done() {
+            return Err(TzifError::new("Invalid POSIX TZ rule date"));
+        }
+
+        let date = match self.peek() {
+            b'M' => {
+                self.index += 1;
+                let month = self.parse_number(2)?;
+                self.expect(b'.')?;
+                let week = self.parse_number(1)?;
+                self.expect(b'.')?;
+                let weekday = self.parse_number(1)?;
+
+                if !(1..=12).contains(&month) || !(1..=5).contains(&week) || weekday > 6 {
+                    return Err(TzifError::new("Invalid POSIX TZ rule date"));
+                }
+
+                RuleDate::Month {
+                    month: month as u8,
+                    week: week as u8,
+                    weekday: weekday as u8,
+                    time: 0,
+                }
+            }
+            b'J' => {
+                self.index += 1;
+                let day = self.parse_number(3)?;
+                if !(1..=365).contains(&day) {
+                    return Err(TzifError::new("Invalid POSIX TZ rule date"));
+                }
+
+                RuleDate::Julian {
+                    day: day as u16,
+                    time: 0,
+                }
+            }
+            _ => {
+                let day = self.parse_number(3)?;
+                if day > 365 {
+                    return Err(TzifError::new("Invalid POSIX TZ rule date"));
+                }
+
+                RuleDate::Day {
+                    day: day as u16,
+                    time: 0,
+                }
+            }
+        };
+
+        let mut time = 7200;
+        if !self.is_done() && self.peek() == b'/' {
+            self.index += 1;
+            time = self.parse_time()?;
+        }
+
+        Ok(match date {
+            RuleDate::Month {
+                month,
+                week,
+                weekday,
+                ..
+            } => RuleDate::Month {
+                month,
+                week,
+                weekday,
+                time,
+            },
+            RuleDate::Julian { day, .. } => RuleDate::Julian { day, time },
+            RuleDate::Day { day, .. } => RuleDate::Day { day, time },
+        })
+    }
+}
+
+struct Reader<'a> {
+    data: &'a [u8],
+    index: usize,
+}
+
+impl<'a> Reader<'a> {
+    fn take(&mut self, length: usize) -> Result<&'a [u8], TzifError> {
+        if self.data.len() - self.index < length {
+            return Err(TzifError::new("Truncated TZif file"));
+        }
+
+        let bytes = &self.data[self.index..self.index + length];
+        self.index += length;
+
+        Ok(bytes)
+    }
+
+    fn read_i32(&mut self) -> Result<i32, TzifError> {
+        Ok(i32::from_be_bytes(self.take(4)?.try_into().unwrap()))
+    }
+
+    fn read_i64(&mut self) -> Result<i64, TzifError> {
+        Ok(i64::from_be_bytes(self.take(8)?.try_into().unwrap()))
+    }
+
+    fn read_header(&mut self) -> Result<(u8, [usize; 6]), TzifError> {
+        if self.take(4)? != b"TZif" {
+            return Err(TzifError::new("Invalid TZif file"));
+        }
+
+        let version = match self.take(1)?[0] {
+            0 => 1,
+            version @ b'2'..=b'9' => version - b'0',
+            _ => return Err(TzifError::new("Invalid TZif file")),
+        };
+        self.take(15)?;
+
+        let mut counts = [0; 6];
+        for count in &mut counts {
+            *count = usize::try_from(self.read_i32()?)
+                .map_err(|_| TzifError::new("Invalid TZif file"))?;
+        }
+
+        Ok((version, counts))
+    }
+}
+
+/// The transitions of a zone, as read from a TZif file.
+///
+/// Times past the last transition are resolved with the POSIX TZ footer,
+/// if any, the same way zoneinfo does.
+#[derive(Debug, Clone)]
+pub struct Tzif {
+    instants: Vec<i64>,
+    // The local times of the transitions, for fold=0 and fold=1
+    wall: [Vec<i64>; 2],
+    indices: Vec<usize>,
+    types: Vec<TransitionType>,
+    before: usize,
+    footer: Option<PosixTz>,
+}
+
+impl Tzif {
+    pub fn parse(data: &[u8]) -> Result<Self, TzifError> {
+        let mut reader = Reader { data, index: 0 };
+        let (mut version, mut counts) = reader.read_header()?;
+        let mut time_size = 4;
+
+        if version >= 2 {
+            // Skip the version 1 data block which only has 32-bit transition times
+            let [isutcnt, isstdcnt, leapcnt, timecnt, typecnt, charcnt] = counts;
+            reader.take(timecnt * 5 + typecnt * 6 + charcnt + leapcnt * 8 + isstdcnt + isutcnt)?;
+            (version, counts) = reader.read_header()?;
+            time_size = 8;
+        }
+
+        let [isutcnt, isstdcnt, leapcnt, timecnt, typecnt, charcnt] = counts;
+        if typecnt == 0 {
+            return Err(TzifError::new("Invalid TZif file"));
+        }
+
+        let mut instants = Vec::with_capacity(timecnt);
+        for _ in 0..timecnt {
+            instants.push(if time_size == 8 {
+                reader.read_i64()?
+            } else {
+                i64::from(reader.read_i32()?)
+            });
+        }
+
+        let indices: Vec<usize> = reader.take(timecnt)?.iter().map(|&i| i as usize).collect();
+        if indices.iter().any(|&i| i >= typecnt) {
+            return Err(TzifError::new("Invalid TZif file"));
+        }
+
+        let mut records = Vec::with_capacity(typecnt);
+        for _ in 0..typecnt {
+            let offset = reader.read_i32()?;
+            let flags = reader.take(2)?;
+            records.push((offset, flags[0] != 0, usize::from(flags[1])));
+        }
+
+        let abbreviations = reader.take(charcnt)?;
+        let dst_offsets = dst_offsets(&indices, &records);
+
+        let mut types = Vec::with_capacity(typecnt);
+        for (&(offset, _, index), dst) in records.iter().zip(dst_offsets) {
+            let abbreviation = abbreviations
+                .get(index..)
+                .and_then(|rest| rest.split(|&c| c == 0).next())
+                .ok_or_else(|| TzifError::new("Invalid TZif file"))?;
+
+            types.push(TransitionType {
+                offset,
+                dst,
+                abbreviation: String::from_utf8_lossy(abbreviation).into_owned(),
+            });
+        }
+
+        // Times before the first transition use the first standard time type
+        let before = records
+            .iter()
+            .position(|&(_, is_dst, _)| !is_dst)
+            .unwrap_or(0);
+
+        let mut footer = None;
+        if version >= 2 {
+            reader.take(isutcnt + isstdcnt + leapcnt * (time_size + 4))?;
+            let rest = String::from_utf8_lossy(&data[reader.index..]);
+            let rest = rest.trim_matches('\n');
+
+            if !rest.is_empty() {
+                footer = Some(PosixTz::parse(rest)?);
+            }
+        }
+
+        let wall = wall_times(&instants, &indices, &types, before);
+
+        Ok(Self {
+            instants,
+            wall,
+            indices,
+            types,
+            before,
+            footer,
+        })
+    }
+
+    /// Returns the type in effect at the given local time,
+    /// following the PEP 495 semantics for ambiguous and skipped times.
+    pub fn find_local(&self, ts: i64, year: i32, fold: bool) -> &TransitionType {
+        let wall = &self.wall[usize::from(fold)];
+
+        if let Some(footer) = &self.footer {
+            if wall.last().map_or(true, |&last| ts > last) {
+                return footer.find_local(ts, year, fold);
+            }
+        }
+
+        match wall.partition_point(|&t| t <= ts) {
+            0 => &self.types[self.before],
+            index => &self.types[self.indices[index - 1]],
+        }
+    }
+
+    /// Returns the type in effect at the given UTC time
+    /// and the fold of the corresponding local time.
+    pub fn find_utc(&self, ts: i64) -> (&TransitionType, bool) {
+        // A fixed footer only repeats the last type, so the fold of the times
+        // right after the last transition is still detected with the table.
+        if let Some(footer) = self.footer.as_ref().filter(|f| f.rule.is_some()) {
+            if self.instants.last().map_or(true, |&last| ts > last) {
+                return footer.find_utc(ts, year_of(ts));
+            }
+        }
+
+        match self.instants.partition_point(|&t| t <= ts) {
+            0 => (&self.types[self.before], false),
+            index => {
+                let current = &self.types[self.indices[index - 1]];
+                let previous = if index >= 2 {
+                    &self.types[self.indices[index - 2]]
+                } else {
+                    &self.types[self.before]
+                };
+                let fold =
+                    i64::from(previous.offset - current.offset) > ts - self.instants[index - 1];
+
+                (current, fold)
+            }
+        }
+    }
+}
+
+fn year_of(ts: i64) -> i32 {
+    local_time(ts as f64, 0, 0).0 as i32
+}
+
+/// TZif files only flag DST types, so their DST offsets are inferred
+/// from the standard types around them, the same way zoneinfo does.
+fn dst_offsets(indices: &[usize], records: &[(i32, bool, usize)]) -> Vec<i32> {
+    let mut dst_offsets = vec![0; records.len()];
+
+    for i in 1..indices.len() {
+        let index = indices[i];
+        let (offset, is_dst, _) = records[index];
+        if !is_dst || dst_offsets[index] != 0 {
+            continue;
+        }
+
+        let previous = records[indices[i - 1]];
+        if !previous.1 {
+            dst_offsets[index] = offset - previous.0;
+        }
+
+        if dst_offsets[index] == 0 && i + 1 < indices.len() {
+            let following = records[indices[i + 1]];
+            if !following.1 {
+                dst_offsets[index] = offset - following.0;
+            }
+        }
+    }
+
+    for (index, &(_, is_dst, _)) in records.iter().enumerate() {
+        if is_dst && dst_offsets[index] == 0 {
+            dst_offsets[index] = 3600;
+        }
+    }
+
+    dst_offsets
+}
+
+/// Returns the local times of the transitions. With fold=0 the larger
+/// of the offsets around each transition is used, the smaller one otherwise.
+fn wall_times(
+    instants: &[i64],
+    indices: &[usize],
+    types: &[TransitionType],
+    before: usize,
+) -> [Vec<i64>; 2] {
+    let mut wall = [
+        Vec::with_capacity(instants.len()),
+        Vec::with_capacity(instants.len()),
+    ];
+    let mut previous = types[before].offset;
+
+    for (&instant, &index) in instants.iter().zip(indices) {
+        let current = types[index].offset;
+
+        wall[0].push(instant + i64::from(previous.max(current)));
+        wall[1].push(instant + i64::from(previous.min(current)));
+
+        previous = current;
+    }
+
+    wall
+}
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
 import datetime as _datetime
+import weakref
 
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from typing import Callable
+from typing import Iterable
 from typing import Union
 from typing import cast
 from typing import overload
@@ -30,6 +35,7 @@ from pendulum.helpers import week_ends_at
 from pendulum.helpers import week_starts_at
 from pendulum.interval import Interval
 from pendulum.parser import parse
+from pendulum.parser import try_parse
 from pendulum.testing.traveller import Traveller
 from pendulum.time import Time
 from pendulum.tz import UTC
@@ -38,6 +44,7 @@ from pendulum.tz import local_timezone
 from pendulum.tz import set_local_timezone
 from pendulum.tz import test_local_timezone
 from pendulum.tz import timezones
+from pendulum.tz.bundle import get_bundle
 from pendulum.tz.timezone import FixedTimezone
 from pendulum.tz.timezone import Timezone
 
@@ -57,6 +64,15 @@ _WEEK_ENDS_AT: WeekDay = WeekDay.SUNDAY
 
 _formatter = Formatter()
 
+# Timezones resolved from names and from foreign tzinfo objects.
+# Foreign tzinfo objects are weakly referenced so they can still be collected,
+# except for datetime.timezone instances which cannot be but are immutable.
+_timezones_by_name: dict[str, Timezone | FixedTimezone] = {}
+_timezones_by_offset: dict[_datetime.timezone, Timezone | FixedTimezone] = {}
+_timezones_by_tzinfo: weakref.WeakKeyDictionary[
+    _datetime.tzinfo, Timezone | FixedTimezone
+] = weakref.WeakKeyDictionary()
+
 
 @overload
 def timezone(name: int) -> FixedTimezone:
@@ -83,6 +99,10 @@ def timezone(name: str | int) -> Timezone | FixedTimezone:
     if name.lower() == "utc":
         return UTC
 
+    bundle = get_bundle()
+    if bundle is not None and name in bundle:
+        return bundle.timezone(name)
+
     return Timezone(name)
 
 
@@ -100,30 +120,106 @@ def _safe_timezone(
     if obj is None or obj == "local":
         return local_timezone()
 
+    if isinstance(obj, str):
+        tz = _timezones_by_name.get(obj)
+        if tz is None:
+            tz = _timezones_by_name[obj] = timezone(obj)
+
+        return tz
+
     if isinstance(obj, (int, float)):
         obj = int(obj * 60 * 60)
+    elif isinstance(obj, _datetime.timezone):
+        tz = _timezones_by_offset.get(obj)
+        if tz is None:
+            tz = _timezones_by_offset[obj] = _convert_tzinfo(obj, dt)[0]
+
+        return tz
     elif isinstance(obj, _datetime.tzinfo):
-        # zoneinfo
-        if hasattr(obj, "key"):
-            obj = obj.key
-        # pytz
-        elif hasattr(obj, "localize"):
-            obj = obj.zone  # type: ignore[attr-defined]
-        elif obj.tzname(None) == "UTC":
-            return UTC
-        else:
-            offset = obj.utcoffset(dt)
-
-            if offset is None:
-                offset = _datetime.timedelta(0)
-
-            obj = int(offset.total_seconds())
+        try:
+            return _timezones_by_tzinfo[obj]
+        except (KeyError, TypeError):
+            # TypeError is raised for objects that cannot be weakly referenced
+            # or that are not hashable.
+            pass
+
+        tz, cacheable = _convert_tzinfo(obj, dt)
+        if cacheable:
+            try:
+                _timezones_by_tzinfo[obj] = tz
+            except TypeError:
+                pass
+
+        return tz
 
     obj = cast(Union[str, int], obj)
 
     return timezone(obj)
 
 
+def _convert_tzinfo(
+    obj: _datetime.tzinfo, dt: _datetime.datetime | None
+) -> tuple[Timezone | FixedTimezone, bool]:
+    """
+    Converts a foreign tzinfo object to a pendulum timezone
+    and tells if the conversion does not depend on the given datetime.
+    """
+    # zoneinfo
+    if hasattr(obj, "key"):
+        return timezone(obj.key), True
+
+    # pytz
+    if hasattr(obj, "localize"):
+        return timezone(obj.zone), True  # type: ignore[attr-defined]
+
+    if obj.tzname(None) == "UTC":
+        return UTC, True
+
+    offset = obj.utcoffset(dt)
+
+    if offset is None:
+        offset = _datetime.timedelta(0)
+
+    return fixed_timezone(int(offset.total_seconds())), False
+
+
+def preload(
+    timezones: Iterable[str] = (),
+    locales: Iterable[str] = (),
+    max_workers: int | None = None,
+) -> None:
+    """
+    Loads and caches timezones and locales ahead of time,
+    for instance before forking worker processes.
+
+    If max_workers is given, they are loaded by a pool of threads.
+    """
+    from pendulum.locales.locale import Locale
+    from pendulum.tz import transitions
+
+    def load_timezone(name: str) -> None:
+        tz = _safe_timezone(name)
+
+        if isinstance(tz, Timezone):
+            transitions.load(tz.key)
+
+    tasks: list[tuple[Callable[[str], Any], str]] = [
+        (load_timezone, name) for name in timezones
+    ]
+    tasks += [(Locale.load, name) for name in locales]
+
+    if max_workers is None:
+        for func, name in tasks:
+            func(name)
+
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Consuming the results re-raises the errors, if any.
+        for _ in executor.map(lambda task: task[0](task[1]), tasks):
+            pass
+
+
 # Public API
 def datetime(
     year: int,
@@ -384,6 +480,8 @@ __all__ = [
     "week_ends_at",
     "week_starts_at",
     "parse",
+    "preload",
+    "try_parse",
     "Interval",
     "Time",
     "UTC",
@@ -5,7 +5,9 @@ import math
 import zoneinfo
 
 from typing import NamedTuple
+from typing import TypeVar
 from typing import cast
+from typing import overload
 
 from pendulum.constants import DAY_OF_WEEK_TABLE
 from pendulum.constants import DAYS_PER_L_YEAR
@@ -25,6 +27,10 @@ from pendulum.constants import TM_JANUARY
 from pendulum.tz.timezone import Timezone
 
 
+_DT = TypeVar("_DT", bound=datetime.datetime)
+_D = TypeVar("_D", bound=datetime.date)
+
+
 class PreciseDiff(NamedTuple):
     years: int
     months: int
@@ -153,6 +159,111 @@ def local_time(
     return year, month, day, hour, minute, second, microseconds
 
 
+@overload
+def add_duration(
+    dt: _DT,
+    years: int = 0,
+    months: int = 0,
+    weeks: int = 0,
+    days: int = 0,
+    hours: int = 0,
+    minutes: int = 0,
+    seconds: float = 0,
+    microseconds: int = 0,
+) -> _DT:
+    ...
+
+
+@overload
+def add_duration(
+    dt: _D,
+    years: int = 0,
+    months: int = 0,
+    weeks: int = 0,
+    days: int = 0,
+) -> _D:
+    pass
+
+
+def add_duration(
+    dt: datetime.date | datetime.datetime,
+    years: int = 0,
+    months: int = 0,
+    weeks: int = 0,
+    days: int = 0,
+    hours: int = 0,
+    minutes: int = 0,
+    seconds: float = 0,
+    microseconds: int = 0,
+) -> datetime.date | datetime.datetime:
+    """
+    Adds a duration to a date/datetime instance.
+    """
+    days += weeks * 7
+
+    if (
+        isinstance(dt, datetime.date)
+        and not isinstance(dt, datetime.datetime)
+        and any([hours, minutes, seconds, microseconds])
+    ):
+        raise RuntimeError("Time elements cannot be added to a date instance.")
+
+    # Normalizing
+    if abs(microseconds) > 999999:
+        s = _sign(microseconds)
+        div, mod = divmod(microseconds * s, 1000000)
+        microseconds = mod * s
+        seconds += div * s
+
+    if abs(seconds) > 59:
+        s = _sign(seconds)
+        div, mod = divmod(seconds * s, 60)  # type: ignore[assignment]
+        seconds = mod * s
+        minutes += div * s
+
+    if abs(minutes) > 59:
+        s = _sign(minutes)
+        div, mod = divmod(minutes * s, 60)
+        minutes = mod * s
+        hours += div * s
+
+    if abs(hours) > 23:
+        s = _sign(hours)
+        div, mod = divmod(hours * s, 24)
+        hours = mod * s
+        days += div * s
+
+    if abs(months) > 11:
+        s = _sign(months)
+        div, mod = divmod(months * s, 12)
+        months = mod * s
+        years += div * s
+
+    year = dt.year + years
+    month = dt.month
+
+    if months:
+        month += months
+        if month > 12:
+            year += 1
+            month -= 12
+        elif month < 1:
+            year -= 1
+            month += 12
+
+    day = min(DAYS_PER_MONTHS[int(is_leap(year))][month], dt.day)
+
+    dt = dt.replace(year=year, month=month, day=day)
+
+    return dt + datetime.timedelta(
+        days=days,
+        hours=hours,
+        minutes=minutes,
+        seconds=seconds,
+        microseconds=microseconds,
+    )
+
+
 def precise_diff(
     d1: datetime.datetime | datetime.date, d2: datetime.datetime | datetime.date
 ) -> PreciseDiff:
@@ -304,6 +415,10 @@ def precise_diff(
     )
 
 
+def _sign(x: float) -> int:
+    return int(math.copysign(1, x))
+
+
 def _day_number(year: int, month: int, day: int) -> int:
     month = (month + 9) % 12
     year = year - month // 10
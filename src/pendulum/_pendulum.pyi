@@ -3,7 +3,19 @@ from __future__ import annotations
 from datetime import date
 from datetime import datetime
 from datetime import time
+from datetime import timedelta
+from datetime import tzinfo
+from typing import Any
+from typing import Iterable
+from typing import Literal
 from typing import NamedTuple
+from typing import TypeVar
+from typing import overload
+
+from pendulum.datetime import DateTime
+
+_DT = TypeVar("_DT", bound=datetime)
+_D = TypeVar("_D", bound=date)
 
 class Duration:
     years: int = 0
@@ -17,6 +29,21 @@ class Duration:
     remaining_seconds: int = 0
     microseconds: int = 0
 
+class FormatMatcher:
+    def __init__(self, fmt: str) -> None: ...
+    def parse(self, text: str) -> dict[str, Any] | None: ...
+
+class TzifTimezone(tzinfo):
+    def __init__(self, key: str, data: bytes) -> None: ...
+    @property
+    def key(self) -> str: ...
+    def utcoffset(self, dt: datetime | None) -> timedelta | None: ...
+    def dst(self, dt: datetime | None) -> timedelta | None: ...
+    def tzname(self, dt: datetime | None) -> str | None: ...
+    def fromutc(self, dt: datetime) -> datetime: ...
+    def utc_offsets(self, instants: list[int]) -> tuple[list[int], list[int]]: ...
+    def __reduce__(self) -> tuple[Any, tuple[str]]: ...
+
 class PreciseDiff(NamedTuple):
     years: int
     months: int
@@ -28,8 +55,45 @@ class PreciseDiff(NamedTuple):
     total_days: int
 
 def parse_iso8601(
-    text: str,
+    text: str, utc: bool = False
 ) -> datetime | date | time | Duration: ...
+def try_parse_iso8601(
+    text: str, utc: bool = False
+) -> datetime | date | time | Duration | None: ...
+def parse_iso8601_interval(
+    text: str, utc: bool = False
+) -> tuple[
+    datetime | date | time | None, datetime | date | time | None, Duration | None
+]: ...
+def parse_iso8601_datetime(text: str, tz: tzinfo) -> DateTime | None: ...
+@overload
+def parse_iso8601_many(
+    texts: Iterable[str], errors: Literal[False] = False, utc: bool = False
+) -> list[datetime | date | time | Duration]: ...
+@overload
+def parse_iso8601_many(
+    texts: Iterable[str], errors: Literal[True], utc: bool = False
+) -> tuple[list[datetime | date | time | Duration | None], list[ValueError | None]]: ...
+@overload
+def add_duration(
+    dt: _DT,
+    years: int = 0,
+    months: int = 0,
+    weeks: int = 0,
+    days: int = 0,
+    hours: int = 0,
+    minutes: int = 0,
+    seconds: float = 0,
+    microseconds: int = 0,
+) -> _DT: ...
+@overload
+def add_duration(
+    dt: _D,
+    years: int = 0,
+    months: int = 0,
+    weeks: int = 0,
+    days: int = 0,
+) -> _D: ...
 def days_in_year(year: int) -> int: ...
 def is_leap(year: int) -> bool: ...
 def is_long_year(year: int) -> bool: ...
@@ -16,6 +16,7 @@ import pendulum
 
 from pendulum.constants import ATOM
 from pendulum.constants import COOKIE
+from pendulum.constants import DAYS_PER_MONTHS
 from pendulum.constants import MINUTES_PER_HOUR
 from pendulum.constants import MONTHS_PER_YEAR
 from pendulum.constants import RFC822
@@ -46,6 +47,9 @@ if TYPE_CHECKING:
     from typing_extensions import Self
     from typing_extensions import SupportsIndex
 
+_MICROSECOND = datetime.timedelta(microseconds=1)
+_MAX_ORDINAL = datetime.date.max.toordinal()
+
 
 class DateTime(datetime.datetime, Date):
     EPOCH: ClassVar[DateTime]
@@ -99,15 +103,27 @@ class DateTime(datetime.datetime, Date):
         """
         Creates a new DateTime instance from a specific date and time.
         """
-        if tz is not None:
-            tz = pendulum._safe_timezone(tz)
+        if tz is None:
+            return cls(year, month, day, hour, minute, second, microsecond, fold=fold)
+
+        tz = pendulum._safe_timezone(tz)
+
+        # Fast paths building the instance directly
+        # when the wall time needs no normalization.
+        if isinstance(tz, FixedTimezone):
+            return cls(year, month, day, hour, minute, second, microsecond, tzinfo=tz)
+
+        dt = cls(
+            year, month, day, hour, minute, second, microsecond, tzinfo=tz, fold=fold
+        )
+        if tz is UTC or tz._is_unambiguous(dt):
+            return dt
 
         dt = datetime.datetime(
             year, month, day, hour, minute, second, microsecond, fold=fold
         )
 
-        if tz is not None:
-            dt = tz.convert(dt, raise_on_unknown_times=raise_on_unknown_times)
+        dt = tz.convert(dt, raise_on_unknown_times=raise_on_unknown_times)
 
         return cls(
             dt.year,
@@ -162,13 +178,18 @@ class DateTime(datetime.datetime, Date):
         Get a DateTime instance for the current date and time.
         """
         if tz is None or tz == "local":
-            dt = datetime.datetime.now(local_timezone())
+            tz = local_timezone()
         elif tz is UTC or tz == "UTC":
-            dt = datetime.datetime.now(UTC)
+            tz = UTC
         else:
-            dt = datetime.datetime.now(UTC)
             tz = pendulum._safe_timezone(tz)
-            dt = dt.astimezone(tz)
+
+        if isinstance(tz, FixedTimezone):
+            # Fixed offsets are applied directly to the current UTC time
+            # rather than through the timezone.
+            dt = datetime.datetime.now(UTC) + tz.utcoffset(None)
+        else:
+            dt = datetime.datetime.now(tz)
 
         return cls(
             dt.year,
@@ -178,7 +199,7 @@ class DateTime(datetime.datetime, Date):
             dt.minute,
             dt.second,
             dt.microsecond,
-            tzinfo=dt.tzinfo,
+            tzinfo=tz,
             fold=dt.fold,
         )
 
@@ -578,6 +599,29 @@ class DateTime(datetime.datetime, Date):
         """
         units_of_variable_length = any([years, months, weeks, days])
 
+        tz = self.tz
+        if tz is None or tz is UTC or isinstance(tz, FixedTimezone):
+            # Without DST, moving from the current time or from UTC
+            # gives the same result.
+            if tz is None or (tz is UTC and units_of_variable_length):
+                # Same fold as set by create()
+                fold = 1
+            else:
+                fold = 0
+
+            return self._add_with_fixed_offset(
+                tz,
+                fold,
+                years,
+                months,
+                weeks,
+                days,
+                hours,
+                minutes,
+                seconds,
+                microseconds,
+            )
+
         current_dt = datetime.datetime(
             self.year,
             self.month,
@@ -641,6 +685,78 @@ class DateTime(datetime.datetime, Date):
             fold=dt.fold,
         )
 
+    def _add_with_fixed_offset(
+        self,
+        tz: Timezone | FixedTimezone | None,
+        fold: int,
+        years: int,
+        months: int,
+        weeks: int,
+        days: int,
+        hours: int,
+        minutes: int,
+        seconds: float,
+        microseconds: int,
+    ) -> Self:
+        """
+        Adds a duration to a naive instance or to an instance in a timezone
+        with a fixed offset, using integer arithmetic on the proleptic
+        Gregorian ordinal and the microseconds of the day.
+        """
+        year = self.year
+        month = self.month
+        day = self.day
+
+        if years or months:
+            year, month = divmod(year * 12 + month - 1 + years * 12 + months, 12)
+            month += 1
+            day = min(day, DAYS_PER_MONTHS[int(calendar.isleap(year))][month])
+
+            ordinal = datetime.date(year, month, day).toordinal()
+        else:
+            ordinal = self.toordinal()
+
+        delta = (
+            (((weeks * 7 + days) * 24 + hours) * 60 + minutes) * 60 + seconds
+        ) * 1_000_000 + microseconds
+        if not isinstance(delta, int):
+            # Same rounding as timedelta for fractional units
+            delta = datetime.timedelta(
+                weeks=weeks,
+                days=days,
+                hours=hours,
+                minutes=minutes,
+                seconds=seconds,
+                microseconds=microseconds,
+            ) // _MICROSECOND
+
+        time_of_day = self.hour * 3600 + self.minute * 60 + self.second
+        elapsed, microsecond = divmod(
+            (ordinal * SECONDS_PER_DAY + time_of_day) * 1_000_000
+            + self.microsecond
+            + delta,
+            1_000_000,
+        )
+        ordinal, elapsed = divmod(elapsed, SECONDS_PER_DAY)
+        if not 0 < ordinal <= _MAX_ORDINAL:
+            raise OverflowError("date value out of range")
+
+        date = datetime.date.fromordinal(ordinal)
+        hour, elapsed = divmod(elapsed, 3600)
+        minute, second = divmod(elapsed, 60)
+
+        return self.__class__(
+            date.year,
+            date.month,
+            date.day,
+            hour,
+            minute,
+            second,
+            microsecond,
+            tzinfo=tz,
+            fold=fold,
+        )
+
     def subtract(
         self,
         years: int = 0,
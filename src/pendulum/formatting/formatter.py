@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import datetime
+import os
 import re
+import struct
+import threading
 
+from collections import OrderedDict
 from collections.abc import Sequence
 from re import Match
 from typing import TYPE_CHECKING
@@ -19,6 +23,16 @@ from pendulum.locales.locale import Locale
 if TYPE_CHECKING:
     from pendulum import Timezone
 
+with_extensions = os.getenv("PENDULUM_EXTENSIONS", "1") == "1"
+
+try:
+    if not with_extensions or struct.calcsize("P") == 4:
+        raise ImportError()
+
+    from pendulum._pendulum import FormatMatcher
+except ImportError:
+    FormatMatcher = None  # type: ignore[assignment,misc]
+
 _MATCH_1 = r"\d"
 _MATCH_2 = r"\d\d"
 _MATCH_3 = r"\d{3}"
@@ -241,6 +255,32 @@ class Formatter:
         "z": str,
     }
 
+    # Maximum number of compiled format plans
+    # and parsing patterns kept by a formatter
+    _FORMAT_PLANS_SIZE: ClassVar[int] = 256
+    _PARSE_PATTERNS_SIZE: ClassVar[int] = 256
+
+    _LOCALIZED_NAMES: ClassVar[dict[str, str]] = {
+        "MMM": "translations.months.abbreviated",
+        "MMMM": "translations.months.wide",
+        "dd": "translations.days.short",
+        "ddd": "translations.days.abbreviated",
+        "dddd": "translations.days.wide",
+    }
+
+    def __init__(self) -> None:
+        self._format_plans: OrderedDict[
+            tuple[str, int],
+            tuple[Locale, tuple[Callable[[pendulum.DateTime], str], ...]],
+        ] = OrderedDict()
+        self._parse_patterns: OrderedDict[
+            tuple[str, int], tuple[Locale, re.Pattern[str]]
+        ] = OrderedDict()
+        self._native_matchers: OrderedDict[str, FormatMatcher | None] = OrderedDict()
+        # Formatters are shared between threads,
+        # so the caches are only accessed while holding the lock.
+        self._lock = threading.Lock()
+
     def format(
         self, dt: pendulum.DateTime, fmt: str, locale: str | Locale | None = None
     ) -> str:
@@ -253,16 +293,118 @@ class Formatter:
         """
         loaded_locale: Locale = Locale.load(locale or pendulum.get_locale())
 
-        result = self._FORMAT_RE.sub(
-            lambda m: m.group(1)
-            if m.group(1)
-            else m.group(2)
-            if m.group(2)
-            else self._format_token(dt, m.group(3), loaded_locale),
-            fmt,
-        )
+        return "".join([step(dt) for step in self._get_plan(fmt, loaded_locale)])
+
+    def _get_plan(
+        self, fmt: str, locale: Locale
+    ) -> tuple[Callable[[pendulum.DateTime], str], ...]:
+        """
+        Returns the compiled plan for the given format and locale.
+
+        Plans are kept in a bounded cache, the least recently used
+        being evicted first.
+        """
+        # The locale is stored alongside the plan
+        # so that its id cannot be reused while the entry exists.
+        key = (fmt, id(locale))
+        plans = self._format_plans
+
+        with self._lock:
+            entry = plans.get(key)
+            if entry is not None:
+                plans.move_to_end(key)
+
+                return entry[1]
+
+        plan = tuple(self._compile_format(fmt, locale))
+
+        with self._lock:
+            plans[key] = (locale, plan)
+            if len(plans) > self._FORMAT_PLANS_SIZE:
+                plans.popitem(last=False)
+
+        return plan
+
+    def _compile_format(
+        self, fmt: str, locale: Locale
+    ) -> list[Callable[[pendulum.DateTime], str]]:
+        """
+        Compiles a format into a list of steps
+        which, once applied to an instance, produce the formatted string.
+
+        :param fmt: The format to compile
+        :param locale: The locale to use
+        """
+        steps: list[Callable[[pendulum.DateTime], str]] = []
+        literal = ""
+        position = 0
+
+        for m in self._FORMAT_RE.finditer(fmt):
+            literal += fmt[position : m.start()]
+            position = m.end()
 
-        return result
+            if m.group(1) or m.group(2):
+                literal += m.group(1) or m.group(2)
+
+                continue
+
+            token = m.group(3)
+            if token in self._DATE_FORMATS:
+                date_fmt = locale.get(f"custom.date_formats.{token}")
+                if date_fmt is None:
+                    date_fmt = self._DEFAULT_DATE_FORMATS[token]
+
+                token_steps = self._compile_format(date_fmt, locale)
+            else:
+                token_steps = [self._compile_token(token, locale)]
+
+            if literal:
+                steps.append(_literal(literal))
+                literal = ""
+
+            steps.extend(token_steps)
+
+        literal += fmt[position:]
+        if literal:
+            steps.append(_literal(literal))
+
+        return steps
+
+    def _compile_token(
+        self, token: str, locale: Locale
+    ) -> Callable[[pendulum.DateTime], str]:
+        """
+        Returns a function formatting a given token of an instance.
+
+        :param token: The token to compile
+        :param locale: The locale to use
+        """
+        if token in self._LOCALIZABLE_TOKENS:
+            if token in {"MMM", "MMMM"}:
+                months = locale.get(self._LOCALIZED_NAMES[token])
+
+                return lambda dt: cast(str, months[dt.month])
+
+            if token in {"dd", "ddd", "dddd"}:
+                days = locale.get(self._LOCALIZED_NAMES[token])
+
+                return lambda dt: cast(str, days[dt.day_of_week])
+
+            if token == "A":
+                am = cast(str, locale.get("translations.day_periods.am"))
+                pm = cast(str, locale.get("translations.day_periods.pm"))
+
+                return lambda dt: pm if dt.hour >= 12 else am
+
+            return lambda dt: self._format_localizable_token(dt, token, locale)
+
+        if token in self._TOKENS_RULES:
+            return self._TOKENS_RULES[token]
+
+        if token in ["ZZ", "Z"]:
+            return lambda dt: self._format_token(dt, token, locale)
+
+        return _literal(token)
 
     def _format_token(self, dt: pendulum.DateTime, token: str, locale: Locale) -> str:
         """
@@ -374,12 +516,6 @@ class Formatter:
 
         :return: The parsed elements
         """
-        escaped_fmt = re.escape(fmt)
-
-        tokens = self._FROM_FORMAT_RE.findall(escaped_fmt)
-        if not tokens:
-            raise ValueError("The given time string does not match the given format")
-
         if not locale:
             locale = pendulum.get_locale()
 
@@ -401,20 +537,93 @@ class Formatter:
             "timestamp": None,
         }
 
-        pattern = self._FROM_FORMAT_RE.sub(
-            lambda m: self._replace_tokens(m.group(0), loaded_locale), escaped_fmt
-        )
+        # Formats made only of locale-independent tokens
+        # are handled by the native matcher, when available.
+        # Strings it rejects go through the regular path,
+        # which reports the proper error.
+        matcher = self._get_native_matcher(fmt)
+        if matcher is not None:
+            native_parsed = matcher.parse(time)
 
-        if not re.search("^" + pattern + "$", time):
-            raise ValueError(f"String does not match format {fmt}")
+            if native_parsed is not None:
+                if native_parsed["tz"] is not None:
+                    native_parsed["tz"] = pendulum.timezone(native_parsed["tz"])
 
-        def _get_parsed_values(m: Match[str]) -> Any:
-            return self._get_parsed_values(m, parsed, loaded_locale, now)
+                return self._check_parsed(native_parsed, now)
 
-        re.sub(pattern, _get_parsed_values, time)
+        m = self._get_parse_pattern(fmt, loaded_locale).match(time)
+        if m is None:
+            raise ValueError(f"String does not match format {fmt}")
+
+        self._get_parsed_values(m, parsed, loaded_locale, now)
 
         return self._check_parsed(parsed, now)
 
+    def _get_native_matcher(self, fmt: str) -> FormatMatcher | None:
+        """
+        Returns the native matcher for the given format,
+        or None if the format is not supported natively.
+        """
+        if FormatMatcher is None:
+            return None
+
+        matchers = self._native_matchers
+        with self._lock:
+            if fmt in matchers:
+                matchers.move_to_end(fmt)
+
+                return matchers[fmt]
+
+        matcher: FormatMatcher | None
+        try:
+            matcher = FormatMatcher(fmt)
+        except ValueError:
+            matcher = None
+
+        with self._lock:
+            matchers[fmt] = matcher
+            if len(matchers) > self._PARSE_PATTERNS_SIZE:
+                matchers.popitem(last=False)
+
+        return matcher
+
+    def _get_parse_pattern(self, fmt: str, locale: Locale) -> re.Pattern[str]:
+        """
+        Returns the compiled regular expression matching the given format.
+
+        Patterns are kept in a bounded cache, the least recently used
+        being evicted first.
+        """
+        # The locale is stored alongside the pattern
+        # so that its id cannot be reused while the entry exists.
+        key = (fmt, id(locale))
+        patterns = self._parse_patterns
+
+        with self._lock:
+            entry = patterns.get(key)
+            if entry is not None:
+                patterns.move_to_end(key)
+
+                return entry[1]
+
+        escaped_fmt = re.escape(fmt)
+
+        tokens = self._FROM_FORMAT_RE.findall(escaped_fmt)
+        if not tokens:
+            raise ValueError("The given time string does not match the given format")
+
+        pattern = self._FROM_FORMAT_RE.sub(
+            lambda m: self._replace_tokens(m.group(0), locale), escaped_fmt
+        )
+        compiled = re.compile("^" + pattern + "$")
+
+        with self._lock:
+            patterns[key] = (locale, compiled)
+            if len(patterns) > self._PARSE_PATTERNS_SIZE:
+                patterns.popitem(last=False)
+
+        return compiled
+
     def _check_parsed(
         self, parsed: dict[str, Any], now: pendulum.DateTime
     ) -> dict[str, Any]:
@@ -545,11 +754,11 @@ class Formatter:
         locale: Locale,
         now: pendulum.DateTime,
     ) -> None:
-        for token, index in m.re.groupindex.items():
+        for token, value in m.groupdict().items():
             if token in self._LOCALIZABLE_TOKENS:
-                self._get_parsed_locale_value(token, m.group(index), parsed, locale)
+                self._get_parsed_locale_value(token, value, parsed, locale)
             else:
-                self._get_parsed_value(token, m.group(index), parsed, now)
+                self._get_parsed_value(token, value, parsed, now)
 
     def _get_parsed_value(
         self,
@@ -696,3 +905,7 @@ class Formatter:
         pattern = f'(?P<{token}>{"|".join(candidates)})'
 
         return pattern
+
+
+def _literal(value: str) -> Callable[[pendulum.DateTime], str]:
+    return lambda _: value
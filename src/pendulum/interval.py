@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-import operator
+import copy
 
+from collections.abc import Sequence
 from datetime import date
 from datetime import datetime
 from datetime import timedelta
@@ -16,6 +17,10 @@ import pendulum
 from pendulum.constants import MONTHS_PER_YEAR
 from pendulum.duration import Duration
 from pendulum.helpers import precise_diff
+from pendulum.tz import UTC
+from pendulum.tz.timezone import FixedTimezone
+from pendulum.tz.timezone import Timezone
+from pendulum.tz.transitions import transition_table
 
 
 if TYPE_CHECKING:
@@ -24,12 +29,29 @@ if TYPE_CHECKING:
     from typing_extensions import Self
     from typing_extensions import SupportsIndex
 
+    from pendulum.datetime import DateTime
     from pendulum.helpers import PreciseDiff
     from pendulum.locales.locale import Locale
+    from pendulum.tz.transitions import TransitionTable
 
 
 _T = TypeVar("_T", bound=date)
 
+# The units by which interval ranges can step, with their size
+_MONTH_UNITS = {"months": 1, "years": MONTHS_PER_YEAR}
+_DAY_UNITS = {"days": 1, "weeks": 7}
+_EXACT_UNITS = {
+    "microseconds": 1,
+    "seconds": 1_000_000,
+    "minutes": 60_000_000,
+    "hours": 3_600_000_000,
+}
+
+_DAY = 86_400_000_000
+_MICROSECOND = timedelta(microseconds=1)
+_MAX_ORDINAL = date.max.toordinal()
+_UNIX_EPOCH = date(1970, 1, 1).toordinal() * _DAY
+
 
 class Interval(Duration, Generic[_T]):
     """
@@ -290,22 +312,20 @@ class Interval(Duration, Generic[_T]):
 
         return separator.join(parts)
 
-    def range(self, unit: str, amount: int = 1) -> Iterator[_T]:
-        method = "add"
-        op = operator.le
-        if not self._absolute and self.invert:
-            method = "subtract"
-            op = operator.ge
-
-        start, end = self.start, self.end
+    def range(self, unit: str, amount: int = 1) -> IntervalRange[_T]:
+        """
+        Returns the dates of the interval, from its start,
+        stepping by the given amount of the given unit.
 
-        i = amount
-        while op(start, end):
-            yield start
+        The dates are computed lazily.
+        """
+        if amount <= 0:
+            raise ValueError("The amount must be greater than 0")
 
-            start = getattr(self.start, method)(**{unit: i})
+        if not self._absolute and self.invert:
+            amount = -amount
 
-            i += amount
+        return IntervalRange(self.start, self.end, unit, amount)
 
     def as_duration(self) -> Duration:
         """
@@ -314,7 +334,7 @@ class Interval(Duration, Generic[_T]):
         return Duration(seconds=self.total_seconds())
 
     def __iter__(self) -> Iterator[_T]:
-        return self.range("days")
+        return iter(self.range("days"))
 
     def __contains__(self, item: _T) -> bool:
         return self.start <= item <= self.end
@@ -418,3 +438,274 @@ class Interval(Duration, Generic[_T]):
 
     def __ne__(self, other: object) -> bool:
         return not self.__eq__(other)
+
+
+class IntervalRange(Sequence[_T]):
+    """
+    The dates from a start to an end, stepping by an amount of a unit.
+
+    Dates are computed on demand and the length, indexing, slicing
+    and membership tests do not need to go through the whole range.
+    """
+
+    def __init__(self, start: _T, end: _T, unit: str, step: int) -> None:
+        self._start = start
+        self._end = end
+        self._unit = unit
+        self._step = step
+        self._indices: range | None = None
+
+    @property
+    def _range(self) -> range:
+        # The step numbers of the dates, computed on first use
+        if self._indices is None:
+            self._indices = range(self._count())
+
+        return self._indices
+
+    def __len__(self) -> int:
+        return len(self._range)
+
+    @overload
+    def __getitem__(self, index: int) -> _T:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> IntervalRange[_T]:
+        ...
+
+    def __getitem__(self, index: int | slice) -> _T | IntervalRange[_T]:
+        if isinstance(index, slice):
+            sliced = copy.copy(self)
+            sliced._indices = self._range[index]
+
+            return sliced
+
+        return self._at(self._range[index])
+
+    def __iter__(self) -> Iterator[_T]:
+        start = self._start
+        if isinstance(start, pendulum.DateTime) and (
+            start.tzinfo is None or isinstance(start.tzinfo, (Timezone, FixedTimezone))
+        ):
+            # Consecutive dates are derived from one another
+            # instead of adding a duration to the start for each of them.
+            if self._unit in _DAY_UNITS:
+                days = _DAY_UNITS[self._unit] * self._step
+
+                return cast("Iterator[_T]", _day_steps(start, days, self._range))
+
+            if self._unit in _EXACT_UNITS:
+                size = _EXACT_UNITS[self._unit] * self._step
+                steps = _exact_steps(start, size, self._range)
+                if steps is not None:
+                    return cast("Iterator[_T]", steps)
+
+        return map(self._at, self._range)
+
+    def __contains__(self, item: object) -> bool:
+        if not isinstance(item, date) or isinstance(item, datetime) != isinstance(
+            self._start, datetime
+        ):
+            return False
+
+        try:
+            estimate = self._estimate(item)
+        except TypeError:
+            # Naive and aware datetimes
+            return False
+
+        if self._unit in _EXACT_UNITS:
+            candidates: tuple[int, ...] = (estimate,)
+        else:
+            candidates = (estimate - 1, estimate, estimate + 1)
+
+        return any(i in self._range and self._at(i) == item for i in candidates)
+
+    def __repr__(self) -> str:
+        return (
+            f"<IntervalRange [{self._start} -> {self._end}]"
+            f" by {abs(self._step)} {self._unit}>"
+        )
+
+    def _at(self, i: int) -> _T:
+        if i == 0:
+            return self._start
+
+        add = self._start.add  # type: ignore[attr-defined]
+
+        return cast(_T, add(**{self._unit: i * self._step}))
+
+    def _reaches(self, i: int) -> bool:
+        """
+        Returns whether the date at the given step number
+        is not past the end.
+        """
+        try:
+            dt = self._at(i)
+        except (OverflowError, ValueError):
+            # Out of the supported range
+            return False
+
+        if self._step > 0:
+            return dt <= self._end
+
+        return dt >= self._end
+
+    def _count(self) -> int:
+        if not self._reaches(0):
+            return 0
+
+        # The dates are monotonic in the step number,
+        # so the estimate only needs to be adjusted by a step or two.
+        n = max(self._estimate(self._end), 0)
+        while n > 0 and not self._reaches(n):
+            n -= 1
+
+        while self._reaches(n + 1):
+            n += 1
+
+        return n + 1
+
+    def _estimate(self, dt: date) -> int:
+        """
+        Estimates the step number of the given date,
+        from the calendar or from the elapsed time depending on the unit.
+        """
+        start = self._start
+        if self._unit in _MONTH_UNITS:
+            distance = (dt.year - start.year) * MONTHS_PER_YEAR + dt.month - start.month
+            size = _MONTH_UNITS[self._unit]
+        elif self._unit in _DAY_UNITS:
+            distance = dt.toordinal() - start.toordinal()
+            size = _DAY_UNITS[self._unit]
+        elif self._unit in _EXACT_UNITS:
+            distance = _microseconds(dt) - _microseconds(start)
+            size = _EXACT_UNITS[self._unit]
+        else:
+            return 0
+
+        return distance // (size * self._step)
+
+
+def _day_steps(start: DateTime, days: int, indices: range) -> Iterator[DateTime]:
+    """
+    Yields the dates at the given step numbers of a range stepping
+    by a number of days, with the same wall time as the start.
+    """
+    ordinal = start.toordinal()
+    create = start.create
+    time = (start.hour, start.minute, start.second, start.microsecond)
+    tz = start.tzinfo
+
+    for i in indices:
+        if i == 0:
+            yield start
+            continue
+
+        if not 0 < ordinal + i * days <= _MAX_ORDINAL:
+            raise OverflowError("date value out of range")
+
+        day = date.fromordinal(ordinal + i * days)
+
+        yield create(day.year, day.month, day.day, *time, tz=tz)
+
+
+def _exact_steps(
+    start: DateTime, size: int, indices: range
+) -> Iterator[DateTime] | None:
+    """
+    Returns an iterator over the dates at the given step numbers of a range
+    stepping by a number of microseconds, or None if the transitions
+    of the timezone of the start cannot be looked up.
+    """
+    tz = start.tzinfo
+    if isinstance(tz, Timezone) and tz is not UTC:
+        try:
+            table = transition_table(tz.key)
+        except (OSError, ValueError, ImportError, TypeError):
+            # Zones which are not loaded from a key cannot be looked up
+            return None
+
+        return _walk(start, size, indices, table)
+
+    return _walk(start, size, indices, None)
+
+
+def _walk(
+    start: DateTime, size: int, indices: range, table: TransitionTable | None
+) -> Iterator[DateTime]:
+    # The UTC instants of the dates are computed in microseconds
+    # and the UTC offset is only looked up again once they leave
+    # the period between the two transitions around the previous one.
+    cls = start.__class__
+    tz = start.tzinfo
+    instant = _microseconds(start)
+
+    # Without a table, the UTC offset and the fold never change
+    # and naive datetimes get the same fold as set by create().
+    offset = start.utcoffset() // _MICROSECOND if tz is not None else 0
+    fold = 1 if tz is None else 0
+    period_start = period_end = folded_until = 0
+
+    ordinal = year = month = day = 0
+    for i in indices:
+        if i == 0:
+            yield start
+            continue
+
+        utc = instant + i * size
+        if table is not None:
+            if not period_start <= utc < period_end:
+                seconds = (utc - _UNIX_EPOCH) // 1_000_000
+                begin, end, current = table.period(seconds)
+                previous = table.type_at(table.index(seconds) - 1)
+
+                period_start = begin * 1_000_000 + _UNIX_EPOCH
+                period_end = end * 1_000_000 + _UNIX_EPOCH
+                offset = current.offset * 1_000_000
+                # The wall times repeated after a backward transition
+                repeated = (previous.offset - current.offset) * 1_000_000
+                folded_until = period_start + repeated
+
+            fold = 1 if utc < folded_until else 0
+
+        days, elapsed = divmod(utc + offset, _DAY)
+        if days != ordinal:
+            if not 0 < days <= _MAX_ORDINAL:
+                raise OverflowError("date value out of range")
+
+            ordinal = days
+            current_day = date.fromordinal(days)
+            year, month, day = current_day.year, current_day.month, current_day.day
+
+        elapsed, microsecond = divmod(elapsed, 1_000_000)
+        hour, elapsed = divmod(elapsed, 3600)
+        minute, second = divmod(elapsed, 60)
+
+        yield cls(
+            year,
+            month,
+            day,
+            hour,
+            minute,
+            second,
+            microsecond,
+            tzinfo=tz,
+            fold=fold,
+        )
+
+
+def _microseconds(dt: date) -> int:
+    # Microseconds since the start of the proleptic Gregorian calendar,
+    # in UTC for aware datetimes.
+    value = dt.toordinal() * _DAY
+    if isinstance(dt, datetime):
+        value += (dt.hour * 3600 + dt.minute * 60 + dt.second) * 1_000_000
+        value += dt.microsecond
+
+        offset = dt.utcoffset()
+        if offset is not None:
+            value -= offset // _MICROSECOND
+
+    return value
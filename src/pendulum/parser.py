@@ -1,14 +1,21 @@
 from __future__ import annotations
 
 import datetime
+import struct
+import threading
 import typing as t
 
+from collections import OrderedDict
+
 import pendulum
 
 from pendulum.duration import Duration
 from pendulum.parsing import _Interval
 from pendulum.parsing import parse as base_parse
+from pendulum.parsing import try_parse as base_try_parse
+from pendulum.parsing import with_extensions
 from pendulum.tz.timezone import UTC
+from pendulum.tz.timezone import FixedTimezone
 
 
 if t.TYPE_CHECKING:
@@ -22,27 +29,73 @@ try:
 except ImportError:
     RustDuration = None  # type: ignore[assignment,misc]
 
+try:
+    if not with_extensions or struct.calcsize("P") == 4:
+        raise ImportError()
+
+    from pendulum._pendulum import parse_iso8601_datetime
+except ImportError:
+    parse_iso8601_datetime = None  # type: ignore[assignment]
+
 
 def parse(text: str, **options: t.Any) -> Date | Time | DateTime | Duration:
     # Use the mock now value if it exists
     options["now"] = options.get("now")
 
+    if options.pop("cache", False):
+        return _cached_parser.parse(text, **options)
+
     return _parse(text, **options)
 
 
+def try_parse(
+    text: str, default: t.Any = None, **options: t.Any
+) -> Date | Time | DateTime | Duration | t.Any:
+    """
+    Parses a string with the given options,
+    returning default instead of raising if it cannot be parsed.
+
+    :param text: The string to parse.
+    :param default: The value to return for invalid strings.
+    """
+    return parse(text, default=default, **options)
+
+
 def _parse(
     text: str, **options: t.Any
 ) -> Date | DateTime | Time | Duration | Interval[DateTime]:
     """
     Parses a string with the given options.
 
+    If a default option is given, it is returned for invalid strings
+    and no exception is raised along the way.
+
     :param text: The string to parse.
     """
     # Handling special cases
     if text == "now":
         return pendulum.now()
 
-    parsed = base_parse(text, **options)
+    tz = options.get("tz", UTC)
+
+    # Datetimes in UTC or at a fixed offset do not need any DST resolution
+    # so the extension can build the final DateTime directly.
+    if parse_iso8601_datetime is not None and (
+        tz is UTC or isinstance(tz, FixedTimezone)
+    ):
+        dt = parse_iso8601_datetime(text, tz)
+
+        if dt is not None:
+            return dt
+
+    if "default" in options:
+        default = options.pop("default")
+        parsed = base_try_parse(text, **options)
+
+        if parsed is None:
+            return default  # type: ignore[no-any-return]
+    else:
+        parsed = base_parse(text, **options)
 
     if isinstance(parsed, datetime.datetime):
         return pendulum.datetime(
@@ -128,3 +181,95 @@ def _parse(
         )
 
     raise NotImplementedError
+
+
+# Returned in place of the default for invalid strings
+_INVALID = object()
+
+
+class CacheInfo(t.NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class CachedParser:
+    """
+    A parser remembering its most recent results.
+
+    Parsed values are immutable, so repeated strings parsed with the same
+    options share the instance built the first time.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self._maxsize = maxsize
+        self._results: OrderedDict[
+            tuple[t.Any, ...], Date | Time | DateTime | Duration
+        ] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        # The cache is shared between threads
+        self._lock = threading.Lock()
+
+    def parse(self, text: str, **options: t.Any) -> Date | Time | DateTime | Duration:
+        options["now"] = options.get("now")
+
+        # Lenient parsing may fill missing fields from the current date,
+        # so only strict results are remembered.
+        if text == "now" or not options.get("strict", True):
+            return _parse(text, **options)
+
+        exact = options.get("exact", False)
+        key = (text, options.get("tz", UTC), options.get("day_first", False), exact)
+
+        with self._lock:
+            cached = self._results.get(key)
+            if cached is not None:
+                self._hits += 1
+                self._results.move_to_end(key)
+
+                return cached
+
+            self._misses += 1
+
+        # Exactness only changes how valid strings are completed,
+        # so invalid ones fail here as they would on the regular path.
+        if "default" in options:
+            parsed = _parse(text, **{**options, "exact": True, "default": _INVALID})
+            if parsed is _INVALID:
+                return options["default"]  # type: ignore[no-any-return]
+        else:
+            parsed = _parse(text, **{**options, "exact": True})
+
+        if not exact:
+            if isinstance(parsed, datetime.time):
+                # Times are completed with the current date
+                return _parse(text, **options)
+
+            if isinstance(parsed, datetime.date) and not isinstance(
+                parsed, datetime.datetime
+            ):
+                parsed = pendulum.datetime(
+                    parsed.year, parsed.month, parsed.day, tz=options.get("tz", UTC)
+                )
+
+        if self._maxsize > 0:
+            with self._lock:
+                self._results[key] = parsed
+
+                if len(self._results) > self._maxsize:
+                    self._results.popitem(last=False)
+
+        return parsed
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self._hits, self._misses, self._maxsize, len(self._results))
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+            self._hits = self._misses = 0
+
+
+_cached_parser = CachedParser()
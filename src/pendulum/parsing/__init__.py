@@ -9,13 +9,28 @@ import struct
 from datetime import date
 from datetime import datetime
 from datetime import time
+from datetime import timezone
+from typing import IO
+from typing import TYPE_CHECKING
 from typing import Any
+from typing import Callable
+from typing import Iterator
 from typing import Optional
 from typing import cast
 
 from dateutil import parser
 
+import pendulum
+
+from pendulum.constants import SECONDS_PER_DAY
 from pendulum.parsing.exceptions import ParserError
+from pendulum.tz.timezone import UTC
+
+
+if TYPE_CHECKING:
+    from pendulum.datetime import DateTime
+    from pendulum.tz.timezone import FixedTimezone
+    from pendulum.tz.timezone import Timezone
 
 
 with_extensions = os.getenv("PENDULUM_EXTENSIONS", "1") == "1"
@@ -26,9 +41,21 @@ try:
 
     from pendulum._pendulum import Duration
     from pendulum._pendulum import parse_iso8601
+    from pendulum._pendulum import parse_iso8601_interval
+    from pendulum._pendulum import parse_iso8601_many
+    from pendulum._pendulum import try_parse_iso8601
 except ImportError:
     from pendulum.duration import Duration  # type: ignore[assignment]
     from pendulum.parsing.iso8601 import parse_iso8601  # type: ignore[assignment]
+    from pendulum.parsing.iso8601 import (  # type: ignore[assignment]
+        parse_iso8601_interval,
+    )
+    from pendulum.parsing.iso8601 import (  # type: ignore[assignment]
+        parse_iso8601_many,
+    )
+    from pendulum.parsing.iso8601 import (  # type: ignore[assignment]
+        try_parse_iso8601,
+    )
 
 
 COMMON = re.compile(
@@ -107,16 +134,29 @@ def _normalize(
     return parsed
 
 
-def _parse(text: str, **options: Any) -> datetime | date | time | _Interval | Duration:
-    # Trying to parse ISO8601
-    with contextlib.suppress(ValueError):
-        return parse_iso8601(text)
+def try_parse(
+    text: str, **options: Any
+) -> datetime | date | time | _Interval | Duration | None:
+    """
+    Parses a string with the given options
+    but returns None instead of raising if it cannot be parsed.
 
-    with contextlib.suppress(ValueError):
-        return _parse_iso8601_interval(text)
+    :param text: The string to parse.
+    """
+    _options: dict[str, Any] = copy.copy(DEFAULT_OPTIONS)
+    _options.update(options)
+
+    parsed = _try_parse(text, **_options)
+    if parsed is None:
+        return None
+
+    return _normalize(parsed, **_options)
 
-    with contextlib.suppress(ParserError):
-        return _parse_common(text, **options)
+
+def _parse(text: str, **options: Any) -> datetime | date | time | _Interval | Duration:
+    parsed = _parse_known_formats(text, **options)
+    if parsed is not None:
+        return parsed
 
     # We couldn't parse the string
     # so we fallback on the dateutil parser
@@ -134,21 +174,61 @@ def _parse(text: str, **options: Any) -> datetime | date | time | _Interval | Du
     return dt
 
 
-def _parse_common(text: str, **options: Any) -> datetime | date | time:
+def _try_parse(
+    text: str, **options: Any
+) -> datetime | date | time | _Interval | Duration | None:
+    parsed = _parse_known_formats(text, **options)
+    if parsed is not None or options.get("strict", True):
+        return parsed
+
+    try:
+        return parser.parse(
+            text, dayfirst=options["day_first"], yearfirst=options["year_first"]
+        )
+    except (ValueError, OverflowError):
+        # dateutil raises OverflowError for out of range numbers
+        return None
+
+
+def _parse_known_formats(
+    text: str, **options: Any
+) -> datetime | date | time | _Interval | Duration | None:
     """
-    Tries to parse the string as a common datetime format.
+    Tries the ISO 8601 and common formats in turn.
 
-    :param text: The string to parse.
+    Strings which do not look like any of them are rejected
+    without raising, so that invalid data is cheap to skip.
     """
+    if "/" in text:
+        # Only intervals may contain a slash in ISO 8601
+        with contextlib.suppress(ValueError):
+            return _parse_iso8601_interval(text)
+    else:
+        parsed = try_parse_iso8601(text)
+        if parsed is not None:
+            return parsed
+
     m = COMMON.match(text)
+    if m is None:
+        return None
+
+    with contextlib.suppress(ValueError):
+        return _parse_common(m, **options)
+
+    return None
+
+
+def _parse_common(m: re.Match[str], **options: Any) -> datetime | date | time:
+    """
+    Builds the value matched by the common datetime format.
+
+    :param m: The match of the COMMON pattern.
+    """
     has_date = False
     year = 0
     month = 1
     day = 1
 
-    if not m:
-        raise ParserError("Invalid datetime string")
-
     if m.group("date"):
         # A date has been specified
         has_date = True
@@ -211,25 +291,200 @@ def _parse_iso8601_interval(text: str) -> _Interval:
     if "/" not in text:
         raise ParserError("Invalid interval")
 
-    first, last = text.split("/")
-    start = end = duration = None
-
-    if first[:1] == "P":
-        # duration/end
-        duration = parse_iso8601(first)
-        end = parse_iso8601(last)
-    elif last[:1] == "P":
-        # start/duration
-        start = parse_iso8601(first)
-        duration = parse_iso8601(last)
-    else:
-        # start/end
-        start = parse_iso8601(first)
-        end = parse_iso8601(last)
+    start, end, duration = parse_iso8601_interval(text)
 
     return _Interval(
         cast(datetime, start), cast(datetime, end), cast(Duration, duration)
     )
 
 
-__all__ = ["parse", "parse_iso8601"]
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_NAIVE_EPOCH = datetime(1970, 1, 1)
+
+
+def iter_parse(
+    source: str | os.PathLike[str] | IO[Any],
+    column: int | None = None,
+    delimiter: str | None = None,
+    pattern: str | re.Pattern[str] | None = None,
+    span: tuple[int, int] | None = None,
+    tz: str | Timezone | FixedTimezone = UTC,
+    raw: bool = False,
+    skip_invalid: bool = False,
+    batch_size: int = 4096,
+    buffer_size: int = 1 << 20,
+    encoding: str = "utf-8",
+) -> Iterator[DateTime | int]:
+    """
+    Parses the ISO 8601 timestamp found on each line of a file.
+
+    The file is read in large buffered chunks and the timestamps
+    are parsed in batches, so memory stays flat whatever the size of the file.
+
+    By default, the whole line is the timestamp. Otherwise, it is extracted
+    by the index of a field separated by delimiter (whitespace by default),
+    by a regular expression (its first group if it has any)
+    or by the (start, end) offsets of the timestamp on the line.
+    Offsets are in bytes for binary files.
+
+    :param source: A path or a file object opened in text or binary mode.
+    :param tz: The timezone of timestamps without an offset.
+    :param raw: Whether to yield POSIX timestamps instead of DateTime instances.
+    :param skip_invalid: Whether to skip lines without a valid timestamp
+        instead of raising a ParserError.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb", buffering=buffer_size) as f:
+            yield from iter_parse(
+                f,
+                column=column,
+                delimiter=delimiter,
+                pattern=pattern,
+                span=span,
+                tz=tz,
+                raw=raw,
+                skip_invalid=skip_invalid,
+                batch_size=batch_size,
+                encoding=encoding,
+            )
+
+        return
+
+    extract: Callable[[Any], Any] | None = None
+    texts: list[str] = []
+    line_numbers: list[int] = []
+
+    for line_number, line in enumerate(source, 1):
+        if extract is None:
+            extract = _get_extractor(
+                isinstance(line, bytes), column, delimiter, pattern, span
+            )
+
+        text = extract(line)
+        if text is None:
+            if not skip_invalid:
+                # The valid lines before this one are yielded first,
+                # as they are for an invalid timestamp.
+                yield from _convert_batch(texts, line_numbers, tz, raw, skip_invalid)
+
+                raise ParserError(f"No timestamp found on line {line_number}")
+
+            continue
+
+        if isinstance(text, bytes):
+            text = text.decode(encoding)
+
+        texts.append(text.strip())
+        line_numbers.append(line_number)
+
+        if len(texts) >= batch_size:
+            yield from _convert_batch(texts, line_numbers, tz, raw, skip_invalid)
+
+            texts = []
+            line_numbers = []
+
+    if texts:
+        yield from _convert_batch(texts, line_numbers, tz, raw, skip_invalid)
+
+
+def _get_extractor(
+    binary: bool,
+    column: int | None,
+    delimiter: str | None,
+    pattern: str | re.Pattern[str] | None,
+    span: tuple[int, int] | None,
+) -> Callable[[Any], Any]:
+    if column is not None:
+        sep: str | bytes | None = delimiter
+        if binary and delimiter is not None:
+            sep = delimiter.encode()
+
+        def extract_column(line: Any) -> Any:
+            fields = line.split(sep)
+
+            return fields[column] if -len(fields) <= column < len(fields) else None
+
+        return extract_column
+
+    if pattern is not None:
+        regex: re.Pattern[Any]
+        if isinstance(pattern, str):
+            regex = re.compile(pattern.encode() if binary else pattern)
+        elif binary and isinstance(pattern.pattern, str):
+            regex = re.compile(pattern.pattern.encode(), pattern.flags & ~re.UNICODE)
+        else:
+            regex = pattern
+
+        group = 1 if regex.groups else 0
+
+        def extract_match(line: Any) -> Any:
+            m = regex.search(line)
+
+            return m.group(group) if m else None
+
+        return extract_match
+
+    if span is not None:
+        start, end = span
+
+        def extract_span(line: Any) -> Any:
+            return line[start:end] or None
+
+        return extract_span
+
+    return lambda line: line
+
+
+def _convert_batch(
+    texts: list[str],
+    line_numbers: list[int],
+    tz: str | Timezone | FixedTimezone,
+    raw: bool,
+    skip_invalid: bool,
+) -> Iterator[DateTime | int]:
+    values, failures = parse_iso8601_many(texts, errors=True)
+
+    for text, line_number, value, failure in zip(texts, line_numbers, values, failures):
+        if failure is None and isinstance(value, (datetime, date)):
+            if not isinstance(value, datetime):
+                value = datetime(value.year, value.month, value.day)
+
+            if not raw:
+                yield pendulum.datetime(
+                    value.year,
+                    value.month,
+                    value.day,
+                    value.hour,
+                    value.minute,
+                    value.second,
+                    value.microsecond,
+                    tz=value.tzinfo or tz,
+                )
+            elif value.tzinfo is not None:
+                delta = value - _EPOCH
+
+                yield delta.days * SECONDS_PER_DAY + delta.seconds
+            elif tz is UTC:
+                delta = value - _NAIVE_EPOCH
+
+                yield delta.days * SECONDS_PER_DAY + delta.seconds
+            else:
+                yield pendulum.instance(value, tz=tz).int_timestamp
+
+            continue
+
+        if not skip_invalid:
+            raise ParserError(
+                f"Invalid timestamp on line {line_number}: {text}"
+            ) from failure
+
+
+__all__ = [
+    "iter_parse",
+    "parse",
+    "parse_iso8601",
+    "parse_iso8601_interval",
+    "parse_iso8601_many",
+    "try_parse",
+    "try_parse_iso8601",
+]
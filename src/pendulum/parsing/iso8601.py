@@ -3,7 +3,10 @@ from __future__ import annotations
 import datetime
 import re
 
+from typing import TYPE_CHECKING
+from typing import Any
 from typing import cast
+from typing import overload
 
 from pendulum.constants import HOURS_PER_DAY
 from pendulum.constants import MINUTES_PER_HOUR
@@ -15,11 +18,18 @@ from pendulum.helpers import is_leap
 from pendulum.helpers import is_long_year
 from pendulum.helpers import week_day
 from pendulum.parsing.exceptions import ParserError
+from pendulum.tz import fixed_timezone
 from pendulum.tz.timezone import UTC
 from pendulum.tz.timezone import FixedTimezone
 from pendulum.tz.timezone import Timezone
 
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from typing_extensions import Literal
+
+
 ISO8601_DT = re.compile(
     # Date (optional)  # noqa: ERA001
     "^"
@@ -82,7 +92,7 @@ ISO8601_DURATION = re.compile(
 
 
 def parse_iso8601(
-    text: str,
+    text: str, utc: bool = False
 ) -> datetime.datetime | datetime.date | datetime.time | Duration:
     """
     ISO 8601 compliant parser.
@@ -90,15 +100,42 @@ def parse_iso8601(
     :param text: The string to parse
     :type text: str
 
+    :param utc: Whether zero offsets should be mapped to UTC
+    :type utc: bool
+
     :rtype: datetime.datetime or datetime.time or datetime.date
     """
+    parsed = _parse_iso8601(text, utc)
+    if parsed is None:
+        raise ParserError("Invalid ISO 8601 string")
+
+    return parsed
+
+
+def try_parse_iso8601(
+    text: str, utc: bool = False
+) -> datetime.datetime | datetime.date | datetime.time | Duration | None:
+    """
+    Same as parse_iso8601() but returns None for invalid strings.
+    """
+    try:
+        return _parse_iso8601(text, utc)
+    except ValueError:
+        return None
+
+
+def _parse_iso8601(
+    text: str, utc: bool
+) -> datetime.datetime | datetime.date | datetime.time | Duration | None:
+    # Strings which do not look like ISO 8601 at all
+    # are rejected without raising.
     parsed = _parse_iso8601_duration(text)
     if parsed is not None:
         return parsed
 
     m = ISO8601_DT.match(text)
     if not m:
-        raise ParserError("Invalid ISO 8601 string")
+        return None
 
     ambiguous_date = False
     is_date = False
@@ -252,7 +289,7 @@ def parse_iso8601(
             if negative:
                 offset = -1 * offset
 
-            tzinfo = FixedTimezone(offset)
+            tzinfo = UTC if utc and offset == 0 else fixed_timezone(offset)
 
     if is_time:
         return datetime.time(hour, minute, second, microsecond, tzinfo=tzinfo)
@@ -262,6 +299,107 @@ def parse_iso8601(
     )
 
 
+def parse_iso8601_interval(
+    text: str, utc: bool = False
+) -> tuple[
+    datetime.datetime | datetime.date | datetime.time | None,
+    datetime.datetime | datetime.date | datetime.time | None,
+    Duration | None,
+]:
+    """
+    Parses an ISO 8601 interval.
+
+    Returns a (start, end, duration) tuple where either end or duration
+    (start/end and start/duration intervals) or start
+    (duration/end intervals) is None.
+    """
+    if "/" not in text:
+        raise ParserError("Invalid interval")
+
+    first, last = text.split("/")
+    start = end = duration = None
+
+    if first[:1] == "P":
+        # duration/end
+        duration = parse_iso8601(first, utc=utc)
+        end = parse_iso8601(last, utc=utc)
+    elif last[:1] == "P":
+        # start/duration
+        start = parse_iso8601(first, utc=utc)
+        duration = parse_iso8601(last, utc=utc)
+    else:
+        # start/end
+        start = parse_iso8601(first, utc=utc)
+        end = parse_iso8601(last, utc=utc)
+
+    if isinstance(start, Duration) or isinstance(end, Duration):
+        raise ParserError("Invalid interval")
+
+    return (
+        cast("datetime.datetime | datetime.date | datetime.time | None", start),
+        cast("datetime.datetime | datetime.date | datetime.time | None", end),
+        cast("Duration | None", duration),
+    )
+
+
+@overload
+def parse_iso8601_many(
+    texts: Iterable[str], errors: Literal[False] = False, utc: bool = False
+) -> list[datetime.datetime | datetime.date | datetime.time | Duration]:
+    ...
+
+
+@overload
+def parse_iso8601_many(
+    texts: Iterable[str], errors: Literal[True], utc: bool = False
+) -> tuple[
+    list[datetime.datetime | datetime.date | datetime.time | Duration | None],
+    list[ValueError | None],
+]:
+    ...
+
+
+def parse_iso8601_many(
+    texts: Iterable[str], errors: bool = False, utc: bool = False
+) -> (
+    list[datetime.datetime | datetime.date | datetime.time | Duration]
+    | tuple[
+        list[datetime.datetime | datetime.date | datetime.time | Duration | None],
+        list[ValueError | None],
+    ]
+):
+    """
+    Parses a sequence of ISO 8601 strings in one call.
+
+    By default, the first invalid string raises an error. If errors is True,
+    invalid strings yield None and a second list, with the error
+    of each item (or None), is returned alongside the results.
+
+    Offset timezones are shared between the results and, if utc is True,
+    zero offsets are mapped to UTC.
+    """
+    results: list[Any] = []
+    failures: list[ValueError | None] = []
+
+    for text in texts:
+        try:
+            results.append(parse_iso8601(text, utc=utc))
+        except ValueError as e:
+            if not errors:
+                raise
+
+            results.append(None)
+            failures.append(e)
+        else:
+            if errors:
+                failures.append(None)
+
+    if errors:
+        return results, failures
+
+    return results
+
+
 def _parse_iso8601_duration(text: str, **options: str) -> Duration | None:
     m = ISO8601_DURATION.match(text)
     if not m:
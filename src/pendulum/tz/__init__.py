@@ -1,22 +1,33 @@
 from __future__ import annotations
 
+import datetime as _datetime
+import time
+
 from importlib import resources
 from pathlib import Path
 from typing import cast
 
+from pendulum.tz.bundle import get_bundle
 from pendulum.tz.local_timezone import get_local_timezone
 from pendulum.tz.local_timezone import set_local_timezone
 from pendulum.tz.local_timezone import test_local_timezone
+from pendulum.tz.local_timezone import watch_local_timezone
 from pendulum.tz.timezone import UTC
 from pendulum.tz.timezone import FixedTimezone
 from pendulum.tz.timezone import Timezone
+from pendulum.tz.timezone import _timestamp
+from pendulum.tz.transitions import OffsetIndex
+from pendulum.tz.transitions import Transition
+from pendulum.tz.transitions import TransitionType
 
 
 PRE_TRANSITION = "pre"
 POST_TRANSITION = "post"
 TRANSITION_ERROR = "error"
+SHIFT_FORWARD = "shift_forward"
 
 _timezones = None
+_offset_index: OffsetIndex | None = None
 
 _tz_cache: dict[int, FixedTimezone] = {}
 
@@ -24,6 +35,10 @@ _tz_cache: dict[int, FixedTimezone] = {}
 def timezones() -> tuple[str, ...]:
     global _timezones
 
+    bundle = get_bundle()
+    if bundle is not None:
+        return bundle.keys()
+
     if _timezones is None:
         with cast(Path, resources.files("tzdata").joinpath("zones")).open() as f:
             _timezones = tuple(tz.strip() for tz in f.readlines())
@@ -31,6 +46,49 @@ def timezones() -> tuple[str, ...]:
     return _timezones
 
 
+def offsets_at(at: _datetime.datetime | None = None) -> dict[int, tuple[str, ...]]:
+    """
+    Return the timezones grouped by their UTC offset, in seconds,
+    at the given instant or now.
+
+    Naive datetimes are considered to be in UTC.
+    """
+    return dict(_get_offset_index().offsets_at(_instant(at)))
+
+
+def zones_at_offset(
+    offset: int, at: _datetime.datetime | None = None
+) -> tuple[str, ...]:
+    """
+    Return the timezones having the given UTC offset, in seconds,
+    at the given instant or now.
+
+    Naive datetimes are considered to be in UTC.
+
+    >>> from pendulum import datetime
+    >>> "Europe/Paris" in zones_at_offset(7200, at=datetime(2024, 7, 1))
+    True
+    """
+    return _get_offset_index().offsets_at(_instant(at)).get(offset, ())
+
+
+def _get_offset_index() -> OffsetIndex:
+    global _offset_index
+
+    keys = timezones()
+    if _offset_index is None or _offset_index.keys is not keys:
+        _offset_index = OffsetIndex(keys)
+
+    return _offset_index
+
+
+def _instant(at: _datetime.datetime | None) -> int:
+    if at is None:
+        return int(time.time())
+
+    return _timestamp(at)
+
+
 def fixed_timezone(offset: int) -> FixedTimezone:
     """
     Return a Timezone instance given its offset in seconds.
@@ -55,10 +113,15 @@ __all__ = [
     "UTC",
     "Timezone",
     "FixedTimezone",
+    "Transition",
+    "TransitionType",
     "set_local_timezone",
     "get_local_timezone",
     "test_local_timezone",
+    "watch_local_timezone",
     "fixed_timezone",
     "local_timezone",
+    "offsets_at",
     "timezones",
+    "zones_at_offset",
 ]
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import io
+import mmap
+import os
+import struct
+import threading
+
+from importlib import resources
+from pathlib import Path
+from typing import IO
+from typing import Iterable
+from typing import cast
+
+from pendulum.tz.timezone import Timezone
+
+
+# The bundle starts with a header holding a magic number, the format version,
+# the number of zones and the size of the names block.
+# It is followed by the (offset, length) of the TZif data of each zone,
+# the newline separated names of the zones and the TZif data itself.
+MAGIC = b"PTZB"
+VERSION = 1
+
+_HEADER = struct.Struct(">4sIII")
+_ENTRY = struct.Struct(">II")
+
+# The version 1 data block of TZif files is only read by legacy readers,
+# so bundled files keep a minimal one: no transitions and a single UTC type.
+_EMPTY_V1_BLOCK = struct.pack(">6l", 0, 0, 0, 0, 1, 1) + b"\x00" * 7
+
+_bundle: TimezoneBundle | None = None
+
+
+class BundledTimezone(Timezone):
+    """
+    A timezone loaded from a bundle.
+
+    It is pickled by key so that it can be restored without the bundle.
+    """
+
+    def __reduce__(self) -> tuple[type[Timezone], tuple[str]]:
+        return Timezone, (self.key,)
+
+
+class TimezoneBundle:
+    """
+    A memory-mapped timezone bundle.
+
+    Zones are only built when they are requested,
+    from slices of the mapped file.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count, names_size = _HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Invalid timezone bundle: {path}")
+
+        names_offset = _HEADER.size + count * _ENTRY.size
+        names = self._mmap[names_offset : names_offset + names_size].decode()
+
+        self._keys = tuple(names.split("\n")) if count else ()
+        self._entries = {
+            key: _ENTRY.unpack_from(self._mmap, _HEADER.size + i * _ENTRY.size)
+            for i, key in enumerate(self._keys)
+        }
+        self._timezones: dict[str, BundledTimezone] = {}
+        self._lock = threading.Lock()
+
+    def keys(self) -> tuple[str, ...]:
+        return self._keys
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def data(self, key: str) -> memoryview:
+        """
+        Returns the TZif data of the given zone, without copying it.
+        """
+        offset, length = self._entries[key]
+
+        return memoryview(self._mmap)[offset : offset + length]
+
+    def open(self, key: str) -> IO[bytes]:
+        """
+        Returns a file object over the TZif data of the given zone.
+
+        zoneinfo only reads from file objects, so the data is copied here,
+        unlike with data().
+        """
+        return io.BytesIO(self.data(key))
+
+    def timezone(self, key: str) -> BundledTimezone:
+        tz = self._timezones.get(key)
+        if tz is None:
+            with self._lock:
+                tz = self._timezones.get(key)
+                if tz is None:
+                    with self.open(key) as f:
+                        tz = BundledTimezone.from_file(f, key=key)
+
+                    self._timezones[key] = tz
+
+        return tz
+
+
+def build(path: str | os.PathLike[str], keys: Iterable[str] | None = None) -> None:
+    """
+    Compiles the zones of the tzdata package into a single bundle.
+    """
+    if keys is None:
+        from pendulum.tz import timezones
+
+        keys = timezones()
+
+    keys = sorted(keys)
+    blobs = [_compact(_read_tzdata(key)) for key in keys]
+    names = "\n".join(keys).encode()
+
+    offset = _HEADER.size + len(keys) * _ENTRY.size + len(names)
+    entries = []
+    for blob in blobs:
+        entries.append(_ENTRY.pack(offset, len(blob)))
+        offset += len(blob)
+
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, len(keys), len(names)))
+        f.writelines(entries)
+        f.write(names)
+        f.writelines(blobs)
+
+
+def load(path: str | os.PathLike[str]) -> TimezoneBundle:
+    """
+    Loads a bundle built by build() and uses it for the zones it contains.
+    """
+    global _bundle
+
+    _bundle = TimezoneBundle(path)
+    _clear_resolved_timezones()
+
+    return _bundle
+
+
+def unload() -> None:
+    global _bundle
+
+    _bundle = None
+    _clear_resolved_timezones()
+
+
+def get_bundle() -> TimezoneBundle | None:
+    return _bundle
+
+
+def _clear_resolved_timezones() -> None:
+    # Zones already resolved by name are built again from the new source
+    import pendulum
+
+    pendulum._timezones_by_name.clear()
+    pendulum._timezones_by_tzinfo.clear()
+
+
+def _read_tzdata(key: str) -> bytes:
+    *package, name = key.split("/")
+    files = resources.files(".".join(["tzdata.zoneinfo", *package]))
+
+    return cast(Path, files.joinpath(name)).read_bytes()
+
+
+def _compact(data: bytes) -> bytes:
+    # Drops the version 1 data block of version 2+ files,
+    # which duplicates the version 2 data with 32-bit transition times.
+    if data[:4] != b"TZif" or data[4:5] in (b"\x00", b"1"):
+        return data
+
+    isutcnt, isstdcnt, leapcnt, timecnt, typecnt, charcnt = struct.unpack(
+        ">6l", data[20:44]
+    )
+    v1_size = timecnt * 5 + typecnt * 6 + charcnt + leapcnt * 8 + isstdcnt + isutcnt
+    if 24 + v1_size <= len(_EMPTY_V1_BLOCK):
+        # Already a "slim" file
+        return data
+
+    return data[:20] + _EMPTY_V1_BLOCK + data[44 + v1_size :]
@@ -4,6 +4,7 @@ import contextlib
 import os
 import re
 import sys
+import time
 import warnings
 
 from contextlib import contextmanager
@@ -26,21 +27,75 @@ if sys.platform == "win32":
 _mock_local_timezone = None
 _local_timezone = None
 
+# Files whose changes signal a change of the system timezone
+_WATCHED_FILES = ("/etc/localtime", "/etc/timezone")
+
+_watch_interval: float | None = None
+_next_check = 0.0
+_system_state: tuple[object, ...] | None = None
+
 
 def get_local_timezone() -> Timezone | FixedTimezone:
-    global _local_timezone
+    global _local_timezone, _next_check, _system_state
 
     if _mock_local_timezone is not None:
         return _mock_local_timezone
 
-    if _local_timezone is None:
-        tz = _get_system_timezone()
+    if _local_timezone is not None and (
+        _watch_interval is None or time.monotonic() < _next_check
+    ):
+        return _local_timezone
+
+    if _watch_interval is not None:
+        _next_check = time.monotonic() + _watch_interval
+
+        state = _get_system_state()
+        if state == _system_state and _local_timezone is not None:
+            return _local_timezone
+
+        _system_state = state
 
-        _local_timezone = tz
+    _local_timezone = _get_system_timezone()
 
     return _local_timezone
 
 
+def watch_local_timezone(interval: float | None = 60.0) -> None:
+    """
+    Makes the local timezone follow changes of the system timezone.
+
+    The TZ environment variable and the timezone files are checked
+    at most once every interval seconds and the local timezone
+    is only looked up again if they changed.
+
+    Passing None stops watching for changes.
+    """
+    global _watch_interval, _next_check, _system_state
+
+    _watch_interval = interval
+    _next_check = 0.0
+    _system_state = None
+
+
+def _get_system_state() -> tuple[object, ...]:
+    state: list[object] = [os.environ.get("TZ")]
+
+    for path in _WATCHED_FILES:
+        try:
+            # lstat() notices a new symlink, stat() a new target file
+            link = os.lstat(path)
+            target = os.stat(path)
+        except OSError:
+            state.append(None)
+            continue
+
+        state.append(
+            (link.st_ino, link.st_mtime_ns, target.st_ino, target.st_mtime_ns)
+        )
+
+    return tuple(state)
+
+
 def set_local_timezone(mock: str | Timezone | None = None) -> None:
     global _mock_local_timezone
 
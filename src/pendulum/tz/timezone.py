@@ -1,30 +1,56 @@
 # mypy: no-warn-redundant-casts
 from __future__ import annotations
 
+import bisect
 import datetime as _datetime
+import math
 import zoneinfo
 
 from abc import ABC
 from abc import abstractmethod
 from typing import TYPE_CHECKING
+from typing import Iterable
 from typing import TypeVar
+from typing import Union
 from typing import cast
+from typing import overload
 
 from pendulum.tz.exceptions import AmbiguousTime
 from pendulum.tz.exceptions import InvalidTimezone
 from pendulum.tz.exceptions import NonExistingTime
+from pendulum.tz.exceptions import TimezoneError
+from pendulum.tz.transitions import Transition
+from pendulum.tz.transitions import TransitionTable
+from pendulum.tz.transitions import transition_table
+from pendulum.tz.transitions import utc_offsets
 
 
 if TYPE_CHECKING:
+    from typing_extensions import Literal
     from typing_extensions import Self
 
+    from pendulum.datetime import DateTime
+
 POST_TRANSITION = "post"
 PRE_TRANSITION = "pre"
 TRANSITION_ERROR = "error"
+SHIFT_FORWARD = "shift_forward"
+
+_NONEXISTENT_POLICIES = (
+    POST_TRANSITION,
+    PRE_TRANSITION,
+    TRANSITION_ERROR,
+    SHIFT_FORWARD,
+)
+_AMBIGUOUS_POLICIES = (POST_TRANSITION, PRE_TRANSITION, TRANSITION_ERROR)
 
 
 _DT = TypeVar("_DT", bound=_datetime.datetime)
 
+_EPOCH_ORDINAL = _datetime.date(1970, 1, 1).toordinal()
+
+_Instant = Union[_datetime.datetime, int, float]
+
 
 class PendulumTimezone(ABC):
     @property
@@ -49,6 +75,85 @@ class PendulumTimezone(ABC):
     ) -> _datetime.datetime:
         raise NotImplementedError
 
+    @overload
+    def convert_many(
+        self, values: Iterable[_Instant], raw: Literal[False] = False
+    ) -> list[DateTime]:
+        ...
+
+    @overload
+    def convert_many(
+        self, values: Iterable[_Instant], raw: Literal[True]
+    ) -> list[tuple[int, int, int, int, int, int, int]]:
+        ...
+
+    def convert_many(
+        self, values: Iterable[_Instant], raw: bool = False
+    ) -> list[DateTime] | list[tuple[int, int, int, int, int, int, int]]:
+        """
+        Converts many instants in the current timezone at once.
+
+        The instants can be aware datetimes or POSIX timestamps.
+        Naive datetimes are considered to be in UTC.
+
+        If raw is True, the local (year, month, day, hour, minute, second,
+        microsecond) fields are returned instead of DateTime instances.
+
+        >>> from pendulum import timezone
+        >>> paris = timezone('Europe/Paris')
+        >>> [dt.isoformat() for dt in paris.convert_many([0, 1_000_000_000])]
+        ['1970-01-01T01:00:00+01:00', '2001-09-09T03:46:40+02:00']
+        """
+        from pendulum.datetime import DateTime
+        from pendulum.helpers import local_time
+
+        instants = []
+        microseconds = []
+
+        for value in values:
+            if isinstance(value, _datetime.datetime):
+                instants.append(_timestamp(value))
+                microseconds.append(value.microsecond)
+            elif isinstance(value, int):
+                instants.append(value)
+                microseconds.append(0)
+            else:
+                instant = math.floor(value)
+                microsecond = round((value - instant) * 1_000_000)
+                if microsecond == 1_000_000:
+                    instant += 1
+                    microsecond = 0
+
+                instants.append(instant)
+                microseconds.append(microsecond)
+
+        offsets, folds = self._utc_offsets(instants)
+
+        if raw:
+            return [
+                local_time(instant, offset, microsecond)
+                for instant, offset, microsecond in zip(
+                    instants, offsets, microseconds
+                )
+            ]
+
+        return [
+            DateTime(
+                *local_time(instant, offset, microsecond), tzinfo=self, fold=fold
+            )
+            for instant, offset, microsecond, fold in zip(
+                instants, offsets, microseconds, folds
+            )
+        ]
+
+    @abstractmethod
+    def _utc_offsets(self, instants: list[int]) -> tuple[list[int], list[int]]:
+        """
+        Returns the UTC offsets and folds of the local times
+        corresponding to the given POSIX timestamps.
+        """
+        raise NotImplementedError
+
 
 class Timezone(zoneinfo.ZoneInfo, PendulumTimezone):
     """
@@ -60,6 +165,10 @@ class Timezone(zoneinfo.ZoneInfo, PendulumTimezone):
     >>> tz = Timezone('Europe/Paris')
     """
 
+    # The last range of wall times found to occur exactly once,
+    # or None if the transitions of the zone cannot be looked up.
+    _unambiguous_period: tuple[int, int] | None = (0, 0)
+
     def __new__(cls, key: str) -> Self:
         try:
             return super().__new__(cls, key)  # type: ignore[call-arg]
@@ -154,6 +263,228 @@ class Timezone(zoneinfo.ZoneInfo, PendulumTimezone):
             )
         )
 
+    def localize_many(
+        self,
+        values: Iterable[_datetime.datetime],
+        nonexistent: str | None = POST_TRANSITION,
+        ambiguous: str | None = POST_TRANSITION,
+    ) -> tuple[list[DateTime | TimezoneError | None], list[bool]]:
+        """
+        Localizes many naive wall times in the current timezone at once.
+
+        Skipped times are resolved with the nonexistent policy
+        and repeated times with the ambiguous policy:
+
+        * PRE_TRANSITION uses the offset before the transition.
+        * POST_TRANSITION uses the offset after the transition.
+        * SHIFT_FORWARD, for skipped times only, uses the end of the gap.
+        * TRANSITION_ERROR puts the exception in place of the result.
+        * None puts None in place of the result.
+
+        Nothing is raised: the results are returned along with a mask
+        telling which of the values were skipped or repeated times.
+
+        >>> from datetime import datetime
+        >>> from pendulum import timezone
+        >>> paris = timezone('Europe/Paris')
+        >>> results, mask = paris.localize_many(
+        ...     [datetime(2013, 3, 31, 2, 30), datetime(2013, 3, 31, 4, 30)],
+        ...     nonexistent=SHIFT_FORWARD,
+        ... )
+        >>> [dt.isoformat() for dt in results]
+        ['2013-03-31T03:00:00+02:00', '2013-03-31T04:30:00+02:00']
+        >>> mask
+        [True, False]
+        """
+        from pendulum.datetime import DateTime
+        from pendulum.helpers import local_time
+
+        if nonexistent is not None and nonexistent not in _NONEXISTENT_POLICIES:
+            raise ValueError(f"Invalid policy for nonexistent times: {nonexistent}")
+
+        if ambiguous is not None and ambiguous not in _AMBIGUOUS_POLICIES:
+            raise ValueError(f"Invalid policy for ambiguous times: {ambiguous}")
+
+        results: list[DateTime | TimezoneError | None] = []
+        mask: list[bool] = []
+
+        for value in values:
+            if value.tzinfo is not None:
+                raise ValueError(f"Expected a naive datetime, got {value!r}")
+
+            wall = _timestamp(value)
+            before = cast(_datetime.timedelta, self.utcoffset(value.replace(fold=0)))
+            after = cast(_datetime.timedelta, self.utcoffset(value.replace(fold=1)))
+            offset_before = before.days * 86400 + before.seconds
+            offset_after = after.days * 86400 + after.seconds
+
+            fold = 0
+            if offset_before == offset_after:
+                policy: str | None = POST_TRANSITION
+                instant = wall - offset_before
+                offset = offset_before
+            elif offset_after > offset_before:
+                # Skipped time
+                policy = nonexistent
+                if policy == PRE_TRANSITION:
+                    instant = wall - offset_after
+                    offset = offset_before
+                elif policy == SHIFT_FORWARD:
+                    instant = transition_table(self.key).period(
+                        wall - offset_before
+                    )[0]
+                    offset = offset_after
+                else:
+                    instant = wall - offset_before
+                    offset = offset_after
+            else:
+                # Repeated time
+                policy = ambiguous
+                if policy == PRE_TRANSITION:
+                    instant = wall - offset_before
+                    offset = offset_before
+                else:
+                    instant = wall - offset_after
+                    offset = offset_after
+                    fold = 1
+
+            mask.append(offset_before != offset_after)
+
+            if policy is None:
+                results.append(None)
+            elif policy == TRANSITION_ERROR:
+                if offset_after > offset_before:
+                    results.append(NonExistingTime(value))
+                else:
+                    results.append(AmbiguousTime(value))
+            else:
+                microsecond = 0 if policy == SHIFT_FORWARD else value.microsecond
+                results.append(
+                    DateTime(
+                        *local_time(instant, offset, microsecond),
+                        tzinfo=self,
+                        fold=fold,
+                    )
+                )
+
+        return results, mask
+
+    def transitions(
+        self, start: _datetime.datetime, end: _datetime.datetime
+    ) -> list[Transition]:
+        """
+        Returns the transitions occurring from start (included)
+        to end (excluded).
+
+        Naive datetimes are considered to be in the current timezone.
+
+        >>> from pendulum import datetime, timezone
+        >>> paris = timezone('Europe/Paris')
+        >>> [
+        ...     t.at.isoformat()
+        ...     for t in paris.transitions(datetime(2013, 1, 1), datetime(2014, 1, 1))
+        ... ]
+        ['2013-03-31T01:00:00+00:00', '2013-10-27T01:00:00+00:00']
+        """
+        table = transition_table(self.key)
+        end_instant = self._instant(end, ceil=True)
+        table.ensure(end_instant)
+
+        first = bisect.bisect_left(table.instants, self._instant(start, ceil=True))
+        last = bisect.bisect_left(table.instants, end_instant)
+
+        return [self._transition(table, index) for index in range(first, last)]
+
+    def next_transition(self, dt: _datetime.datetime) -> Transition | None:
+        """
+        Returns the first transition occurring strictly after
+        the given datetime, if any.
+
+        Naive datetimes are considered to be in the current timezone.
+        """
+        table = transition_table(self.key)
+        index = table.index(self._instant(dt)) + 1
+
+        if index >= len(table.instants):
+            return None
+
+        return self._transition(table, index)
+
+    def prev_transition(self, dt: _datetime.datetime) -> Transition | None:
+        """
+        Returns the last transition occurring at or before
+        the given datetime, if any.
+
+        Naive datetimes are considered to be in the current timezone.
+        """
+        table = transition_table(self.key)
+        index = table.index(self._instant(dt))
+
+        if index < 0:
+            return None
+
+        return self._transition(table, index)
+
+    def _instant(self, dt: _datetime.datetime, ceil: bool = False) -> int:
+        if dt.tzinfo is None:
+            dt = self.convert(dt)
+
+        instant = _timestamp(dt)
+        if ceil and dt.microsecond:
+            instant += 1
+
+        return instant
+
+    def _transition(self, table: TransitionTable, index: int) -> Transition:
+        from pendulum.datetime import DateTime
+        from pendulum.helpers import local_time
+
+        at = table.instants[index]
+
+        return Transition(
+            DateTime(*local_time(at, 0, 0), tzinfo=UTC),
+            table.type_at(index - 1),
+            table.types[index],
+        )
+
+    def _utc_offsets(self, instants: list[int]) -> tuple[list[int], list[int]]:
+        return utc_offsets(self.key, instants)
+
+    def _is_unambiguous(self, dt: _datetime.datetime) -> bool:
+        """
+        Returns whether the wall time of the given datetime
+        occurs exactly once in the current timezone.
+        """
+        local = (
+            (dt.toordinal() - _EPOCH_ORDINAL) * 86400
+            + dt.hour * 3600
+            + dt.minute * 60
+            + dt.second
+        )
+
+        period = self._unambiguous_period
+        if period is None:
+            return False
+
+        if period[0] <= local < period[1]:
+            return True
+
+        try:
+            table = transition_table(self.key)
+        except (OSError, ValueError, ImportError, TypeError):
+            # Zones which are not loaded from a key cannot be looked up
+            self._unambiguous_period = None
+
+            return False
+
+        period = table.local_period(local)
+        if period is None:
+            return False
+
+        self._unambiguous_period = period
+
+        return True
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}('{self.name}')"
 
@@ -212,6 +543,9 @@ class FixedTimezone(_datetime.tzinfo, PendulumTimezone):
     def offset(self) -> int:
         return self._offset
 
+    def _utc_offsets(self, instants: list[int]) -> tuple[list[int], list[int]]:
+        return [self._offset] * len(instants), [0] * len(instants)
+
     def utcoffset(self, dt: _datetime.datetime | None) -> _datetime.timedelta:
         return self._utcoffset
 
@@ -236,4 +570,20 @@ class FixedTimezone(_datetime.tzinfo, PendulumTimezone):
         return f"{self.__class__.__name__}({self._offset}{name})"
 
 
+def _timestamp(dt: _datetime.datetime) -> int:
+    # Exact integer arithmetic, datetime.timestamp() goes through floats
+    instant = (
+        (dt.toordinal() - _EPOCH_ORDINAL) * 86400
+        + dt.hour * 3600
+        + dt.minute * 60
+        + dt.second
+    )
+
+    offset = dt.utcoffset()
+    if offset is not None:
+        instant -= offset.days * 86400 + offset.seconds
+
+    return instant
+
+
 UTC = Timezone("UTC")
@@ -0,0 +1,641 @@
+from __future__ import annotations
+
+import bisect
+import calendar
+import datetime as _datetime
+import io
+import os
+import re
+import struct
+import threading
+import zoneinfo
+
+from importlib import resources
+from types import MappingProxyType
+from typing import IO
+from typing import TYPE_CHECKING
+from typing import Mapping
+from typing import NamedTuple
+
+
+if TYPE_CHECKING:
+    from pendulum.datetime import DateTime
+
+with_extensions = os.getenv("PENDULUM_EXTENSIONS", "1") == "1"
+
+try:
+    if not with_extensions or struct.calcsize("P") == 4:
+        raise ImportError()
+
+    from pendulum._pendulum import TzifTimezone
+except ImportError:
+    TzifTimezone = None  # type: ignore[assignment,misc]
+
+
+_EPOCH = _datetime.datetime(1970, 1, 1)
+_EPOCH_ORDINAL = _EPOCH.toordinal()
+
+# Rule based transitions are never generated past that year
+_MAX_YEAR = 9999
+
+# No UTC offset, even a historical one, is larger than that
+_MAX_OFFSET = 2 * 86400
+
+_POSIX_TZ = re.compile(
+    r"(?P<std><[^>]+>|[^<0-9:.,+-]+)(?P<stdoff>[+-]?\d{1,3}(?::\d{2}){0,2})"
+    r"(?:"
+    r"(?P<dst><[^>]+>|[^<0-9:.,+-]+)(?P<dstoff>[+-]?\d{1,3}(?::\d{2}){0,2})?"
+    r",(?P<start>[^,]+),(?P<end>[^,]+)"
+    r")?",
+    re.ASCII,
+)
+_POSIX_DATE = re.compile(
+    r"(?:M(?P<month>\d{1,2})\.(?P<week>\d)\.(?P<weekday>\d)|J(?P<julian>\d{1,3})"
+    r"|(?P<day>\d{1,3}))"
+    r"(?:/(?P<time>[+-]?\d{1,3}(?::\d{2}){0,2}))?",
+    re.ASCII,
+)
+
+
+class TransitionType(NamedTuple):
+    offset: int
+    dst: int
+    abbreviation: str
+
+
+class Transition(NamedTuple):
+    """
+    A change of UTC offset, abbreviation or DST status of a timezone.
+    """
+
+    # The instant of the transition, in UTC
+    at: DateTime
+    previous: TransitionType
+    current: TransitionType
+
+
+class PosixRule:
+    """
+    A daylight saving time rule, as found at the end of TZif files.
+    """
+
+    def __init__(
+        self,
+        std: TransitionType,
+        dst: TransitionType,
+        start: tuple[str, int, int, int, int],
+        end: tuple[str, int, int, int, int],
+    ) -> None:
+        self.std = std
+        self.dst = dst
+        self._start = start
+        self._end = end
+
+    def transitions(self, year: int) -> list[tuple[int, TransitionType]]:
+        """
+        Returns the UTC instants of the transitions occurring in the given year
+        along with the type in effect after each of them, in chronological order.
+        """
+        start = _rule_date_to_epoch(self._start, year) - self.std.offset
+        end = _rule_date_to_epoch(self._end, year) - self.dst.offset
+
+        return sorted([(start, self.dst), (end, self.std)])
+
+
+class TransitionTable:
+    """
+    The transitions of a zone as sorted UTC instants
+    with the type in effect after each of them.
+
+    Transitions past the last one of the TZif file are generated
+    from the POSIX rule, if any, as they are needed.
+    """
+
+    def __init__(
+        self,
+        instants: list[int],
+        types: list[TransitionType],
+        before: TransitionType,
+        rule: PosixRule | TransitionType | None,
+    ) -> None:
+        self.before = before
+        self._rule = rule
+        self._lock = threading.Lock()
+
+        if not isinstance(rule, PosixRule):
+            until = 2**63
+        elif instants:
+            until = instants[-1]
+        else:
+            until = -(2**63)
+
+        # The transitions and the instant up to which they are known.
+        # They are replaced at once when more transitions are generated
+        # so that lookups do not need the lock.
+        self._transitions: tuple[list[int], list[TransitionType], int] = (
+            instants,
+            types,
+            until,
+        )
+
+    @property
+    def instants(self) -> list[int]:
+        return self._transitions[0]
+
+    @property
+    def types(self) -> list[TransitionType]:
+        return self._transitions[1]
+
+    @property
+    def _until(self) -> int:
+        return self._transitions[2]
+
+    def ensure(self, instant: int) -> tuple[list[int], list[TransitionType], int]:
+        """
+        Makes sure the transitions up to the given instant are known
+        and returns the instants and types of the transitions
+        along with the instant up to which they are known.
+        """
+        transitions = self._transitions
+        if instant <= transitions[2]:
+            return transitions
+
+        with self._lock:
+            transitions = self._transitions
+            if instant <= transitions[2]:
+                return transitions
+
+            assert isinstance(self._rule, PosixRule)
+
+            instants, types = transitions[0][:], transitions[1][:]
+            year = _year_of(instants[-1]) if instants else 1900
+
+            last = min(_year_of(instant) + 1, _MAX_YEAR)
+            while year <= last:
+                for at, type_ in self._rule.transitions(year):
+                    if instants and at <= instants[-1]:
+                        continue
+
+                    previous = types[-1] if types else self.before
+                    if type_ == previous:
+                        continue
+
+                    instants.append(at)
+                    types.append(type_)
+
+                year += 1
+
+            transitions = (instants, types, _epoch_of_year(last + 1) - 1)
+            self._transitions = transitions
+
+        return transitions
+
+    def index(self, instant: int) -> int:
+        """
+        Returns the index of the last transition at or before the given instant,
+        or -1 if there is none.
+        """
+        return bisect.bisect_right(self.ensure(instant)[0], instant) - 1
+
+    def type_at(self, index: int) -> TransitionType:
+        if index < 0:
+            return self.before
+
+        return self.types[index]
+
+    def period(self, instant: int) -> tuple[int, int, TransitionType]:
+        """
+        Returns the bounds, start included and end excluded, of the period
+        around the given instant during which the type in effect does not change,
+        along with that type.
+        """
+        instants, types, until = self.ensure(instant)
+        index = bisect.bisect_right(instants, instant) - 1
+
+        if index >= 0:
+            start, type_ = instants[index], types[index]
+        else:
+            start, type_ = -(2**63), self.before
+
+        if index + 1 < len(instants):
+            end = instants[index + 1]
+        else:
+            # Transitions past that point have not been generated yet
+            end = until + 1
+
+        return start, end, type_
+
+    def local_period(self, local: int) -> tuple[int, int] | None:
+        """
+        Returns the bounds, start included and end excluded, of the range
+        of wall times around the given one that occur exactly once,
+        or None if the given wall time is skipped or repeated.
+
+        Wall times are expressed in seconds since the local epoch.
+        """
+        instants, types, until = self.ensure(local + _MAX_OFFSET)
+
+        index = bisect.bisect_right(instants, local + _MAX_OFFSET) - 1
+        while index >= 0 and self._local_bounds(instants, types, index)[0] > local:
+            index -= 1
+
+        if index >= 0:
+            end = self._local_bounds(instants, types, index)[1]
+            if local < end:
+                return None
+        else:
+            end = -(2**63)
+
+        if index + 1 < len(instants):
+            next_start = self._local_bounds(instants, types, index + 1)[0]
+        else:
+            # Transitions past that point have not been generated yet
+            next_start = until - _MAX_OFFSET
+
+        if local >= next_start:
+            return None
+
+        return end, next_start
+
+    def _local_bounds(
+        self, instants: list[int], types: list[TransitionType], index: int
+    ) -> tuple[int, int]:
+        # The wall times skipped or repeated by a transition
+        instant = instants[index]
+        before = types[index - 1].offset if index > 0 else self.before.offset
+        after = types[index].offset
+
+        return instant + min(before, after), instant + max(before, after)
+
+    def utc_offsets(self, instants: list[int]) -> tuple[list[int], list[int]]:
+        """
+        Returns the UTC offsets and folds of the local times
+        corresponding to the given POSIX timestamps.
+        """
+        offsets = [0] * len(instants)
+        folds = [0] * len(instants)
+
+        if not instants:
+            return offsets, folds
+
+        # Instants are visited in chronological order
+        # so the transitions are only walked once.
+        order = sorted(range(len(instants)), key=instants.__getitem__)
+
+        transitions, types, _ = self.ensure(instants[order[-1]])
+        count = len(transitions)
+
+        index = bisect.bisect_right(transitions, instants[order[0]]) - 1
+        previous = types[index - 1] if index > 0 else self.before
+        current = types[index] if index >= 0 else self.before
+
+        for i in order:
+            instant = instants[i]
+
+            while index + 1 < count and transitions[index + 1] <= instant:
+                index += 1
+                previous, current = current, types[index]
+
+            offsets[i] = current.offset
+
+            # The first occurrence of a repeated time has fold=0
+            if index >= 0 and previous.offset - current.offset > (
+                instant - transitions[index]
+            ):
+                folds[i] = 1
+
+        return offsets, folds
+
+
+class OffsetIndex:
+    """
+    The UTC offsets of a set of zones, grouped by value.
+
+    Each lookup caches the grouping along with the period of time
+    during which none of the zones changes offset, so that subsequent
+    lookups in the same period are a mere bisection.
+    """
+
+    MAX_PERIODS = 64
+
+    def __init__(self, keys: tuple[str, ...]) -> None:
+        self.keys = keys
+        self._tables: list[TransitionTable] | None = None
+        # The start of the cached periods, in chronological order, and the periods.
+        # They are replaced at once so that lookups do not need the lock.
+        self._periods: tuple[
+            list[int], list[tuple[int, Mapping[int, tuple[str, ...]]]]
+        ] = ([], [])
+        self._lock = threading.Lock()
+
+    def offsets_at(self, instant: int) -> Mapping[int, tuple[str, ...]]:
+        """
+        Returns the zones grouped by UTC offset at the given instant,
+        as a read-only mapping shared by the lookups in the same period.
+        """
+        starts, periods = self._periods
+        index = bisect.bisect_right(starts, instant) - 1
+        if index >= 0:
+            end, offsets = periods[index]
+            if instant < end:
+                return offsets
+
+        with self._lock:
+            if self._tables is None:
+                self._tables = [transition_table(key) for key in self.keys]
+
+            start, end = -(2**63), 2**63
+            groups: dict[int, list[str]] = {}
+            for key, table in zip(self.keys, self._tables):
+                period_start, period_end, type_ = table.period(instant)
+                start = max(start, period_start)
+                end = min(end, period_end)
+
+                groups.setdefault(type_.offset, []).append(key)
+
+            offsets = MappingProxyType(
+                {offset: tuple(keys) for offset, keys in groups.items()}
+            )
+
+            starts, periods = self._periods
+            if len(starts) >= self.MAX_PERIODS:
+                starts, periods = [], []
+            else:
+                starts, periods = starts[:], periods[:]
+
+            index = bisect.bisect_right(starts, start)
+            starts.insert(index, start)
+            periods.insert(index, (end, offsets))
+            self._periods = (starts, periods)
+
+        return offsets
+
+
+_tables: dict[str, TransitionTable] = {}
+
+
+def transition_table(key: str) -> TransitionTable:
+    """
+    Returns the transition table of the zone with the given key,
+    reading it from the same TZif file as zoneinfo the first time.
+    """
+    table = _tables.get(key)
+    if table is None:
+        with _open_tzfile(key) as f:
+            table = _tables.setdefault(key, read_tzif(f))
+
+    return table
+
+
+_native_timezones: dict[str, TzifTimezone] = {}
+
+
+def native_timezone(key: str) -> TzifTimezone:
+    """
+    Returns the native timezone with the given key,
+    reading it from the same TZif file as zoneinfo the first time.
+    """
+    tz = _native_timezones.get(key)
+    if tz is None:
+        with _open_tzfile(key) as f:
+            tz = _native_timezones.setdefault(key, TzifTimezone(key, f.read()))
+
+    return tz
+
+
+def load(key: str) -> None:
+    """
+    Loads the transitions of the zone with the given key ahead of time.
+
+    The transition table is always built, since the local time lookups
+    of Timezone use it, along with the native timezone if available.
+    The TZif file is read only once for both.
+    """
+    if key in _tables and (TzifTimezone is None or key in _native_timezones):
+        return
+
+    with _open_tzfile(key) as f:
+        data = f.read()
+
+    _tables.setdefault(key, read_tzif(io.BytesIO(data)))
+    if TzifTimezone is not None:
+        _native_timezones.setdefault(key, TzifTimezone(key, data))
+
+
+def utc_offsets(key: str, instants: list[int]) -> tuple[list[int], list[int]]:
+    """
+    Returns the UTC offsets and folds in the zone with the given key
+    of the local times corresponding to the given POSIX timestamps.
+    """
+    if TzifTimezone is not None:
+        return native_timezone(key).utc_offsets(instants)
+
+    return transition_table(key).utc_offsets(instants)
+
+
+def read_tzif(fobj: IO[bytes]) -> TransitionTable:
+    version, counts = _read_header(fobj)
+    time_format = "l"
+
+    if version >= 2:
+        # Skip the version 1 data block which only has 32-bit transition times
+        isutcnt, isstdcnt, leapcnt, timecnt, typecnt, charcnt = counts
+        fobj.seek(
+            timecnt * 5 + typecnt * 6 + charcnt + leapcnt * 8 + isstdcnt + isutcnt,
+            1,
+        )
+        version, counts = _read_header(fobj)
+        time_format = "q"
+
+    isutcnt, isstdcnt, leapcnt, timecnt, typecnt, charcnt = counts
+    time_size = struct.calcsize(f">{time_format}")
+
+    instants = list(
+        struct.unpack(f">{timecnt}{time_format}", fobj.read(timecnt * time_size))
+    )
+    indices = struct.unpack(f">{timecnt}B", fobj.read(timecnt))
+    records = [struct.unpack(">lbB", fobj.read(6)) for _ in range(typecnt)]
+    abbreviations = fobj.read(charcnt)
+
+    dst_offsets = _dst_offsets(indices, records)
+    all_types = [
+        TransitionType(
+            offset,
+            dst_offset,
+            abbreviations[index : abbreviations.index(b"\x00", index)].decode(),
+        )
+        for (offset, _, index), dst_offset in zip(records, dst_offsets)
+    ]
+
+    # Times before the first transition use the first standard time type
+    before = next(
+        (type_ for type_, record in zip(all_types, records) if not record[1]),
+        all_types[indices[0]] if indices else all_types[0],
+    )
+
+    rule: PosixRule | TransitionType | None = None
+    if version >= 2:
+        fobj.seek(isutcnt + isstdcnt + leapcnt * (time_size + 4), 1)
+        footer = fobj.read().strip(b"\n")
+        if footer:
+            rule = parse_posix_tz(footer.decode())
+
+    return TransitionTable(
+        instants, [all_types[index] for index in indices], before, rule
+    )
+
+
+def parse_posix_tz(value: str) -> PosixRule | TransitionType:
+    """
+    Parses a POSIX TZ string like "CET-1CEST,M3.5.0,M10.5.0/3".
+    """
+    m = _POSIX_TZ.fullmatch(value)
+    if m is None:
+        raise ValueError(f"Invalid POSIX TZ string: {value}")
+
+    # POSIX offsets are positive west of Greenwich
+    std = TransitionType(-_parse_posix_time(m.group("stdoff")), 0, _name(m["std"]))
+    if not m.group("dst"):
+        return std
+
+    dst_offset = std.offset + 3600
+    if m.group("dstoff"):
+        dst_offset = -_parse_posix_time(m.group("dstoff"))
+
+    return PosixRule(
+        std,
+        TransitionType(dst_offset, dst_offset - std.offset, _name(m["dst"])),
+        _parse_posix_date(m.group("start")),
+        _parse_posix_date(m.group("end")),
+    )
+
+
+def _open_tzfile(key: str) -> IO[bytes]:
+    from pendulum.tz.bundle import get_bundle
+
+    bundle = get_bundle()
+    if bundle is not None and key in bundle:
+        return bundle.open(key)
+
+    # Same lookup order as zoneinfo: the TZPATH first, then the tzdata package
+    for root in zoneinfo.TZPATH:
+        path = os.path.join(root, key)
+        if os.path.isfile(path):
+            return open(path, "rb")
+
+    *package, name = key.split("/")
+    files = resources.files(".".join(["tzdata.zoneinfo", *package]))
+
+    return files.joinpath(name).open("rb")
+
+
+def _read_header(fobj: IO[bytes]) -> tuple[int, tuple[int, ...]]:
+    if fobj.read(4) != b"TZif":
+        raise ValueError("Invalid TZif file")
+
+    version = fobj.read(1)
+    fobj.read(15)
+
+    return (
+        int(version) if version != b"\x00" else 1,
+        struct.unpack(">6l", fobj.read(24)),
+    )
+
+
+def _dst_offsets(
+    indices: tuple[int, ...], records: list[tuple[int, int, int]]
+) -> list[int]:
+    # TZif files only flag DST types, so their DST offsets are inferred
+    # from the standard types around them, the same way zoneinfo does.
+    dst_offsets = [0] * len(records)
+
+    for i in range(1, len(indices)):
+        index = indices[i]
+        offset, is_dst, _ = records[index]
+        if not is_dst or dst_offsets[index]:
+            continue
+
+        previous = records[indices[i - 1]]
+        if not previous[1]:
+            dst_offsets[index] = offset - previous[0]
+
+        if not dst_offsets[index] and i + 1 < len(indices):
+            following = records[indices[i + 1]]
+            if not following[1]:
+                dst_offsets[index] = offset - following[0]
+
+    for index, (_, is_dst, _) in enumerate(records):
+        if is_dst and not dst_offsets[index]:
+            dst_offsets[index] = 3600
+
+    return dst_offsets
+
+
+def _name(value: str) -> str:
+    return value.strip("<>")
+
+
+def _parse_posix_time(value: str) -> int:
+    sign = -1 if value.startswith("-") else 1
+    parts = [int(part) for part in value.lstrip("+-").split(":")]
+    parts += [0] * (3 - len(parts))
+
+    return sign * (parts[0] * 3600 + parts[1] * 60 + parts[2])
+
+
+def _parse_posix_date(value: str) -> tuple[str, int, int, int, int]:
+    m = _POSIX_DATE.fullmatch(value)
+    if m is None:
+        raise ValueError(f"Invalid POSIX TZ rule date: {value}")
+
+    time = _parse_posix_time(m.group("time")) if m.group("time") else 7200
+
+    if m.group("month"):
+        return "M", int(m["month"]), int(m["week"]), int(m["weekday"]), time
+
+    if m.group("julian"):
+        return "J", int(m["julian"]), 0, 0, time
+
+    return "D", int(m["day"]), 0, 0, time
+
+
+def _rule_date_to_epoch(date: tuple[str, int, int, int, int], year: int) -> int:
+    kind, a, b, c, time = date
+
+    if kind == "M":
+        # Day c (0 is Sunday) of week b (5 is the last one) of month a
+        first_weekday, days_in_month = calendar.monthrange(year, a)
+        day = (c - first_weekday - 1) % 7 + 1 + (b - 1) * 7
+        if day > days_in_month:
+            day -= 7
+
+        ordinal = _datetime.date(year, a, day).toordinal()
+    elif kind == "J":
+        # Julian day, February 29th is never counted
+        ordinal = _datetime.date(year, 1, 1).toordinal() + a - 1
+        if a >= 60 and calendar.isleap(year):
+            ordinal += 1
+    else:
+        # Zero-based day of the year
+        ordinal = _datetime.date(year, 1, 1).toordinal() + a
+
+    return (ordinal - _EPOCH_ORDINAL) * 86400 + time
+
+
+def _year_of(instant: int) -> int:
+    days = instant // 86400
+
+    if days >= _datetime.date.max.toordinal() - _EPOCH_ORDINAL:
+        return _MAX_YEAR
+
+    if days < 1 - _EPOCH_ORDINAL:
+        return 1
+
+    return _datetime.date.fromordinal(days + _EPOCH_ORDINAL).year
+
+
+def _epoch_of_year(year: int) -> int:
+    if year > _MAX_YEAR:
+        return 2**63
+
+    return (_datetime.date(year, 1, 1).toordinal() - _EPOCH_ORDINAL) * 86400
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import pytest
+
+import pendulum
+
+
+@pytest.mark.benchmark(group="DateTime")
+def test_create() -> None:
+    paris = pendulum.timezone("Europe/Paris")
+    fixed = pendulum.FixedTimezone(3600)
+
+    for day in range(1, 29):
+        pendulum.datetime(2024, 2, day, 12, 30, 45)
+        pendulum.datetime(2024, 2, day, 12, 30, 45, tz=fixed)
+        pendulum.datetime(2024, 2, day, 12, 30, 45, tz=paris)
+
+
+@pytest.mark.benchmark(group="DateTime")
+def test_now() -> None:
+    fixed = pendulum.FixedTimezone(3600)
+
+    for _ in range(25):
+        pendulum.now("UTC")
+        pendulum.now(fixed)
+        pendulum.now("Europe/Paris")
+
+
+@pytest.mark.benchmark(group="DateTime")
+def test_add() -> None:
+    utc = pendulum.datetime(2024, 1, 31, 12, 30, 45)
+    fixed = utc.in_timezone(pendulum.FixedTimezone(3600))
+    paris = utc.in_timezone("Europe/Paris")
+
+    for dt in (utc, fixed, paris):
+        for i in range(10):
+            dt.add(months=i, days=i)
+            dt.add(hours=i, seconds=i)
+            dt.subtract(weeks=i, microseconds=i)
+
+
+@pytest.mark.benchmark(group="DateTime")
+def test_range() -> None:
+    start = pendulum.datetime(2024, 3, 1, tz="Europe/Paris")
+    end = start.add(months=1)
+
+    for _ in pendulum.interval(start, end).range("minutes", 5):
+        pass
+
+    for _ in pendulum.interval(start, end.add(years=1)).range("days"):
+        pass
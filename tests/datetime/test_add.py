@@ -144,6 +144,38 @@ def test_add_to_fixed_timezones():
     assert dt.offset == -6 * 3600
 
 
+@pytest.mark.parametrize(
+    "tz", [None, pendulum.UTC, pendulum.FixedTimezone(-6 * 3600 - 30 * 60)]
+)
+def test_add_to_fixed_offsets_overflowing_units(tz):
+    dt = pendulum.datetime(2012, 1, 31, 23, 59, 59, 999999, tz=tz)
+
+    assert_datetime(dt.add(months=1), 2012, 2, 29, 23, 59, 59, 999999)
+    assert_datetime(dt.add(years=1, months=13), 2014, 2, 28, 23, 59, 59, 999999)
+    assert_datetime(dt.add(microseconds=1), 2012, 2, 1, 0, 0, 0, 0)
+    assert_datetime(dt.add(seconds=0.5), 2012, 2, 1, 0, 0, 0, 499999)
+    assert_datetime(
+        dt.add(weeks=-1, days=-2, hours=-25, minutes=-61, seconds=-61),
+        2012,
+        1,
+        21,
+        21,
+        57,
+        58,
+        999999,
+    )
+    assert dt.add(days=1).tzinfo is tz
+    assert dt.add(hours=1).tzinfo is tz
+
+
+def test_add_to_fixed_offsets_out_of_range():
+    with pytest.raises(OverflowError):
+        pendulum.datetime(9999, 12, 31, 23).add(hours=1)
+
+    with pytest.raises(ValueError):
+        pendulum.datetime(9999, 12, 31).add(months=1)
+
+
 def test_add_time_to_new_transition_skipped():
     dt = pendulum.datetime(2013, 3, 31, 1, 59, 59, 999999, tz="Europe/Paris")
 
@@ -157,3 +157,43 @@ def test_local():
 
     assert_datetime(local, 2018, 2, 2, 12, 34, 56, 123456)
     assert local.timezone_name == "America/Toronto"
+
+
+@pytest.mark.parametrize(
+    "year, month, day, hour, minute, fold",
+    [
+        (2013, 3, 31, 1, 59, 1),
+        (2013, 3, 31, 2, 30, 0),
+        (2013, 3, 31, 2, 30, 1),
+        (2013, 3, 31, 3, 0, 1),
+        (2013, 10, 27, 1, 59, 0),
+        (2013, 10, 27, 2, 30, 0),
+        (2013, 10, 27, 2, 30, 1),
+        (2013, 10, 27, 3, 0, 0),
+        (2013, 6, 1, 12, 0, 0),
+        (2213, 10, 27, 2, 30, 0),
+        (1850, 1, 1, 0, 0, 1),
+    ],
+)
+def test_create_matches_timezone_normalization(
+    year: int, month: int, day: int, hour: int, minute: int, fold: int
+) -> None:
+    tz = timezone("Europe/Paris")
+
+    for _ in range(2):
+        # The second creation goes through the cached unambiguous period
+        dt = pendulum.datetime(year, month, day, hour, minute, tz=tz, fold=fold)
+        expected = tz.convert(datetime(year, month, day, hour, minute, fold=fold))
+
+        assert dt.isoformat() == expected.isoformat()
+        assert dt.fold == expected.fold
+
+
+def test_create_with_fixed_offset() -> None:
+    tz = pendulum.FixedTimezone(-5 * 3600)
+    dt = pendulum.datetime(2016, 11, 12, 2, 9, 39, tz=tz, fold=1)
+
+    assert isinstance(dt, DateTime)
+    assert_datetime(dt, 2016, 11, 12, 2, 9, 39)
+    assert dt.tzinfo is tz
+    assert dt.fold == 0
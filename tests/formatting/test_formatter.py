@@ -1,16 +1,22 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 import pendulum
 
 from pendulum.formatting import Formatter
+from pendulum.formatting.formatter import FormatMatcher
 from pendulum.locales.locale import Locale
 
 
 @pytest.fixture(autouse=True)
 def setup():
-    Locale._cache["dummy"] = {}
+    # A locale without custom date formats
+    data = Locale.load("en")._data
+    custom = {k: v for k, v in data["custom"].items() if k != "date_formats"}
+    Locale._cache["dummy"] = Locale("dummy", {**data, "custom": custom})
 
     yield
 
@@ -275,3 +281,94 @@ def test_unknown_token():
     d = pendulum.datetime(2016, 8, 28, 7, 3, 6, 123456)
 
     assert f.format(d, "J") == "J"
+
+
+def test_format_plans_are_cached():
+    f = Formatter()
+    d = pendulum.datetime(2016, 8, 28, 7, 3, 6, 123456)
+
+    assert f.format(d, "YYYY-MM-DD [at] HH:mm:ss.SSS") == "2016-08-28 at 07:03:06.123"
+    assert len(f._format_plans) == 1
+
+    assert f.format(d, "YYYY-MM-DD [at] HH:mm:ss.SSS") == "2016-08-28 at 07:03:06.123"
+    assert f.format(d, "MMMM", locale="fr") == "août"
+    assert len(f._format_plans) == 2
+
+
+def test_format_plans_are_bounded(monkeypatch):
+    monkeypatch.setattr(Formatter, "_FORMAT_PLANS_SIZE", 2)
+    f = Formatter()
+    d = pendulum.datetime(2016, 8, 28, 7, 3, 6, 123456)
+
+    f.format(d, "YYYY")
+    f.format(d, "MM")
+    f.format(d, "YYYY")
+    f.format(d, "DD")
+
+    assert [fmt for fmt, _ in f._format_plans] == ["YYYY", "DD"]
+
+
+def test_format_plans_from_threads(monkeypatch):
+    monkeypatch.setattr(Formatter, "_FORMAT_PLANS_SIZE", 2)
+    f = Formatter()
+    d = pendulum.datetime(2016, 8, 28, 7, 3, 6, 123456)
+    formats = ["YYYY", "MM", "DD", "HH", "mm", "ss"] * 500
+
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(lambda fmt: f.format(d, fmt), formats))
+
+    assert results == ["2016", "08", "28", "07", "03", "06"] * 500
+    assert len(f._format_plans) == 2
+
+
+def test_parse_patterns_are_cached():
+    f = Formatter()
+    now = pendulum.datetime(2016, 8, 28)
+
+    parsed = f.parse("2016-08-28 07:03:06", "YYYY-MM-DD HH:mm:ss", now)
+    assert (parsed["year"], parsed["month"], parsed["day"]) == (2016, 8, 28)
+    assert len(f._parse_patterns) == 1
+
+    parsed = f.parse("2017-09-29 08:04:07", "YYYY-MM-DD HH:mm:ss", now)
+    assert (parsed["hour"], parsed["minute"], parsed["second"]) == (8, 4, 7)
+    assert len(f._parse_patterns) == 1
+
+    with pytest.raises(ValueError):
+        f.parse("2017-09-29", "YYYY-MM-DD HH:mm:ss", now)
+
+
+def test_parse_patterns_from_threads(monkeypatch):
+    monkeypatch.setattr(Formatter, "_PARSE_PATTERNS_SIZE", 2)
+    f = Formatter()
+    now = pendulum.datetime(2016, 8, 28)
+    formats = ["YYYY", "YYYY MMMM", "MMMM", "DD MMMM", "dddd", "Do"] * 200
+    texts = ["2016", "2016 August", "August", "28 August", "Sunday", "28th"] * 200
+
+    def parse(text, fmt):
+        return f.parse(text, fmt, now)
+
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(parse, texts, formats))
+
+    assert len(results) == len(texts)
+    assert len(f._parse_patterns) == 2
+
+
+@pytest.mark.skipif(FormatMatcher is None, reason="Requires the Rust extension")
+def test_parse_native_matcher():
+    f = Formatter()
+    now = pendulum.datetime(2016, 8, 28)
+
+    parsed = f.parse("2016-08-28 07:03:06.123 +05:30", "YYYY-MM-DD HH:mm:ss.SSS Z", now)
+    assert parsed["year"] == 2016
+    assert parsed["microsecond"] == 123000
+    assert parsed["tz"] == pendulum.timezone(19800)
+    assert f._native_matchers["YYYY-MM-DD HH:mm:ss.SSS Z"] is not None
+
+    # Locale-dependent tokens use the regular path
+    parsed = f.parse("28th August 2016", "Do MMMM YYYY", now)
+    assert (parsed["year"], parsed["month"], parsed["day"]) == (2016, 8, 28)
+    assert f._native_matchers["Do MMMM YYYY"] is None
+
+    with pytest.raises(ValueError):
+        f.parse("2016-08-28 13", "YYYY-MM-DD hh", now)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 import pendulum
 
 from pendulum.interval import Interval
@@ -117,3 +119,111 @@ def test_range_amount():
     assert_datetime(r[1], 2016, 10, 16, 1, 0, 0)
     assert_datetime(r[2], 2016, 10, 18, 0, 0, 0)
     assert_datetime(r[3], 2016, 10, 20, 0, 0, 0)
+
+
+def test_range_is_lazy_sequence():
+    dt1 = pendulum.datetime(2000, 1, 1, 12, 45, 37)
+    dt2 = pendulum.datetime(2010, 1, 1, 12, 45, 37)
+
+    r = Interval(dt1, dt2).range("minutes", 15)
+
+    assert len(r) == 350_689
+    assert_datetime(r[1], 2000, 1, 1, 13, 0, 37)
+    assert_datetime(r[-1], 2010, 1, 1, 12, 45, 37)
+    assert_datetime(r[-2], 2010, 1, 1, 12, 30, 37)
+    assert pendulum.datetime(2005, 6, 1, 8, 30, 37) in r
+    assert pendulum.datetime(2005, 6, 1, 8, 31, 37) not in r
+    assert pendulum.datetime(2010, 1, 1, 13, 0, 37) not in r
+    assert pendulum.date(2005, 6, 1) not in r
+
+    with pytest.raises(IndexError):
+        r[350_689]
+
+
+def test_range_slicing():
+    dt1 = pendulum.datetime(2016, 1, 31, tz="America/Sao_Paulo")
+    dt2 = dt1.add(years=2)
+
+    r = Interval(dt1, dt2).range("months")
+    page = r[10:20:3]
+
+    assert len(r) == 25
+    assert len(page) == 4
+    assert [dt.month for dt in page] == [11, 2, 5, 8]
+    assert_datetime(page[1], 2017, 2, 28, 0, 0, 0)
+    assert list(r[::-1]) == list(r)[::-1]
+    assert pendulum.datetime(2017, 2, 28, tz="America/Sao_Paulo") in r
+    assert pendulum.datetime(2017, 2, 28, tz="America/Sao_Paulo") not in page[2:]
+
+
+def test_range_with_dst_is_indexed():
+    dt1 = pendulum.datetime(2016, 10, 14, tz="America/Sao_Paulo")
+    dt2 = dt1.add(weeks=1)
+
+    r = pendulum.interval(dt2, dt1).range("days")
+
+    assert len(r) == 8
+    assert_datetime(r[-3], 2016, 10, 16, 1, 0, 0)
+    assert pendulum.datetime(2016, 10, 16, 1, tz="America/Sao_Paulo") in r
+
+
+def test_range_dates():
+    p = pendulum.interval(pendulum.date(2020, 1, 31), pendulum.date(2021, 3, 1))
+
+    r = p.range("months")
+
+    assert len(r) == 14
+    assert r[1] == pendulum.date(2020, 2, 29)
+    assert r[-1] == pendulum.date(2021, 2, 28)
+    assert pendulum.date(2020, 2, 29) in r
+    assert pendulum.date(2020, 2, 28) not in r
+
+
+def test_range_invalid_amount():
+    p = pendulum.interval(pendulum.date(2020, 1, 1), pendulum.date(2021, 1, 1))
+
+    with pytest.raises(ValueError):
+        p.range("days", 0)
+
+
+@pytest.mark.parametrize(
+    "tz", ["Europe/Paris", "Australia/Lord_Howe", "UTC", pendulum.FixedTimezone(-9000)]
+)
+@pytest.mark.parametrize("unit", ["minutes", "hours", "days"])
+def test_range_iteration_matches_indexing(tz, unit):
+    dt1 = pendulum.datetime(2024, 3, 30, 1, 30, tz=tz)
+    dt2 = pendulum.datetime(2024, 11, 3, 3, tz=tz)
+
+    r = pendulum.interval(dt1, dt2).range(unit, 17)
+    dates = list(r)
+
+    assert len(dates) == len(r)
+    assert [(dt, dt.fold) for dt in dates] == [
+        (r[i], r[i].fold) for i in range(len(r))
+    ]
+    assert list(r[::-7]) == dates[::-7]
+
+
+def test_range_hours_over_dst_transitions():
+    dt1 = pendulum.datetime(2024, 10, 27, tz="Europe/Paris")
+    dt2 = dt1.add(hours=4)
+
+    r = list(pendulum.interval(dt1, dt2).range("hours"))
+
+    assert [(dt.hour, dt.fold, dt.offset) for dt in r] == [
+        (0, 1, 7200),
+        (1, 0, 7200),
+        (2, 0, 7200),
+        (2, 1, 3600),
+        (3, 0, 3600),
+    ]
+
+
+def test_range_naive_minutes():
+    dt1 = pendulum.naive(2024, 12, 31, 23, 58)
+    dt2 = pendulum.naive(2025, 1, 1, 0, 1)
+
+    r = list(pendulum.interval(dt1, dt2).range("minutes"))
+
+    assert r == [dt1.add(minutes=i) for i in range(4)]
+    assert all(dt.tzinfo is None for dt in r)
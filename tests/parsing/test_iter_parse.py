@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import io
+import re
+
+import pytest
+
+import pendulum
+
+from pendulum.parsing import ParserError
+from pendulum.parsing import iter_parse
+
+
+LOG = (
+    "2016-10-06T12:34:56Z GET /index.html 200\n"
+    "2016-10-06T12:34:57+02:00 GET /about.html 404\n"
+    "2016-10-07 POST /login 302\n"
+)
+
+
+def test_iter_parse_path(tmp_path):
+    path = tmp_path / "access.log"
+    path.write_text(LOG)
+
+    values = list(iter_parse(path, column=0, batch_size=2))
+
+    assert values == [
+        pendulum.datetime(2016, 10, 6, 12, 34, 56),
+        pendulum.datetime(2016, 10, 6, 12, 34, 57, tz=pendulum.fixed_timezone(7200)),
+        pendulum.datetime(2016, 10, 7),
+    ]
+    assert all(isinstance(value, pendulum.DateTime) for value in values)
+    assert values[1].offset == 7200
+
+
+def test_iter_parse_text_file():
+    values = list(iter_parse(io.StringIO(LOG), column=0, tz="Europe/Paris"))
+
+    assert values[2] == pendulum.datetime(2016, 10, 7, tz="Europe/Paris")
+    assert values[2].timezone_name == "Europe/Paris"
+
+
+def test_iter_parse_pattern():
+    lines = io.BytesIO(b"id=1 at=2016-10-06T12:34:56Z\nid=2 at=2016-10-06T12:35:56Z\n")
+
+    values = list(iter_parse(lines, pattern=r"at=(\S+)"))
+
+    assert values == [
+        pendulum.datetime(2016, 10, 6, 12, 34, 56),
+        pendulum.datetime(2016, 10, 6, 12, 35, 56),
+    ]
+
+    lines.seek(0)
+
+    assert len(list(iter_parse(lines, pattern=re.compile(r"\d{4}-\d\d-\d\d")))) == 2
+
+
+def test_iter_parse_span():
+    values = list(iter_parse(io.BytesIO(LOG.encode()), span=(0, 10)))
+
+    assert values == [
+        pendulum.datetime(2016, 10, 6),
+        pendulum.datetime(2016, 10, 6),
+        pendulum.datetime(2016, 10, 7),
+    ]
+
+
+def test_iter_parse_raw():
+    values = list(iter_parse(io.StringIO(LOG), column=0, raw=True))
+
+    assert values == [
+        pendulum.datetime(2016, 10, 6, 12, 34, 56).int_timestamp,
+        pendulum.datetime(2016, 10, 6, 10, 34, 57).int_timestamp,
+        pendulum.datetime(2016, 10, 7).int_timestamp,
+    ]
+
+    values = list(iter_parse(io.StringIO(LOG), column=0, raw=True, tz="Europe/Paris"))
+
+    assert values[2] == pendulum.datetime(2016, 10, 7, tz="Europe/Paris").int_timestamp
+
+
+def test_iter_parse_invalid():
+    lines = io.StringIO("2016-10-06T12:34:56Z\ninvalid\n\n2016-10-07\n")
+
+    with pytest.raises(ParserError, match="line 2"):
+        list(iter_parse(lines))
+
+    lines.seek(0)
+
+    assert list(iter_parse(lines, skip_invalid=True)) == [
+        pendulum.datetime(2016, 10, 6, 12, 34, 56),
+        pendulum.datetime(2016, 10, 7),
+    ]
+
+    with pytest.raises(ParserError, match="No timestamp found on line 1"):
+        list(iter_parse(io.StringIO("foo\n"), column=3))
+
+
+@pytest.mark.parametrize("last", ["2016-10-08 foo\n", "foo\n"])
+def test_iter_parse_yields_valid_lines_before_errors(last):
+    lines = io.StringIO("x 2016-10-06\nx 2016-10-07\n" + last)
+    values = iter_parse(lines, column=1)
+
+    assert next(values) == pendulum.datetime(2016, 10, 6)
+    assert next(values) == pendulum.datetime(2016, 10, 7)
+
+    with pytest.raises(ParserError, match="line 3"):
+        next(values)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pickle
+
 from datetime import date
 from datetime import datetime
 from datetime import time
@@ -7,6 +9,9 @@ from datetime import time
 import pytest
 
 from pendulum.parsing import parse_iso8601
+from pendulum.parsing import parse_iso8601_interval
+from pendulum.parsing import parse_iso8601_many
+from pendulum.tz.timezone import UTC
 
 
 try:
@@ -168,6 +173,116 @@ def test_parse_ios8601_invalid():
         parse_iso8601("2012-W123")  # Missing separator
 
 
+def test_parse_iso8601_many():
+    assert parse_iso8601_many(["2016-10-06", "12:34", "2016-10-06T12:34:56Z"]) == [
+        date(2016, 10, 6),
+        time(12, 34),
+        datetime(2016, 10, 6, 12, 34, 56, tzinfo=FixedTimezone(0)),
+    ]
+    assert parse_iso8601_many(iter(["2016", "2017"])) == [
+        date(2016, 1, 1),
+        date(2017, 1, 1),
+    ]
+    assert parse_iso8601_many([]) == []
+
+
+def test_parse_iso8601_many_invalid():
+    with pytest.raises(ValueError):
+        parse_iso8601_many(["2016-10-06", "20161306T123456"])
+
+
+def test_parse_iso8601_many_with_errors():
+    results, errors = parse_iso8601_many(
+        ["2016-10-06", "20161306T123456", "12:34"], errors=True
+    )
+
+    assert results == [date(2016, 10, 6), None, time(12, 34)]
+    assert errors[0] is None
+    assert isinstance(errors[1], ValueError)
+    assert errors[2] is None
+
+
+def test_parse_iso8601_interval():
+    start, end, duration = parse_iso8601_interval(
+        "2008-05-11T15:30:00/2008-05-12T16:00:00"
+    )
+
+    assert start == datetime(2008, 5, 11, 15, 30)
+    assert end == datetime(2008, 5, 12, 16)
+    assert duration is None
+
+    start, end, duration = parse_iso8601_interval("2008-05-11T15:30:00Z/P1DT2H")
+
+    assert start == datetime(2008, 5, 11, 15, 30, tzinfo=FixedTimezone(0))
+    assert end is None
+    assert (duration.days, duration.hours) == (1, 2)
+
+    start, end, duration = parse_iso8601_interval("P1Y2M/2008-05-11")
+
+    assert start is None
+    assert end == date(2008, 5, 11)
+    assert (duration.years, duration.months) == (1, 2)
+
+
+@pytest.mark.parametrize(
+    ["text", "expected"],
+    [
+        ("2008-05/2008-06", (date(2008, 5, 1), date(2008, 6, 1))),
+        ("2008-W20/2008-W21-1", (date(2008, 5, 12), date(2008, 5, 19))),
+        ("2008-W20-3/P1D", (date(2008, 5, 14), None)),
+        ("2008W203/2008W21", (date(2008, 5, 14), date(2008, 5, 19))),
+        ("2008136/2008137", (date(2008, 5, 15), date(2008, 5, 16))),
+        ("2008-136/P1D", (date(2008, 5, 15), None)),
+    ],
+)
+def test_parse_iso8601_interval_reduced_dates(text, expected):
+    start, end, _ = parse_iso8601_interval(text)
+
+    assert (start, end) == expected
+
+
+@pytest.mark.parametrize(
+    "text", ["2008-05-11", "P1D", "2008-05-11/", "P1D/P1D", "2008/05/11"]
+)
+def test_parse_iso8601_interval_invalid(text):
+    with pytest.raises(ValueError):
+        parse_iso8601_interval(text)
+
+
+def test_parse_iso8601_shares_offset_timezones():
+    first, second = parse_iso8601_many(
+        ["2016-10-06T12:34:56+05:30", "2016-10-07T12:34:56+05:30"]
+    )
+
+    assert first.tzinfo is second.tzinfo
+    assert first.utcoffset() is second.utcoffset()
+
+
+def test_parse_iso8601_offset_timezones_are_picklable():
+    parsed = parse_iso8601("2016-10-06T12:34:56+05:30")
+
+    unpickled = pickle.loads(pickle.dumps(parsed))
+
+    assert unpickled == parsed
+    assert unpickled.utcoffset() == parsed.utcoffset()
+    assert unpickled.tzname() == parsed.tzname() == "+05:30"
+    assert type(unpickled.tzinfo) is type(parsed.tzinfo)
+
+
+def test_parse_iso8601_utc():
+    assert parse_iso8601("2016-10-06T12:34:56+00:00", utc=True).tzinfo is UTC
+    assert parse_iso8601("2016-10-06T12:34:56Z", utc=True).tzinfo is UTC
+    assert parse_iso8601("12:34:56Z", utc=True).tzinfo is UTC
+    assert parse_iso8601("2016-10-06T12:34:56+00:00").tzinfo is not UTC
+
+    results = parse_iso8601_many(
+        ["2016-10-06T12:34:56Z", "2016-10-06T12:34:56+01:00"], utc=True
+    )
+
+    assert results[0].tzinfo is UTC
+    assert results[1].utcoffset().total_seconds() == 3600
+
+
 @pytest.mark.parametrize(
     ["text", "expected"],
     [
@@ -8,6 +8,8 @@ import pendulum
 
 from pendulum.parsing import ParserError
 from pendulum.parsing import parse
+from pendulum.parsing import try_parse
+from pendulum.parsing import try_parse_iso8601
 
 
 def test_y():
@@ -671,6 +673,30 @@ def test_invalid():
         parse(text)
 
 
+@pytest.mark.parametrize(
+    "text",
+    ["201610T", "2012-W54", "2012-W13-8", "2017W53", "/2012", "2012/", "P1W1D", "foo"],
+)
+def test_try_parse_invalid(text):
+    assert try_parse(text) is None
+    assert try_parse_iso8601(text) is None
+
+
+def test_try_parse():
+    assert try_parse("2016-10-06") == datetime.datetime(2016, 10, 6)
+    assert try_parse("2016-10-06", exact=True) == datetime.date(2016, 10, 6)
+    assert try_parse("2016-10-06 12:34") == datetime.datetime(2016, 10, 6, 12, 34)
+    assert try_parse("P2Y") is not None
+    assert try_parse_iso8601("2016-10-06T12:34:56") == datetime.datetime(
+        2016, 10, 6, 12, 34, 56
+    )
+
+
+def test_try_parse_not_strict():
+    assert try_parse("Oct 6 2016", strict=False) == datetime.datetime(2016, 10, 6)
+    assert try_parse("Not a date", strict=False) is None
+
+
 def test_exif_edge_case():
     text = "2016:12:26 15:45:28"
 
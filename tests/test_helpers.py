@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from datetime import date
 from datetime import datetime
 
 import pytest
@@ -9,6 +10,7 @@ import pendulum
 
 from pendulum import timezone
 from pendulum.helpers import PreciseDiff
+from pendulum.helpers import add_duration
 from pendulum.helpers import days_in_year
 from pendulum.helpers import precise_diff
 from pendulum.helpers import week_day
@@ -136,6 +138,44 @@ def test_days_in_years() -> None:
     assert days_in_year(2016) == 366
 
 
+def test_add_duration() -> None:
+    dt = datetime(2016, 1, 31, 23, 59, 59, 999999)
+
+    assert add_duration(dt, months=1) == datetime(2016, 2, 29, 23, 59, 59, 999999)
+    assert add_duration(dt, years=1, months=13) == datetime(
+        2018, 2, 28, 23, 59, 59, 999999
+    )
+    assert add_duration(dt, months=-14) == datetime(2014, 11, 30, 23, 59, 59, 999999)
+    assert add_duration(dt, microseconds=1) == datetime(2016, 2, 1)
+    assert add_duration(dt, seconds=-86400.5) == datetime(
+        2016, 1, 30, 23, 59, 59, 499999
+    )
+    assert add_duration(dt, weeks=1, days=-8, hours=25, minutes=-60) == dt
+    assert add_duration(date(2016, 1, 31), months=1, days=1) == date(2016, 3, 1)
+
+
+def test_add_duration_keeps_tzinfo() -> None:
+    tz = timezone("Europe/Paris")
+    dt = datetime(2016, 3, 27, 1, 30, tzinfo=tz, fold=1)
+
+    result = add_duration(dt, hours=1)
+
+    assert result == datetime(2016, 3, 27, 2, 30, tzinfo=tz)
+    assert result.tzinfo is tz
+    assert result.fold == 0
+
+
+def test_add_duration_errors() -> None:
+    with pytest.raises(RuntimeError):
+        add_duration(date(2016, 1, 31), hours=1)
+
+    with pytest.raises(ValueError):
+        add_duration(datetime(9999, 12, 31), months=1)
+
+    with pytest.raises(OverflowError):
+        add_duration(datetime(9999, 12, 31), days=1)
+
+
 def test_locale() -> None:
     dt = pendulum.datetime(2000, 11, 10, 12, 34, 56, 123456)
     pendulum.set_locale("fr")
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import zoneinfo
+
 from datetime import date
 from datetime import datetime
 from datetime import time
+from datetime import timedelta
+from datetime import tzinfo
 
+import pytest
 import pytz
 
 from dateutil import tz
@@ -12,6 +17,7 @@ import pendulum
 
 from pendulum import _safe_timezone
 from pendulum import timezone
+from pendulum.tz.exceptions import InvalidTimezone
 from pendulum.tz.timezone import Timezone
 
 
@@ -61,3 +67,75 @@ def test_safe_timezone_with_tzinfo_objects() -> None:
 
     assert isinstance(tz, Timezone)
     assert tz.name == "Europe/Paris"
+
+
+def test_safe_timezone_caches_names() -> None:
+    assert _safe_timezone("Europe/Paris") is _safe_timezone("Europe/Paris")
+    assert _safe_timezone("utc") is pendulum.UTC
+
+
+def test_safe_timezone_caches_tzinfo_objects() -> None:
+    paris = pytz.timezone("Europe/Paris")
+
+    assert _safe_timezone(paris) is _safe_timezone(paris)
+    assert _safe_timezone(paris).name == "Europe/Paris"
+    assert _safe_timezone(zoneinfo.ZoneInfo("America/New_York")).name == (
+        "America/New_York"
+    )
+
+
+def test_safe_timezone_caches_datetime_timezones() -> None:
+    first = datetime.fromisoformat("2016-10-06T12:34:56+05:30").tzinfo
+    second = datetime.fromisoformat("2016-10-07T12:34:56+05:30").tzinfo
+    utc = datetime.fromisoformat("2016-10-06T12:34:56+00:00").tzinfo
+
+    assert first is not second
+    assert _safe_timezone(first) is _safe_timezone(second)
+    assert _safe_timezone(first).offset == 19800
+    assert _safe_timezone(utc) is pendulum.UTC
+
+
+def test_safe_timezone_does_not_cache_datetime_dependent_tzinfo_objects() -> None:
+    class Offset(tzinfo):
+        def utcoffset(self, dt: datetime | None) -> timedelta:
+            return timedelta(hours=dt.month if dt is not None else 0)
+
+        def tzname(self, dt: datetime | None) -> str:
+            return "Offset"
+
+        def dst(self, dt: datetime | None) -> timedelta:
+            return timedelta()
+
+    offset = Offset()
+
+    assert _safe_timezone(offset, datetime(2022, 1, 1)).offset == 3600
+    assert _safe_timezone(offset, datetime(2022, 2, 1)).offset == 7200
+
+
+def test_preload() -> None:
+    from pendulum.locales.locale import Locale
+
+    from pendulum.tz import transitions
+
+    pendulum.preload(timezones=["Asia/Kolkata", "UTC"], locales=["fr", "de"])
+
+    assert _safe_timezone("Asia/Kolkata").name == "Asia/Kolkata"
+    assert "Asia/Kolkata" in transitions._tables
+    assert "fr" in Locale._cache
+    assert "de" in Locale._cache
+
+
+def test_preload_with_threads() -> None:
+    from pendulum.locales.locale import Locale
+
+    pendulum.preload(
+        timezones=["Europe/Berlin", "America/Chicago"], locales=["it"], max_workers=2
+    )
+
+    assert _safe_timezone("America/Chicago").name == "America/Chicago"
+    assert "it" in Locale._cache
+
+
+def test_preload_invalid_timezone() -> None:
+    with pytest.raises(InvalidTimezone):
+        pendulum.preload(timezones=["Europe/Nowhere"], max_workers=2)
@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
 import pendulum
 
+from pendulum.parser import CachedParser
+from pendulum.parser import parse_iso8601_datetime
 from tests.conftest import assert_date
 from tests.conftest import assert_datetime
 from tests.conftest import assert_duration
@@ -142,3 +148,140 @@ def test_parse_with_utc_timezone() -> None:
     dt = pendulum.parse("2020-02-05T20:05:37.364951Z")
 
     assert dt.to_iso8601_string() == "2020-02-05T20:05:37.364951Z"
+
+
+def test_parse_with_default() -> None:
+    assert pendulum.parse("invalid", default=None) is None
+    assert pendulum.parse("2016-13-45", default="") == ""
+
+    dt = pendulum.parse("2016-10-16T12:34:56", default=None)
+
+    assert isinstance(dt, pendulum.DateTime)
+    assert_datetime(dt, 2016, 10, 16, 12, 34, 56)
+
+
+def test_try_parse() -> None:
+    assert pendulum.try_parse("invalid") is None
+    assert pendulum.try_parse("invalid", default=0) == 0
+    assert pendulum.try_parse("99999999999999999999999", strict=False) is None
+
+    dt = pendulum.try_parse("2016-10-16", tz="Europe/Paris")
+
+    assert isinstance(dt, pendulum.DateTime)
+    assert dt.timezone_name == "Europe/Paris"
+
+    interval = pendulum.try_parse("2008-05-11T15:30:00Z/P1Y2M10DT2H30M")
+
+    assert isinstance(interval, pendulum.Interval)
+
+
+def test_parse_with_fixed_timezone() -> None:
+    tz = pendulum.fixed_timezone(-18000)
+
+    dt = pendulum.parse("2016-10-16T12:34:56", tz=tz)
+
+    assert_datetime(dt, 2016, 10, 16, 12, 34, 56)
+    assert dt.tzinfo is tz
+    assert dt.fold == 0
+
+    dt = pendulum.parse("2016-10-16T12:34:56+00:00", tz=tz)
+
+    assert dt.timezone_name == "+00:00"
+    assert dt.fold == 0
+
+
+@pytest.mark.skipif(
+    parse_iso8601_datetime is None, reason="Requires the Rust extension"
+)
+def test_parse_iso8601_datetime() -> None:
+    dt = parse_iso8601_datetime("2016-10-16T12:34:56.123456+01:30", pendulum.UTC)
+
+    assert isinstance(dt, pendulum.DateTime)
+    assert_datetime(dt, 2016, 10, 16, 12, 34, 56, 123456)
+    assert dt.tzinfo is pendulum.fixed_timezone(5400)
+
+    dt = parse_iso8601_datetime("2016-10-16T12:34:56Z", pendulum.UTC)
+
+    assert dt.tzinfo is pendulum.UTC
+    assert dt.fold == 1
+
+    assert parse_iso8601_datetime("2016-10-16", pendulum.UTC) is None
+    assert parse_iso8601_datetime("P2Y", pendulum.UTC) is None
+    assert parse_iso8601_datetime("2016-10-16T24:00:00", pendulum.UTC) is None
+    assert parse_iso8601_datetime("2016-13-16T12:34:56", pendulum.UTC) is None
+
+
+def test_parse_with_cache() -> None:
+    parser = CachedParser(maxsize=2)
+
+    dt = parser.parse("2016-10-16T12:34:56")
+
+    assert isinstance(dt, pendulum.DateTime)
+    assert parser.parse("2016-10-16T12:34:56") is dt
+    assert parser.parse("2016-10-16T12:34:56", tz="Europe/Paris") is not dt
+    assert parser.cache_info() == (1, 2, 2, 2)
+
+    d = parser.parse("2016-10-16")
+
+    assert isinstance(d, pendulum.DateTime)
+    assert parser.parse("2016-10-16", exact=True) == pendulum.date(2016, 10, 16)
+    assert parser.cache_info().currsize == 2
+
+    assert parser.parse("invalid", default=None) is None
+
+    parser.cache_clear()
+
+    assert parser.cache_info() == (0, 0, 2, 0)
+
+
+def test_parse_with_cache_parses_invalid_strings_once(monkeypatch) -> None:
+    calls = []
+    parse = pendulum.parser._parse
+
+    def _parse(text, **options):
+        calls.append(text)
+
+        return parse(text, **options)
+
+    monkeypatch.setattr(pendulum.parser, "_parse", _parse)
+    parser = CachedParser()
+
+    assert parser.parse("invalid", default=0) == 0
+
+    with pytest.raises(pendulum.parsing.ParserError):
+        parser.parse("invalid")
+
+    assert calls == ["invalid", "invalid"]
+    assert parser.cache_info().currsize == 0
+
+
+def test_parse_with_cache_from_threads() -> None:
+    parser = CachedParser(maxsize=2)
+    texts = [f"2016-10-{day:02}" for day in range(1, 9)] * 500
+
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(parser.parse, texts))
+
+    assert [dt.day for dt in results] == [int(text[-2:]) for text in texts]
+    assert parser.cache_info().currsize == 2
+
+
+def test_parse_with_cache_does_not_keep_times() -> None:
+    parser = CachedParser()
+
+    with pendulum.travel_to(pendulum.datetime(2015, 11, 12), freeze=True):
+        dt = parser.parse("12:34:56")
+
+    assert_datetime(dt, 2015, 11, 12, 12, 34, 56)
+
+    with pendulum.travel_to(pendulum.datetime(2015, 11, 13), freeze=True):
+        dt = parser.parse("12:34:56")
+
+    assert_datetime(dt, 2015, 11, 13, 12, 34, 56)
+    assert parser.cache_info().currsize == 0
+
+
+def test_parse_cache_option() -> None:
+    dt = pendulum.parse("2016-10-16T12:34:56+02:00", cache=True)
+
+    assert pendulum.parse("2016-10-16T12:34:56+02:00", cache=True) is dt
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import pickle
+
+import pytest
+
+import pendulum
+
+from pendulum.tz import bundle
+from pendulum.tz import timezones
+from pendulum.tz.timezone import Timezone
+
+
+@pytest.fixture
+def zones(tmp_path):
+    path = tmp_path / "zones.bin"
+    bundle.build(path, ["Europe/Paris", "America/New_York", "Asia/Kolkata"])
+
+    yield bundle.load(path)
+
+    bundle.unload()
+
+
+def test_bundle_keys(zones):
+    assert zones.keys() == ("America/New_York", "Asia/Kolkata", "Europe/Paris")
+    assert len(zones) == 3
+    assert "Europe/Paris" in zones
+    assert "Europe/Berlin" not in zones
+    assert timezones() == zones.keys()
+
+
+def test_bundle_timezone(zones):
+    tz = pendulum.timezone("Europe/Paris")
+
+    assert isinstance(tz, bundle.BundledTimezone)
+    assert tz is zones.timezone("Europe/Paris")
+    assert tz.name == "Europe/Paris"
+
+    dt = pendulum.datetime(2013, 3, 31, 2, 30, tz=tz)
+
+    assert dt.isoformat() == "2013-03-31T03:30:00+02:00"
+    assert dt.in_timezone("America/New_York").isoformat() == (
+        "2013-03-30T21:30:00-04:00"
+    )
+    assert pendulum.timezone("Europe/Berlin").name == "Europe/Berlin"
+
+
+def test_bundle_is_used_for_resolved_names(tmp_path):
+    before = pendulum.datetime(2016, 1, 1, tz="Asia/Kolkata").tz
+
+    path = tmp_path / "zones.bin"
+    bundle.build(path, ["Asia/Kolkata"])
+    zones = bundle.load(path)
+
+    try:
+        dt = pendulum.datetime(2016, 1, 1, tz="Asia/Kolkata")
+
+        assert not isinstance(before, bundle.BundledTimezone)
+        assert dt.tz is zones.timezone("Asia/Kolkata")
+    finally:
+        bundle.unload()
+
+    assert not isinstance(
+        pendulum.datetime(2016, 1, 1, tz="Asia/Kolkata").tz, bundle.BundledTimezone
+    )
+
+
+def test_bundle_data_is_compact(zones):
+    original = bundle._read_tzdata("Europe/Paris")
+
+    assert len(zones.data("Europe/Paris")) <= len(original)
+
+
+def test_bundled_timezone_transitions(zones):
+    tz = zones.timezone("America/New_York")
+
+    assert [
+        t.at
+        for t in tz.transitions(
+            pendulum.datetime(2200, 1, 1), pendulum.datetime(2201, 1, 1)
+        )
+    ] == [pendulum.datetime(2200, 3, 9, 7), pendulum.datetime(2200, 11, 2, 6)]
+
+
+def test_bundled_timezone_pickles_by_key(zones):
+    tz = pickle.loads(pickle.dumps(zones.timezone("Asia/Kolkata")))
+
+    assert type(tz) is Timezone
+    assert tz.key == "Asia/Kolkata"
+
+
+def test_invalid_bundle(tmp_path):
+    path = tmp_path / "zones.bin"
+    path.write_bytes(b"\x00" * 64)
+
+    with pytest.raises(ValueError):
+        bundle.load(path)
@@ -7,6 +7,9 @@ import pytest
 
 from pendulum.tz.local_timezone import _get_unix_timezone
 from pendulum.tz.local_timezone import _get_windows_timezone
+from pendulum.tz.local_timezone import get_local_timezone
+from pendulum.tz.local_timezone import set_local_timezone
+from pendulum.tz.local_timezone import watch_local_timezone
 
 
 @pytest.mark.skipif(
@@ -50,3 +53,50 @@ def test_unix_etc_timezone_dir():
     tz = _get_unix_timezone(_root=root_path)
 
     assert tz.name == "Europe/Paris"
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32", reason="Test only available for UNIX systems"
+)
+def test_watch_local_timezone(monkeypatch):
+    monkeypatch.setenv("TZ", "Europe/Paris")
+    set_local_timezone()
+    monkeypatch.setattr(
+        sys.modules["pendulum.tz.local_timezone"], "_local_timezone", None
+    )
+
+    try:
+        watch_local_timezone(0)
+
+        assert get_local_timezone().name == "Europe/Paris"
+
+        monkeypatch.setenv("TZ", "America/New_York")
+
+        assert get_local_timezone().name == "America/New_York"
+
+        watch_local_timezone(3600)
+
+        assert get_local_timezone().name == "America/New_York"
+
+        monkeypatch.setenv("TZ", "Asia/Tokyo")
+
+        assert get_local_timezone().name == "America/New_York"
+    finally:
+        watch_local_timezone(None)
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32", reason="Test only available for UNIX systems"
+)
+def test_local_timezone_is_not_watched_by_default(monkeypatch):
+    monkeypatch.setenv("TZ", "Europe/Paris")
+    set_local_timezone()
+    monkeypatch.setattr(
+        sys.modules["pendulum.tz.local_timezone"], "_local_timezone", None
+    )
+
+    assert get_local_timezone().name == "Europe/Paris"
+
+    monkeypatch.setenv("TZ", "America/New_York")
+
+    assert get_local_timezone().name == "Europe/Paris"
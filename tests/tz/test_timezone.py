@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import pickle
 import zoneinfo
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from datetime import timedelta
 
@@ -10,9 +12,16 @@ import pytest
 import pendulum
 
 from pendulum import timezone
+from pendulum.tz import PRE_TRANSITION
+from pendulum.tz import SHIFT_FORWARD
+from pendulum.tz import TRANSITION_ERROR
 from pendulum.tz import fixed_timezone
 from pendulum.tz.exceptions import AmbiguousTime
 from pendulum.tz.exceptions import NonExistingTime
+from pendulum.tz.transitions import TzifTimezone
+from pendulum.tz.transitions import _open_tzfile
+from pendulum.tz.transitions import native_timezone
+from pendulum.tz.transitions import read_tzif
 from tests.conftest import assert_datetime
 
 
@@ -452,3 +461,259 @@ def test_repr():
     tz = timezone("Europe/Paris")
 
     assert repr(tz) == "Timezone('Europe/Paris')"
+
+
+def test_convert_many():
+    tz = timezone("Europe/Paris")
+    values = [
+        0,
+        pendulum.datetime(2013, 3, 31, 1, 30),
+        pendulum.datetime(2013, 10, 27, 0, 30),
+        pendulum.datetime(2013, 10, 27, 1, 30),
+        pendulum.datetime(2013, 10, 26, 19, 30, tz="America/New_York"),
+        1_000_000_000.5,
+    ]
+
+    dts = tz.convert_many(values)
+
+    assert [dt.isoformat() for dt in dts] == [
+        "1970-01-01T01:00:00+01:00",
+        "2013-03-31T03:30:00+02:00",
+        "2013-10-27T02:30:00+02:00",
+        "2013-10-27T02:30:00+01:00",
+        "2013-10-27T01:30:00+02:00",
+        "2001-09-09T03:46:40.500000+02:00",
+    ]
+    assert [dt.fold for dt in dts] == [0, 0, 0, 1, 0, 0]
+    assert all(dt.tzinfo is tz for dt in dts)
+
+
+def test_convert_many_matches_convert():
+    tz = timezone("America/New_York")
+    values = list(range(1_699_000_000, 1_700_000_000, 3_000)) + [4_102_444_800, 0]
+
+    dts = tz.convert_many(values)
+
+    for value, dt in zip(values, dts):
+        expected = pendulum.from_timestamp(value, tz)
+
+        assert dt == expected
+        assert dt.fold == expected.fold
+        assert dt.utcoffset() == expected.utcoffset()
+
+
+def test_convert_many_raw():
+    tz = timezone("Europe/Paris")
+
+    assert tz.convert_many([0, 1_000_000_000], raw=True) == [
+        (1970, 1, 1, 1, 0, 0, 0),
+        (2001, 9, 9, 3, 46, 40, 0),
+    ]
+
+
+def test_convert_many_fixed_timezone():
+    tz = fixed_timezone(-3600)
+
+    dts = tz.convert_many([0, pendulum.datetime(2020, 1, 1)])
+
+    assert [dt.isoformat() for dt in dts] == [
+        "1969-12-31T23:00:00-01:00",
+        "2019-12-31T23:00:00-01:00",
+    ]
+
+
+def test_transitions():
+    tz = timezone("Europe/Paris")
+
+    transitions = tz.transitions(
+        pendulum.datetime(2013, 1, 1), pendulum.datetime(2014, 1, 1)
+    )
+
+    assert [t.at for t in transitions] == [
+        pendulum.datetime(2013, 3, 31, 1),
+        pendulum.datetime(2013, 10, 27, 1),
+    ]
+    assert transitions[0].previous.offset == 3600
+    assert transitions[0].current.offset == 7200
+    assert transitions[0].current.dst == 3600
+    assert transitions[0].current.abbreviation == "CEST"
+    assert transitions[1].current.abbreviation == "CET"
+
+
+def test_transitions_bounds():
+    tz = timezone("Europe/Paris")
+    at = pendulum.datetime(2013, 3, 31, 1)
+
+    assert len(tz.transitions(at, at.add(seconds=1))) == 1
+    assert tz.transitions(at.subtract(hours=1), at) == []
+    assert tz.transitions(at.add(microseconds=1), at.add(hours=1)) == []
+
+
+def test_transitions_in_the_future():
+    tz = timezone("America/New_York")
+
+    transitions = tz.transitions(
+        pendulum.datetime(2200, 1, 1), pendulum.datetime(2201, 1, 1)
+    )
+
+    assert [t.at for t in transitions] == [
+        pendulum.datetime(2200, 3, 9, 7),
+        pendulum.datetime(2200, 11, 2, 6),
+    ]
+
+
+def test_next_transition():
+    tz = timezone("Europe/Paris")
+
+    transition = tz.next_transition(pendulum.datetime(2013, 3, 31, 1))
+
+    assert transition.at == pendulum.datetime(2013, 10, 27, 1)
+    assert transition.current.offset == 3600
+
+    assert timezone("UTC").next_transition(pendulum.datetime(2013, 1, 1)) is None
+
+
+def test_prev_transition():
+    tz = timezone("Europe/Paris")
+
+    transition = tz.prev_transition(pendulum.datetime(2013, 3, 31, 1))
+
+    assert transition.at == pendulum.datetime(2013, 3, 31, 1)
+    assert transition.previous.offset == 3600
+
+    assert tz.prev_transition(pendulum.datetime(1800, 1, 1)) is None
+
+
+@pytest.mark.skipif(TzifTimezone is None, reason="Requires the Rust extension")
+def test_tzif_timezone():
+    tz = native_timezone("Europe/Paris")
+    expected = zoneinfo.ZoneInfo("Europe/Paris")
+
+    for dt in [
+        datetime(1900, 1, 1),
+        datetime(2013, 3, 31, 2, 30),
+        datetime(2013, 10, 27, 2, 30),
+        datetime(2013, 10, 27, 2, 30, fold=1),
+        datetime(2134, 3, 28, 2, 30),
+        datetime(2134, 10, 31, 2, 30, fold=1),
+    ]:
+        assert dt.replace(tzinfo=tz).utcoffset() == dt.replace(
+            tzinfo=expected
+        ).utcoffset()
+        assert dt.replace(tzinfo=tz).dst() == dt.replace(tzinfo=expected).dst()
+        assert dt.replace(tzinfo=tz).tzname() == dt.replace(tzinfo=expected).tzname()
+
+    dt = pendulum.datetime(2013, 10, 27, 1, 30).astimezone(tz)
+
+    assert dt.isoformat() == "2013-10-27T02:30:00+01:00"
+    assert dt.fold == 1
+    assert isinstance(dt, pendulum.DateTime)
+    assert pickle.loads(pickle.dumps(tz)) is tz
+
+
+def test_localize_many():
+    tz = timezone("Europe/Paris")
+    values = [
+        datetime(2013, 3, 31, 1, 30),
+        datetime(2013, 3, 31, 2, 30, 15, 123),
+        datetime(2013, 10, 27, 2, 30),
+        datetime(2013, 10, 27, 3, 30),
+    ]
+
+    results, mask = tz.localize_many(values)
+
+    assert [dt.isoformat() for dt in results] == [
+        "2013-03-31T01:30:00+01:00",
+        "2013-03-31T03:30:15.000123+02:00",
+        "2013-10-27T02:30:00+01:00",
+        "2013-10-27T03:30:00+01:00",
+    ]
+    assert mask == [False, True, True, False]
+    assert results[1] == tz.convert(values[1].replace(fold=1))
+    assert results[2] == tz.convert(values[2].replace(fold=1))
+
+
+def test_localize_many_pre_transition():
+    tz = timezone("Europe/Paris")
+    values = [datetime(2013, 3, 31, 2, 30), datetime(2013, 10, 27, 2, 30)]
+
+    results, mask = tz.localize_many(
+        values, nonexistent=PRE_TRANSITION, ambiguous=PRE_TRANSITION
+    )
+
+    assert [dt.isoformat() for dt in results] == [
+        "2013-03-31T01:30:00+01:00",
+        "2013-10-27T02:30:00+02:00",
+    ]
+    assert results[0] == tz.convert(values[0].replace(fold=0))
+    assert results[1] == tz.convert(values[1].replace(fold=0))
+    assert mask == [True, True]
+
+
+def test_localize_many_shift_forward():
+    tz = timezone("America/New_York")
+
+    results, mask = tz.localize_many(
+        [datetime(2013, 3, 10, 2, 30, 59, 999999)], nonexistent=SHIFT_FORWARD
+    )
+
+    assert results[0].isoformat() == "2013-03-10T03:00:00-04:00"
+    assert mask == [True]
+
+
+def test_localize_many_errors_and_missing_values():
+    tz = timezone("Europe/Paris")
+    values = [
+        datetime(2013, 3, 31, 2, 30),
+        datetime(2013, 10, 27, 2, 30),
+        datetime(2013, 6, 1),
+    ]
+
+    results, mask = tz.localize_many(
+        values, nonexistent=TRANSITION_ERROR, ambiguous=TRANSITION_ERROR
+    )
+
+    assert isinstance(results[0], NonExistingTime)
+    assert isinstance(results[1], AmbiguousTime)
+    assert results[2].isoformat() == "2013-06-01T00:00:00+02:00"
+    assert mask == [True, True, False]
+
+    results, mask = tz.localize_many(values, nonexistent=None, ambiguous=None)
+
+    assert results[:2] == [None, None]
+    assert mask == [True, True, False]
+
+
+def test_localize_many_invalid_arguments():
+    tz = timezone("Europe/Paris")
+
+    with pytest.raises(ValueError):
+        tz.localize_many([datetime(2013, 1, 1)], ambiguous=SHIFT_FORWARD)
+
+    with pytest.raises(ValueError):
+        tz.localize_many([pendulum.datetime(2013, 1, 1)])
+
+
+def test_transition_table_lookups_from_threads():
+    with _open_tzfile("Europe/Paris") as f:
+        table = read_tzif(f)
+
+    with _open_tzfile("Europe/Paris") as f:
+        expected = read_tzif(f)
+
+    # Years past the TZif data, whose transitions are generated on demand
+    epoch = datetime(1970, 1, 1)
+    locals_ = [
+        int((datetime(year, 7, 1) - epoch).total_seconds())
+        for year in range(2040, 2640)
+    ]
+
+    with ThreadPoolExecutor(8) as executor:
+        periods = list(executor.map(table.local_period, locals_))
+
+    assert periods == [expected.local_period(local) for local in locals_]
+    # Threads may have generated transitions further ahead
+    count = len(expected.instants)
+    assert table.instants[:count] == expected.instants
+    assert table.types[:count] == expected.types
+    assert len(table.types) == len(table.instants)
@@ -14,3 +14,50 @@ def test_timezones():
 @pytest.mark.parametrize("zone", list(pendulum.timezones()))
 def test_timezones_are_loadable(zone):
     pendulum.timezone(zone)
+
+
+def test_zones_at_offset():
+    at = pendulum.datetime(2024, 7, 1)
+
+    zones = pendulum.tz.zones_at_offset(7200, at=at)
+
+    assert "Europe/Paris" in zones
+    assert "Africa/Johannesburg" in zones
+    assert "Europe/London" not in zones
+    assert "Europe/London" in pendulum.tz.zones_at_offset(3600, at=at)
+    assert "Europe/London" in pendulum.tz.zones_at_offset(
+        0, at=pendulum.datetime(2024, 1, 1)
+    )
+    assert pendulum.tz.zones_at_offset(12345, at=at) == ()
+
+
+def test_zones_at_offset_with_naive_datetime():
+    zones = pendulum.tz.zones_at_offset(19800, at=pendulum.naive(2024, 1, 1))
+
+    assert "Asia/Kolkata" in zones
+
+
+def test_offsets_at():
+    at = pendulum.datetime(2024, 1, 1)
+
+    offsets = pendulum.tz.offsets_at(at)
+
+    assert sum(len(zones) for zones in offsets.values()) == len(pendulum.timezones())
+    for offset, zones in offsets.items():
+        for zone in zones:
+            assert at.in_timezone(zone).utcoffset().total_seconds() == offset
+
+
+def test_offsets_at_returns_a_copy():
+    at = pendulum.datetime(2024, 1, 1)
+
+    pendulum.tz.offsets_at(at).clear()
+
+    assert pendulum.tz.offsets_at(at)
+    assert "Europe/Paris" in pendulum.tz.zones_at_offset(3600, at=at)
+
+
+def test_offsets_at_now():
+    offsets = pendulum.tz.offsets_at()
+
+    assert "UTC" in offsets[0]